@@ -0,0 +1,40 @@
+"""Compares `clean_urls` with calling `clean_url` in a loop
+
+    $ python -m benchmarks.clean_urls --count 100000
+"""
+
+import argparse
+import time
+
+from benchmarks.corpus import generate_urls
+from py_url_tools.urls import clean_url, clean_urls
+
+
+def run(function, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--count', type=int, default=50000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    urls = generate_urls(args.count)
+    assert list(clean_urls(urls)) == [clean_url(url) for url in urls]
+
+    loop = run(lambda: [clean_url(url) for url in urls], args.repeat)
+    batch = run(lambda: list(clean_urls(urls)), args.repeat)
+
+    print(f'clean_url loop {loop / args.count * 1e6:6.2f}us per url')
+    print(f'clean_urls     {batch / args.count * 1e6:6.2f}us per url ({loop / batch:.2f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""Builds reproducible corpora of urls looking like the ones of
+a crawl: a few thousand hosts, long query strings with tracking
+parameters, some non ASCII paths and hosts and some fragments"""
+
+import random
+
+HOSTS = (
+    'example.com', 'www.shop.example.com', 'blog.example.org', 'news.example.co.uk',
+    'bücher.example', 'münchen.example.de', 'api.example.io', 'cdn.example.net'
+)
+
+
+PATH_SEGMENTS = (
+    'products', 'category', 'blog', 'article', 'search', 'user', 'images',
+    'café', 'résumé', 'a b', 'index.html', '2024', 'page'
+)
+
+
+PARAMETERS = (
+    'id', 'page', 'sort', 'q', 'lang', 'ref', 'session', 'color', 'size',
+    'utm_source', 'utm_medium', 'utm_campaign', 'gclid', 'fbclid', 'mc_cid'
+)
+
+
+VALUES = ('1', '42', 'price', 'café', 'a b', 'x%20y', '', 'newsletter', 'abc123')
+
+
+def generate_url(generator, parameters=None):
+    host = generator.choice(HOSTS)
+    if generator.random() < 0.5:
+        host = f'site{generator.randint(0, 2000)}.{host}'
+
+    path = '/'.join(
+        generator.choice(PATH_SEGMENTS)
+        for _ in range(generator.randint(0, 4))
+    )
+
+    if parameters is None:
+        parameters = generator.randint(0, 6)
+    query = '&'.join(
+        f'{generator.choice(PARAMETERS)}={generator.choice(VALUES)}'
+        for _ in range(parameters)
+    )
+
+    scheme = 'https' if generator.random() < 0.8 else 'http'
+    url = f'{scheme}://{host}/{path}'
+    if query:
+        url = f'{url}?{query}'
+    if generator.random() < 0.1:
+        url = f'{url}#section-{generator.randint(0, 9)}'
+    return url
+
+
+def generate_urls(count, seed=0, parameters=None):
+    generator = random.Random(seed)
+    return [generate_url(generator, parameters=parameters) for _ in range(count)]
+
+
+def ascii_urls(count, seed=0, parameters=None):
+    """Only keeps the urls that are pure ASCII, which
+    is the case of the vast majority of a real crawl"""
+    result = []
+    generator = random.Random(seed)
+    while len(result) < count:
+        url = generate_url(generator, parameters=parameters)
+        if url.isascii():
+            result.append(url)
+    return result
@@ -0,0 +1,82 @@
+"""Compares the memory held by URL and FrozenURL objects
+once their components have been accessed with the one of the
+previous URL, which kept the raw url and its ParseResult
+
+    $ python -m benchmarks.frozen_url_memory --count 1000000
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from urllib.parse import urlparse
+
+from py_url_tools.urls import URL, FrozenURL
+
+
+class PreviousURL:
+    """The layout of URL before it sliced its components
+    from the raw url: an instance dictionary holding the
+    raw url and the result of urlparse"""
+
+    def __init__(self, url_string):
+        self.raw_url = url_string
+        self.url_object = urlparse(self.raw_url)
+
+    @property
+    def netloc(self):
+        return self.url_object.netloc
+
+    @property
+    def path(self):
+        return self.url_object.path
+
+    @property
+    def is_secured(self):
+        return self.url_object.scheme == 'https'
+
+
+def generate_urls(count):
+    for i in range(count):
+        yield f'https://shop{i % 500}.example.com/products/{i}?page={i % 20}&sort=price#reviews'
+
+
+def measure(klass, raw_urls):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    items = []
+    for url in raw_urls:
+        instance = klass(url)
+        # Touch the components so that
+        # the lazy state is built
+        instance.netloc
+        instance.path
+        instance.is_secured
+        items.append(instance)
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return items, size, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--count', type=int, default=200000)
+    args = parser.parse_args()
+
+    # The raw strings are shared by both
+    # and are not part of the measure
+    raw_urls = list(generate_urls(args.count))
+
+    for klass in (PreviousURL, URL, FrozenURL):
+        items, size, elapsed = measure(klass, raw_urls)
+        print(
+            f'{klass.__name__:<11} {size / args.count:7.1f} bytes per url '
+            f'{size / 2 ** 20:8.1f}MB total {elapsed:.2f}s'
+        )
+        del items
+
+
+if __name__ == '__main__':
+    main()
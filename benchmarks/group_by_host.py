@@ -0,0 +1,58 @@
+"""Compares `group_by_host` with grouping the urls through
+`URL.netloc` and `urlsplit` in a loop
+
+    $ python -m benchmarks.group_by_host --counts 1000000 10000000
+"""
+
+import argparse
+import time
+from urllib.parse import urlsplit
+
+from benchmarks.corpus import generate_urls
+from py_url_tools import hosts
+from py_url_tools.arrays import group_by_host
+
+
+def group_with_urlsplit(urls, registrable=False):
+    groups = {}
+    for index, url in enumerate(urls):
+        key = hosts.netloc_to_host(urlsplit(url).netloc)
+        if registrable:
+            key = hosts.registrable_domain(key)
+        groups.setdefault(key, []).append(index)
+    return groups
+
+
+def timed(function, *args, **kwargs):
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--counts', type=int, nargs='+', default=[1000000])
+    args = parser.parse_args()
+
+    # A smaller corpus is repeated, building
+    # millions of distinct urls takes longer
+    # than grouping them
+    sample = generate_urls(100000)
+
+    for count in args.counts:
+        urls = (sample * (count // len(sample) + 1))[:count]
+        for registrable in (False, True):
+            expected, reference = timed(group_with_urlsplit, urls, registrable=registrable)
+            result, elapsed = timed(group_by_host, urls, registrable=registrable)
+            assert result == expected
+
+            print(
+                f'{count:>9} urls registrable={registrable!s:<5} '
+                f'urlsplit {reference:6.2f}s group_by_host {elapsed:6.2f}s '
+                f'({reference / elapsed:.2f}x, {len(result)} groups)'
+            )
+            del expected, result
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+"""Measures the time taken to import the modules of the
+package in a fresh interpreter, using -X importtime
+
+    $ python -m benchmarks.import_time
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+MODULES = ('py_url_tools', 'py_url_tools.urls', 'py_url_tools.utilities')
+
+
+def import_time(module):
+    """Returns the cumulative import time of
+    the module in microseconds"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    for line in reversed(result.stderr.splitlines()):
+        # import time: self [us] | cumulative | imported package
+        parts = [item.strip() for item in line.split('|')]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1])
+    raise ValueError(f'No import time found for {module}')
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    for module in MODULES:
+        times = [import_time(module) for _ in range(args.repeat)]
+        print(
+            f'{module:<26} median {statistics.median(times) / 1000:.1f}ms '
+            f'min {min(times) / 1000:.1f}ms'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""Compares `parse_qsl_to_bytes` and `iter_qsl_bytes` with the
+previous implementation on long query strings
+
+    $ python -m benchmarks.parse_qsl_bytes --pairs 200 1000
+"""
+
+import argparse
+import timeit
+from urllib.parse import _coerce_args, unquote_to_bytes
+
+from py_url_tools.utilities import iter_qsl_bytes, parse_qsl_to_bytes
+
+
+def baseline_parse_qsl_to_bytes(qs, keep_blank_values=False):
+    qs, coerced_result = _coerce_args(qs)
+    pairs = [s2 for s1 in qs.split('&') for s2 in s1.split(';')]
+
+    final_result = []
+    for pair in pairs:
+        if not pair:
+            continue
+
+        items = pair.split('=', 1)
+        if len(items) != 2:
+            if keep_blank_values:
+                items.append('')
+            else:
+                continue
+
+        if len(items[1]) or keep_blank_values:
+            name = coerced_result(unquote_to_bytes(items[0].replace('+', ' ')))
+            value = coerced_result(unquote_to_bytes(items[1].replace('+', ' ')))
+            final_result.append((name, value))
+    return final_result
+
+
+def build_query(pairs):
+    items = [f'param_{i}=value_{i}' for i in range(pairs)]
+    # A few pairs need to be unquoted
+    items[::10] = [f'q_{i}=caf%C3%A9+au+lait' for i in range(len(items[::10]))]
+    return '&'.join(items)
+
+
+def per_call(function, repeat):
+    timer = timeit.Timer(function)
+    number = 200
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--pairs', type=int, nargs='+', default=[50, 200, 1000])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    for pairs in args.pairs:
+        query = build_query(pairs)
+        assert parse_qsl_to_bytes(query) == baseline_parse_qsl_to_bytes(query)
+
+        before = per_call(lambda: baseline_parse_qsl_to_bytes(query), args.repeat)
+        after = per_call(lambda: parse_qsl_to_bytes(query), args.repeat)
+        first = per_call(lambda: next(iter_qsl_bytes(query)), args.repeat)
+        print(
+            f'{pairs:>5} pairs ({len(query)} characters) '
+            f'previous {before:8.2f}us parse_qsl_to_bytes {after:8.2f}us '
+            f'({before / after:.2f}x) first pair {first:6.2f}us'
+        )
+
+
+if __name__ == '__main__':
+    main()
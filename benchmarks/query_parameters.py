@@ -0,0 +1,118 @@
+"""Compares `clean_url_query_parameters` and `add_or_replace_parameter`
+with their previous implementations, which created one dataclass
+object per query pair, on urls with many parameters
+
+    $ python -m benchmarks.query_parameters --parameters 50
+"""
+
+import argparse
+import dataclasses
+import timeit
+from urllib.parse import parse_qsl, urldefrag, urlencode, urlsplit, urlunsplit
+
+from benchmarks.corpus import ascii_urls
+from py_url_tools.query import ParameterFilter
+from py_url_tools.urls import add_or_replace_parameter, clean_url_query_parameters
+
+KEPT_NAMES = ['id', 'page', 'sort', 'q', 'lang', 'color', 'size']
+
+
+@dataclasses.dataclass
+class BaselineURLParameter:
+    key: str
+    value: str
+
+    def join(self):
+        return f'{self.key}={self.value}'
+
+    def deconstruct(self):
+        return (self.key, self.value)
+
+
+def baseline_clean_url_query_parameters(url, names=[], separator='&', key_value_separator='=', unique=True):
+    url, fragment = urldefrag(url)
+    base, _, query = url.partition('?')
+
+    parameter_objects = []
+    for token in query.split(separator):
+        if not token:
+            continue
+        key, value = token.split(key_value_separator)
+        parameter_objects.append(BaselineURLParameter(key, value))
+
+    seen_keys = set()
+    result_list = []
+    for item in parameter_objects:
+        if unique and item.key in seen_keys:
+            continue
+        if names and item.key not in names:
+            continue
+        result_list.append(item)
+        seen_keys.add(item.key)
+
+    joined_params = separator.join(item.join() for item in result_list)
+    return f'{base}?{joined_params}'
+
+
+def baseline_add_or_replace_parameter(url, params={}):
+    url_object = urlsplit(url)
+    new_params = []
+    seen_keys = set()
+    for name, value in parse_qsl(url_object.query, keep_blank_values=True):
+        if name in seen_keys:
+            continue
+        new_params.append(BaselineURLParameter(name, params.get(name, value)))
+        seen_keys.add(name)
+
+    for key, value in params.items():
+        if key not in seen_keys:
+            new_params.append(BaselineURLParameter(key, value))
+
+    query = urlencode([item.deconstruct() for item in new_params])
+    return urlunsplit(url_object._replace(query=query))
+
+
+def per_url(function, urls, repeat):
+    timer = timeit.Timer(lambda: [function(url) for url in urls])
+    return min(timer.repeat(repeat=repeat, number=1)) / len(urls) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--count', type=int, default=2000)
+    parser.add_argument('--parameters', type=int, default=50)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    urls = ascii_urls(args.count, parameters=args.parameters)
+    keep = ParameterFilter(names=KEPT_NAMES, allow=True)
+    replacements = {'page': '2', 'utm_source': 'crawler', 'new': '1'}
+
+    cases = [
+        (
+            'clean_url_query_parameters',
+            lambda url: baseline_clean_url_query_parameters(url, names=KEPT_NAMES),
+            lambda url: clean_url_query_parameters(url, names=KEPT_NAMES)
+        ),
+        (
+            'clean_url_query_parameters(filter)',
+            lambda url: baseline_clean_url_query_parameters(url, names=KEPT_NAMES),
+            lambda url: clean_url_query_parameters(url, names=keep)
+        ),
+        (
+            'add_or_replace_parameter',
+            lambda url: baseline_add_or_replace_parameter(url, replacements),
+            lambda url: add_or_replace_parameter(url, replacements)
+        )
+    ]
+
+    print(f'{args.count} urls with {args.parameters} parameters')
+    for name, baseline, function in cases:
+        assert [baseline(url) for url in urls] == [function(url) for url in urls]
+        before = per_url(baseline, urls, args.repeat)
+        after = per_url(function, urls, args.repeat)
+        print(f'{name:<36} {before:7.2f}us -> {after:7.2f}us ({before / after:.2f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""Compares the `Quoter` of each safe set with `quote` on
+already safe components and on long query strings that
+need to be encoded
+
+    $ python -m benchmarks.quoting --length 4000
+"""
+
+import argparse
+import timeit
+from urllib.parse import quote
+
+from py_url_tools import quoting
+
+
+def per_call(function, repeat):
+    timer = timeit.Timer(function)
+    number = 200
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e6
+
+
+def build_values(length):
+    safe = ('param=value&' * (length // 12 + 1))[:length].encode()
+    unsafe = ('q=café au lait&ref=<a href="x">&' * (length // 31 + 1))[:length].encode()
+    return {'safe': safe, 'unsafe': unsafe}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--length', type=int, default=4000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    values = build_values(args.length)
+    for quoter in quoting.QUOTERS:
+        for kind, value in values.items():
+            assert quoter(value) == quote(value, quoter.safe)
+
+            before = per_call(lambda: quote(value, quoter.safe), args.repeat)
+            after = per_call(lambda: quoter(value), args.repeat)
+            print(
+                f'{quoter.name:<10} {kind:<6} {len(value)} bytes '
+                f'quote {before:8.2f}us Quoter {after:8.2f}us ({before / after:.2f}x)'
+            )
+
+
+if __name__ == '__main__':
+    main()
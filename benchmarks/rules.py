@@ -0,0 +1,73 @@
+"""Times `RuleEngine.is_allowed` with a few thousand allow and
+deny rules against searching every rule with `re` for every url
+
+    $ python -m benchmarks.rules --count 2000 --rules 2000
+"""
+
+import argparse
+import re
+import timeit
+
+from benchmarks.corpus import HOSTS, ascii_urls
+from py_url_tools import hosts, parser
+from py_url_tools.rules import Rule, RuleEngine
+
+
+def build_rules(count):
+    rules = []
+    for i in range(count):
+        kind = i % 4
+        if kind == 0:
+            rules.append(Rule(rf'^https://site{i}\.example\.com/', allow=True))
+        elif kind == 1:
+            rules.append(Rule(rf'/section{i}/\d+', allow=False))
+        elif kind == 2:
+            host = HOSTS[i % len(HOSTS)]
+            rules.append(Rule(rf'/area{i}/', allow=bool(i % 3), host=host))
+        else:
+            rules.append(Rule(rf'/Page{i}\b', allow=False, flags=re.IGNORECASE))
+    return rules
+
+
+def naive_is_allowed(rules, url):
+    # The rules are (rule, compiled pattern) pairs
+    host = hosts.netloc_to_host(parser.get_netloc(url))
+    matched = [
+        rule for rule, pattern in rules
+        if rule.host in (None, host) and pattern.search(url) is not None
+    ]
+    if any(not rule.allow for rule in matched):
+        return False
+    if matched:
+        return True
+    return not any(rule.allow and rule.host in (None, host) for rule, _ in rules)
+
+
+def per_url(function, urls, repeat):
+    timer = timeit.Timer(lambda: [function(url) for url in urls])
+    return min(timer.repeat(repeat=repeat, number=1)) / len(urls) * 1e6
+
+
+def main():
+    argument_parser = argparse.ArgumentParser()
+    argument_parser.add_argument('--count', type=int, default=1000)
+    argument_parser.add_argument('--rules', type=int, default=2000)
+    argument_parser.add_argument('--repeat', type=int, default=3)
+    args = argument_parser.parse_args()
+
+    urls = ascii_urls(args.count)
+    rules = build_rules(args.rules)
+    engine = RuleEngine(rules)
+    compiled = [(rule, re.compile(rule.pattern, rule.flags)) for rule in rules]
+    assert [engine.is_allowed(url) for url in urls] == [naive_is_allowed(compiled, url) for url in urls]
+
+    indexed = per_url(engine.is_allowed, urls, args.repeat)
+    naive = per_url(lambda url: naive_is_allowed(compiled, url), urls, args.repeat)
+    print(
+        f'{len(rules)} rules: RuleEngine {indexed:8.2f}us per url '
+        f're.search loop {naive:8.2f}us per url ({naive / indexed:.1f}x)'
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""Times `TrackingStripper` on a tracking heavy corpus with the
+bundled rules and with many more rules, against testing every rule
+with fnmatch for every parameter
+
+    $ python -m benchmarks.tracking --count 20000 --extra-rules 800
+"""
+
+import argparse
+import fnmatch
+import timeit
+
+from benchmarks.corpus import ascii_urls
+from py_url_tools import tracking
+
+
+def naive_strip(url, rules):
+    base, question_mark, rest = url.partition('?')
+    if not question_mark:
+        return url
+
+    query, hash_mark, fragment = rest.partition('#')
+    kept = [
+        token for token in query.split('&')
+        if token and not any(
+            fnmatch.fnmatchcase(token.partition('=')[0], rule)
+            for rule in rules
+        )
+    ]
+    if kept:
+        base = f"{base}?{'&'.join(kept)}"
+    if hash_mark:
+        base = f'{base}#{fragment}'
+    return base
+
+
+def per_url(function, urls, repeat):
+    timer = timeit.Timer(lambda: [function(url) for url in urls])
+    return min(timer.repeat(repeat=repeat, number=1)) / len(urls) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--count', type=int, default=5000)
+    parser.add_argument('--extra-rules', type=int, default=800)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    # Urls without host rules so that
+    # the naive version is comparable
+    urls = ascii_urls(args.count, parameters=12)
+    extra = [f'vendor{i}_*' if i % 2 else f'vendor_param_{i}' for i in range(args.extra_rules)]
+
+    for names in ([], extra):
+        stripper = tracking.TrackingStripper(names=names, host_rules={})
+        rules = stripper.rules
+        assert [stripper(url) for url in urls] == [naive_strip(url, rules) for url in urls]
+
+        stripped = per_url(stripper, urls, args.repeat)
+        naive = per_url(lambda url: naive_strip(url, rules), urls, args.repeat)
+        print(
+            f'{len(rules):>5} rules TrackingStripper {stripped:7.2f}us '
+            f'fnmatch loop {naive:9.2f}us per url'
+        )
+
+
+if __name__ == '__main__':
+    main()
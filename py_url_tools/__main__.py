@@ -0,0 +1,181 @@
+"""Normalizes the urls of one or more files, one url per line
+
+    $ python -m py_url_tools urls.txt.gz --workers 8 -o clean.txt.gz
+    $ cat urls.txt | python -m py_url_tools --function safe_url_string
+"""
+
+import argparse
+import gzip
+import sys
+import time
+
+from py_url_tools import parallel, urls
+
+FUNCTIONS = {
+    'clean_url': urls.clean_url,
+    'safe_url_string': urls.safe_url_string
+}
+
+
+def open_zstd(path, mode, errors='surrogateescape'):
+    try:
+        # Python 3.14+
+        from compression import zstd
+    except ImportError:
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError(
+                'Reading or writing .zst files requires Python 3.14 '
+                'or the zstandard package'
+            )
+        return zstandard.open(path, mode=mode, encoding='utf-8', errors=errors)
+    return zstd.open(path, mode=mode, encoding='utf-8', errors=errors)
+
+
+def open_file(path, mode='rt', errors='surrogateescape'):
+    """Opens a plain, gzip or zstd file in text
+    mode. A dash stands for stdin or stdout"""
+    if path == '-':
+        stream = sys.stdin if 'r' in mode else sys.stdout
+        return open(
+            stream.fileno(),
+            mode=mode,
+            encoding='utf-8',
+            errors=errors,
+            closefd=False
+        )
+
+    if path.endswith('.gz'):
+        return gzip.open(path, mode=mode, encoding='utf-8', errors=errors)
+    if path.endswith('.zst'):
+        return open_zstd(path, mode, errors=errors)
+    return open(path, mode=mode, encoding='utf-8', errors=errors)
+
+
+def read_lines(paths, stats):
+    """Yields the non empty lines of the files. The bytes
+    that are not valid UTF-8 are percent encoded, the url
+    functions would fail on the surrogates of surrogateescape"""
+    for path in paths:
+        with open_file(path, errors='percentcode') as f:
+            for line in f:
+                stats['lines'] += 1
+                line = line.strip()
+                if line:
+                    yield line
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m py_url_tools',
+        description='Normalizes the urls of one or more files, one url per line'
+    )
+    parser.add_argument(
+        'files',
+        nargs='*',
+        default=['-'],
+        help='Plain, .gz or .zst files, stdin when omitted or -'
+    )
+    parser.add_argument(
+        '-o',
+        '--output',
+        default='-',
+        help='Plain, .gz or .zst file, stdout by default'
+    )
+    parser.add_argument(
+        '-f',
+        '--function',
+        choices=list(FUNCTIONS),
+        default='clean_url'
+    )
+    parser.add_argument(
+        '-w',
+        '--workers',
+        type=int,
+        default=1,
+        help='Number of processes, 0 for one per cpu'
+    )
+    parser.add_argument('--chunk-size', type=int, default=1000)
+    parser.add_argument(
+        '--unordered',
+        action='store_true',
+        help='Write the urls as soon as their chunk is done'
+    )
+    parser.add_argument('--encoding', default='utf-8')
+    parser.add_argument(
+        '--keep-fragments',
+        action='store_true',
+        help='Only used by clean_url'
+    )
+    parser.add_argument(
+        '--drop-blank-values',
+        action='store_true',
+        help='Only used by clean_url'
+    )
+    parser.add_argument(
+        '--strict',
+        action='store_true',
+        help='Stop at the first invalid url instead of skipping it'
+    )
+    parser.add_argument(
+        '-q',
+        '--quiet',
+        action='store_true',
+        help='Do not print the statistics and the skipped urls on stderr'
+    )
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    options = {'encoding': args.encoding}
+    if args.function == 'clean_url':
+        options['keep_fragments'] = args.keep_fragments
+        options['keep_blank_values'] = not args.drop_blank_values
+
+    stats = {'lines': 0, 'urls': 0, 'errors': 0}
+    start = time.perf_counter()
+    results = parallel.canonicalize_many(
+        read_lines(args.files, stats),
+        function=FUNCTIONS[args.function],
+        workers=args.workers or None,
+        chunk_size=args.chunk_size,
+        ordered=not args.unordered,
+        skip_errors=not args.strict,
+        **options
+    )
+
+    try:
+        with open_file(args.output, mode='wt') as output:
+            for url in results:
+                if isinstance(url, parallel.FailedURL):
+                    stats['errors'] += 1
+                    if not args.quiet:
+                        print(
+                            f'{parser.prog}: skipped {url.url!r}: {url.error}',
+                            file=sys.stderr
+                        )
+                    continue
+
+                output.write(url)
+                output.write('\n')
+                stats['urls'] += 1
+    except (ImportError, OSError, ValueError) as e:
+        parser.exit(1, f'{parser.prog}: error: {e}\n')
+
+    if not args.quiet:
+        elapsed = time.perf_counter() - start
+        rate = stats['urls'] / elapsed if elapsed else 0
+        print(
+            f"{stats['urls']} urls from {stats['lines']} lines "
+            f"({stats['errors']} skipped) in {elapsed:.2f}s ({rate:.0f} urls/s)",
+            file=sys.stderr
+        )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,133 @@
+import itertools
+import random
+import threading
+import zlib
+
+from py_url_tools import PROJECT_PATH
+
+STRATEGIES = ('random', 'round_robin', 'sticky')
+
+
+GOLDEN_RATIO_CONJUGATE = 0.6180339887498949
+
+
+USER_AGENTS_PATH = PROJECT_PATH / 'data/user_agents.txt'
+
+
+def build_alias_table(weights):
+    """Builds the tables of the alias method which
+    picks a weighted item in constant time"""
+    count = len(weights)
+    total = sum(weights)
+    if total <= 0:
+        raise ValueError('The weights should add up to more than 0')
+
+    scaled = [weight * count / total for weight in weights]
+    probabilities = [1.0] * count
+    aliases = list(range(count))
+
+    small = [i for i, value in enumerate(scaled) if value < 1]
+    large = [i for i, value in enumerate(scaled) if value >= 1]
+    while small and large:
+        less = small.pop()
+        more = large.pop()
+        probabilities[less] = scaled[less]
+        aliases[less] = more
+        scaled[more] = scaled[more] + scaled[less] - 1
+        if scaled[more] < 1:
+            small.append(more)
+        else:
+            large.append(more)
+    return tuple(probabilities), tuple(aliases)
+
+
+class UserAgentPool:
+    """A set of user agents loaded once in memory from
+    which one can be picked in constant time, either at
+    random, in turns or always the same one for a given host
+
+    >>> pool = UserAgentPool.from_file(strategy='sticky')
+    ... pool.pick('example.com') == pool.pick('example.com')
+    ... True
+    """
+
+    def __init__(self, user_agents, weights=None, strategy='random', seed=None):
+        if strategy not in STRATEGIES:
+            raise ValueError(f'Strategy should be one of {STRATEGIES}')
+
+        self.user_agents = tuple(user_agents)
+        if not self.user_agents:
+            raise ValueError('The pool requires at least one user agent')
+
+        self.strategy = strategy
+        self.weights = None
+        self.probabilities = None
+        self.aliases = None
+        if weights is not None:
+            self.weights = tuple(weights)
+            if len(self.weights) != len(self.user_agents):
+                raise ValueError('There should be one weight per user agent')
+            self.probabilities, self.aliases = build_alias_table(self.weights)
+
+        self._random = random.Random(seed)
+        self._counter = itertools.count()
+
+    def __repr__(self):
+        return f'<UserAgentPool: {len(self.user_agents)} strategy={self.strategy}>'
+
+    def __len__(self):
+        return len(self.user_agents)
+
+    def __call__(self, host=None):
+        return self.pick(host)
+
+    @classmethod
+    def from_file(cls, path=USER_AGENTS_PATH, **kwargs):
+        with open(path, mode='r', encoding='utf-8') as f:
+            user_agents = [line.strip() for line in f]
+        return cls(filter(None, user_agents), **kwargs)
+
+    def select(self, value):
+        """Returns the user agent for a number
+        in [0, 1) taking the weights into account"""
+        count = len(self.user_agents)
+        position = value * count
+        index = min(int(position), count - 1)
+        if self.probabilities is not None:
+            if position - index >= self.probabilities[index]:
+                index = self.aliases[index]
+        return self.user_agents[index]
+
+    def pick(self, host=None):
+        if self.strategy == 'round_robin':
+            turn = next(self._counter)
+            if self.weights is None:
+                return self.user_agents[turn % len(self.user_agents)]
+            # Stepping by the golden ratio spreads the turns
+            # evenly so each agent comes up as often as its weight
+            return self.select((turn * GOLDEN_RATIO_CONJUGATE) % 1.0)
+
+        if self.strategy == 'sticky' and host is not None:
+            checksum = zlib.crc32(host.encode('utf-8'))
+            return self.select(checksum / 0x100000000)
+        return self.select(self._random.random())
+
+
+_default_pool = None
+_default_lock = threading.Lock()
+
+
+def get_user_agent_pool():
+    """Returns the pool loaded from the user
+    agents shipped with the package"""
+    global _default_pool
+
+    if _default_pool is None:
+        with _default_lock:
+            if _default_pool is None:
+                _default_pool = UserAgentPool.from_file()
+    return _default_pool
+
+
+def random_user_agent(host=None):
+    return get_user_agent_pool().pick(host)
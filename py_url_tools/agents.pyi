@@ -0,0 +1,54 @@
+import itertools
+import pathlib
+import random
+from typing import Iterable, Optional, Sequence, Tuple
+
+STRATEGIES: Tuple[str, ...] = ...
+
+
+GOLDEN_RATIO_CONJUGATE: float = ...
+
+
+USER_AGENTS_PATH: pathlib.Path = ...
+
+
+def build_alias_table(
+    weights: Sequence[float]
+) -> Tuple[Tuple[float, ...], Tuple[int, ...]]: ...
+
+
+class UserAgentPool:
+    user_agents: Tuple[str, ...] = ...
+    strategy: str = ...
+    weights: Optional[Tuple[float, ...]] = ...
+    probabilities: Optional[Tuple[float, ...]] = ...
+    aliases: Optional[Tuple[int, ...]] = ...
+    _random: random.Random = ...
+    _counter: itertools.count = ...
+
+    def __init__(
+        self,
+        user_agents: Iterable[str],
+        weights: Iterable[float] = ...,
+        strategy: str = ...,
+        seed: int = ...
+    ) -> None: ...
+
+    def __len__(self) -> int: ...
+    def __call__(self, host: str = ...) -> str: ...
+
+    @classmethod
+    def from_file(
+        cls,
+        path: pathlib.Path = ...,
+        **kwargs
+    ) -> UserAgentPool: ...
+
+    def select(self, value: float) -> str: ...
+    def pick(self, host: str = ...) -> str: ...
+
+
+def get_user_agent_pool() -> UserAgentPool: ...
+
+
+def random_user_agent(host: str = ...) -> str: ...
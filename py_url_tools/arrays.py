@@ -0,0 +1,270 @@
+import re
+from array import array
+from bisect import bisect_right
+
+from py_url_tools import hosts, parser
+
+
+def host_key_factory(registrable=False):
+    """Returns a function that converts a netloc to the key
+    used to group the urls. Netlocs repeat a lot so the
+    keys are only computed once for each of them"""
+    keys = {}
+
+    def get_key(netloc):
+        try:
+            return keys[netloc]
+        except KeyError:
+            key = hosts.netloc_to_host(netloc)
+            if registrable:
+                key = hosts.registrable_domain(key)
+            keys[netloc] = key
+            return key
+    return get_key
+
+
+def group_by_host(urls, registrable=False):
+    """Groups the urls by host in a single pass and returns
+    the indices of the urls for each host. When `registrable`
+    is true, the subdomains are grouped together
+
+    >>> group_by_host(['http://a.example.com/', 'http://b.example.com/'], registrable=True)
+    ... {'example.com': [0, 1]}
+    """
+    get_key = host_key_factory(registrable=registrable)
+    netloc_offsets = parser.netloc_offsets
+    strip_url = parser.strip_url
+
+    groups = {}
+    for index, url in enumerate(urls):
+        url = strip_url(url)
+        start, end = netloc_offsets(url)
+        key = get_key(url[start:end])
+        try:
+            groups[key].append(index)
+        except KeyError:
+            groups[key] = [index]
+    return groups
+
+
+class URLArray:
+    """Columnar storage for a large amount of urls. The urls are
+    concatenated in a few large blocks of text and the positions of
+    their components are kept in packed arrays so that filters run
+    over integers and text ranges instead of creating an object for
+    every url. The urls appended since the last query are joined in a
+    new block which is merged with the previous ones while they are
+    not much larger, so mixing appends and queries copies each url a
+    logarithmic number of times instead of rebuilding a single buffer
+
+    >>> instance = URLArray(['http://example.com/a', 'http://other.com/b#c'])
+    ... instance.same_host('example.com')
+    ... [0]
+    ... instance.has_fragment()
+    ... [1]
+    """
+
+    def __init__(self, urls=()):
+        self.chunks = []
+        self.length = 0
+
+        # Each block is (text, offset of its
+        # first character, first index, end index)
+        self.blocks = []
+        self.block_firsts = []
+
+        self.starts = array('q')
+        self.ends = array('q')
+        self.scheme_ends = array('q')
+        self.netloc_starts = array('q')
+        self.netloc_ends = array('q')
+        self.params_starts = array('q')
+        self.path_ends = array('q')
+        self.query_ends = array('q')
+
+        self.extend(urls)
+
+    def __repr__(self):
+        return f'<URLArray: {len(self)}>'
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __iter__(self):
+        for text, offset, first, end in self.segments():
+            for start, url_end in zip(self.starts[first:end], self.ends[first:end]):
+                yield text[start - offset:url_end - offset]
+
+    def __getitem__(self, index):
+        return self.slice(index, self.starts, self.ends)
+
+    @property
+    def buffer(self):
+        """All the urls as a single string, the
+        blocks are merged in a single one"""
+        self.flush()
+        if len(self.blocks) > 1:
+            text = ''.join(block[0] for block in self.blocks)
+            self.blocks = [(text, 0, 0, len(self))]
+            self.block_firsts = [0]
+        return self.blocks[0][0] if self.blocks else ''
+
+    def flush(self):
+        """Joins the urls appended since the last query in a
+        block and merges the last blocks while the previous one
+        is not twice as large, the sizes of the blocks at least
+        halve from one to the next"""
+        if not self.chunks:
+            return
+
+        text = ''.join(self.chunks)
+        first = self.blocks[-1][3] if self.blocks else 0
+        block = (text, self.length - len(text), first, len(self))
+        self.chunks = []
+
+        blocks = self.blocks
+        while blocks and len(blocks[-1][0]) <= 2 * len(block[0]):
+            previous = blocks.pop()
+            self.block_firsts.pop()
+            block = (previous[0] + block[0], previous[1], previous[2], block[3])
+
+        blocks.append(block)
+        self.block_firsts.append(block[2])
+
+    def segments(self):
+        """Returns the blocks holding the urls"""
+        self.flush()
+        return self.blocks
+
+    def slice(self, index, starts, ends):
+        """Returns the range of the url at the index
+        given by the arrays of starts and ends"""
+        self.flush()
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('URLArray index out of range')
+
+        text, offset, _, _ = self.blocks[bisect_right(self.block_firsts, index) - 1]
+        return text[starts[index] - offset:ends[index] - offset]
+
+    def append(self, url):
+        url = parser.strip_url(url)
+        start = self.length
+        offsets = parser.url_offsets(url)
+        scheme_end, netloc_start, netloc_end, params_start, path_end, query_end = offsets
+
+        self.starts.append(start)
+        self.ends.append(start + len(url))
+        self.scheme_ends.append(start + scheme_end)
+        self.netloc_starts.append(start + netloc_start)
+        self.netloc_ends.append(start + netloc_end)
+        self.params_starts.append(start + params_start)
+        self.path_ends.append(start + path_end)
+        self.query_ends.append(start + query_end)
+
+        self.chunks.append(url)
+        self.length = start + len(url)
+
+    def extend(self, urls):
+        for url in urls:
+            self.append(url)
+
+    def netloc(self, index):
+        return self.slice(index, self.netloc_starts, self.netloc_ends)
+
+    def path(self, index):
+        return self.slice(index, self.netloc_ends, self.params_starts)
+
+    def select(self, indices):
+        """Returns the urls at the given indices"""
+        return [self.slice(index, self.starts, self.ends) for index in indices]
+
+    def same_host(self, host):
+        """Returns the indices of the urls whose host is the
+        given host, hosts are compared in the same way as in
+        `group_by_host`. Netlocs shorter than the host cannot
+        match and are not sliced from the blocks"""
+        host = hosts.netloc_to_host(host)
+        get_key = host_key_factory()
+        size = len(host)
+
+        result = []
+        for text, offset, first, end in self.segments():
+            for index, start, netloc_end in zip(
+                range(first, end),
+                self.netloc_starts[first:end],
+                self.netloc_ends[first:end]
+            ):
+                if netloc_end - start < size:
+                    continue
+
+                if get_key(text[start - offset:netloc_end - offset]) == host:
+                    result.append(index)
+        return result
+
+    def group_by_host(self, registrable=False):
+        """Same as `group_by_host` but reuses the positions
+        of the netlocs computed when the urls were added"""
+        get_key = host_key_factory(registrable=registrable)
+
+        groups = {}
+        for text, offset, first, end in self.segments():
+            for index, start, netloc_end in zip(
+                range(first, end),
+                self.netloc_starts[first:end],
+                self.netloc_ends[first:end]
+            ):
+                key = get_key(text[start - offset:netloc_end - offset])
+                try:
+                    groups[key].append(index)
+                except KeyError:
+                    groups[key] = [index]
+        return groups
+
+    def has_fragment(self):
+        """Returns the indices of the urls with a fragment"""
+        return [
+            index for index, (query_end, end)
+            in enumerate(zip(self.query_ends, self.ends))
+            if query_end < end
+        ]
+
+    def has_query(self):
+        """Returns the indices of the urls with a query"""
+        return [
+            index for index, (path_end, query_end)
+            in enumerate(zip(self.path_ends, self.query_ends))
+            if path_end < query_end
+        ]
+
+    def matches(self, regex, starts, ends):
+        """Returns the indices of the urls whose range given by
+        the arrays of starts and ends passes the test. The
+        pattern is compiled once for the whole array"""
+        search = re.compile(regex).search
+
+        result = []
+        for text, offset, first, end in self.segments():
+            for index, start, range_end in zip(
+                range(first, end),
+                starts[first:end],
+                ends[first:end]
+            ):
+                if search(text[start - offset:range_end - offset]) is not None:
+                    result.append(index)
+        return result
+
+    def path_matches(self, regex):
+        """Returns the indices of the urls whose path passes
+        the test
+
+        >>> instance.path_matches(r'^/a')
+        ... [0]
+        """
+        return self.matches(regex, self.netloc_ends, self.params_starts)
+
+    def url_matches(self, regex):
+        """Returns the indices of the urls that pass the
+        test. The whole url is used to perform the test"""
+        return self.matches(regex, self.starts, self.ends)
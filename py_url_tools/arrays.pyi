@@ -0,0 +1,46 @@
+from array import array
+from typing import Callable, Iterable, Iterator
+
+
+def host_key_factory(registrable: bool = False) -> Callable[[str], str]: ...
+
+
+def group_by_host(urls: Iterable[str], registrable: bool = False) -> dict[str, list[int]]: ...
+
+
+class URLArray:
+    chunks: list[str] = ...
+    length: int = ...
+    blocks: list[tuple[str, int, int, int]] = ...
+    block_firsts: list[int] = ...
+    starts: array = ...
+    ends: array = ...
+    scheme_ends: array = ...
+    netloc_starts: array = ...
+    netloc_ends: array = ...
+    params_starts: array = ...
+    path_ends: array = ...
+    query_ends: array = ...
+
+    def __init__(self, urls: Iterable[str] = ...) -> None: ...
+    def __repr__(self) -> str: ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[str]: ...
+    def __getitem__(self, index: int) -> str: ...
+    @property
+    def buffer(self) -> str: ...
+    def flush(self) -> None: ...
+    def segments(self) -> list[tuple[str, int, int, int]]: ...
+    def slice(self, index: int, starts: array, ends: array) -> str: ...
+    def append(self, url: str) -> None: ...
+    def extend(self, urls: Iterable[str]) -> None: ...
+    def netloc(self, index: int) -> str: ...
+    def path(self, index: int) -> str: ...
+    def select(self, indices: Iterable[int]) -> list[str]: ...
+    def same_host(self, host: str) -> list[int]: ...
+    def group_by_host(self, registrable: bool = False) -> dict[str, list[int]]: ...
+    def has_fragment(self) -> list[int]: ...
+    def has_query(self) -> list[int]: ...
+    def matches(self, regex: str, starts: array, ends: array) -> list[int]: ...
+    def path_matches(self, regex: str) -> list[int]: ...
+    def url_matches(self, regex: str) -> list[int]: ...
@@ -0,0 +1,146 @@
+import threading
+from collections import OrderedDict
+from functools import update_wrapper
+
+MISSING = object()
+
+
+KWARGS_MARKER = object()
+
+
+class LRUCache:
+    """A size bounded mapping that discards the least
+    recently used items once it is full and keeps count
+    of its hits, misses and evictions. The caches are shared
+    by the url functions, so every access holds a lock in order
+    for them to be used from several threads
+
+    >>> cache = LRUCache(maxsize=2)
+    ... cache.set('a', 1)
+    ... cache.get('a')
+    ... 1
+    """
+
+    def __init__(self, maxsize=10000):
+        if maxsize < 1:
+            raise ValueError('maxsize should be at least 1')
+
+        self.maxsize = maxsize
+        self.container = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    def __repr__(self):
+        return f'<LRUCache: {len(self.container)}/{self.maxsize}>'
+
+    def __contains__(self, key):
+        return key in self.container
+
+    def __len__(self):
+        return len(self.container)
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        if total == 0:
+            return 0.0
+        return self.hits / total
+
+    @property
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self.container),
+            'maxsize': self.maxsize
+        }
+
+    def get(self, key, default=None):
+        with self.lock:
+            value = self.container.get(key, MISSING)
+            if value is MISSING:
+                self.misses += 1
+                return default
+
+            self.hits += 1
+            self.container.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self.lock:
+            if key in self.container:
+                self.container.move_to_end(key)
+            elif len(self.container) >= self.maxsize:
+                self.container.popitem(last=False)
+                self.evictions += 1
+            self.container[key] = value
+
+    def resize(self, maxsize):
+        """Changes the amount of items kept by the cache
+        and discards the least recently used ones if needed"""
+        if maxsize < 1:
+            raise ValueError('maxsize should be at least 1')
+
+        with self.lock:
+            self.maxsize = maxsize
+            while len(self.container) > maxsize:
+                self.container.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self.lock:
+            self.container.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+
+class CachedFunction:
+    """Puts a size bounded cache in front of a function
+    whose result only depends on its arguments. The arguments
+    need to be hashable
+
+    >>> cached_safe_url_string = CachedFunction(safe_url_string)
+    ... cached_safe_url_string('http://example.com/a b')
+    ... cached_safe_url_string.cache.stats
+    ... {'hits': 0, 'misses': 1, 'evictions': 0, 'size': 1, 'maxsize': 10000}
+    """
+
+    def __init__(self, func, maxsize=10000):
+        self.func = func
+        self.cache = LRUCache(maxsize=maxsize)
+        update_wrapper(self, func)
+
+    def __repr__(self):
+        return f'<CachedFunction: {self.func.__name__}>'
+
+    def __call__(self, *args, **kwargs):
+        # Keyword arguments come after a marker so that they
+        # cannot be mistaken for positional ones, as functools does
+        key = args
+        if kwargs:
+            key = args + (KWARGS_MARKER,) + tuple(sorted(kwargs.items()))
+
+        result = self.cache.get(key, MISSING)
+        if result is MISSING:
+            result = self.func(*args, **kwargs)
+            self.cache.set(key, result)
+        return result
+
+    def cache_clear(self):
+        self.cache.clear()
+
+
+def memoize(maxsize=10000):
+    """Decorator version of `CachedFunction`
+
+    >>> @memoize(maxsize=100)
+    ... def normalize(url):
+    ...     return url.lower()
+    """
+    def decorator(func):
+        return CachedFunction(func, maxsize=maxsize)
+    return decorator
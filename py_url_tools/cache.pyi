@@ -0,0 +1,42 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+MISSING: object = ...
+KWARGS_MARKER: object = ...
+
+
+class LRUCache:
+    maxsize: int = ...
+    container: OrderedDict = ...
+    hits: int = ...
+    misses: int = ...
+    evictions: int = ...
+    lock: threading.Lock = ...
+
+    def __init__(self, maxsize: int = 10000) -> None: ...
+    def __repr__(self) -> str: ...
+    def __contains__(self, key: Hashable) -> bool: ...
+    def __len__(self) -> int: ...
+    @property
+    def hit_rate(self) -> float: ...
+    @property
+    def stats(self) -> dict[str, int]: ...
+    def get(self, key: Hashable, default: Any = None) -> Any: ...
+    def set(self, key: Hashable, value: Any) -> None: ...
+    def resize(self, maxsize: int) -> None: ...
+    def clear(self) -> None: ...
+
+
+class CachedFunction:
+    func: Callable[..., Any] = ...
+    cache: LRUCache = ...
+
+    def __init__(self, func: Callable[..., Any], maxsize: int = 10000) -> None: ...
+    def __repr__(self) -> str: ...
+    def __call__(self, *args: Any, **kwargs: Any) -> Any: ...
+    def cache_clear(self) -> None: ...
+
+
+def memoize(maxsize: int = 10000) -> Callable[[Callable[..., Any]], CachedFunction]: ...
@@ -92,6 +92,15 @@ ASCII_TAB_OR_NEWLINE_TRANSLATION_TABLE = {
 }
 
 
+ASCII_TAB_OR_NEWLINE_BYTES = ASCII_TAB_OR_NEWLINE.encode('ascii')
+
+
+C0_CONTROL_OR_SPACE_BYTES = C0_CONTROL_OR_SPACE.encode('ascii')
+
+
+ASCII_CHARACTERS = ''.join(chr(x) for x in range(128))
+
+
 PARENT_DIRECTORIES = re.compile(r"/?(\.\./)+")
 
 
@@ -133,3 +142,9 @@ HTML5_WHITESPACE = " \t\n\r\x0c"
 
 
 REMOVECOMMENTS_REGEX = re.compile("<!--.*?(?:-->|$)", re.DOTALL)
+
+
+# Query pairs that parse_qsl and urlencode
+# give back unchanged, e.g. "page=2"
+
+UNCHANGED_QUERY_PAIR_REGEX = re.compile(r"[A-Za-z0-9_.~-]*(?:=[A-Za-z0-9_.~-]*)?")
@@ -70,6 +70,15 @@ ASCII_ALPHANUMERIC: str = ...
 ASCII_TAB_OR_NEWLINE_TRANSLATION_TABLE: dict = ...
 
 
+ASCII_TAB_OR_NEWLINE_BYTES: bytes = ...
+
+
+C0_CONTROL_OR_SPACE_BYTES: bytes = ...
+
+
+ASCII_CHARACTERS: str = ...
+
+
 PARENT_DIRECTORIES: Pattern = ...
 
 
@@ -95,3 +104,6 @@ HTML5_WHITESPACE: str = ...
 
 
 REMOVECOMMENTS_REGEX: Pattern = ...
+
+
+UNCHANGED_QUERY_PAIR_REGEX: Pattern = ...
@@ -0,0 +1,139 @@
+from py_url_tools import uts46
+from py_url_tools.cache import MISSING, LRUCache
+
+HOST_ENCODING_MODES = ('idna2003', 'uts46')
+
+SECOND_LEVEL_LABELS = frozenset({
+    'ac', 'co', 'com', 'edu', 'gov', 'ltd', 'me',
+    'mil', 'net', 'nic', 'or', 'org', 'plc', 'sch'
+})
+
+
+def netloc_to_host(netloc):
+    """Returns the lowercased host of a netloc without
+    the user information and the port
+
+    >>> netloc_to_host('user:pass@Example.com:8000')
+    ... "example.com"
+    """
+    host = netloc.rpartition('@')[2]
+    if host.startswith('['):
+        host = host[:host.find(']') + 1] or host
+    else:
+        host = host.partition(':')[0]
+    return host.lower()
+
+
+def is_ip_address(host):
+    if host.startswith('['):
+        return True
+    return host.replace('.', '').isdigit()
+
+
+def registrable_domain(host):
+    """Returns the part of the host that can be registered
+    by a person or an organization. The public suffix list is
+    not bundled so this relies on the usual layouts of top level
+    domains: "example.com" or "example.co.uk"
+
+    >>> registrable_domain('www.example.co.uk')
+    ... "example.co.uk"
+    """
+    if is_ip_address(host):
+        return host
+
+    labels = host.rstrip('.').split('.')
+    if len(labels) <= 2:
+        return host
+
+    if len(labels[-1]) == 2 and labels[-2] in SECOND_LEVEL_LABELS:
+        return '.'.join(labels[-3:])
+    return '.'.join(labels[-2:])
+
+
+class HostEncoder:
+    """Encodes hosts with the IDNA codec and keeps the results
+    in a size bounded cache. Hosts that cannot be encoded are
+    cached as well so that the codec does not fail on them over
+    and over. ASCII hosts are returned without using the codec
+    when it would return them unchanged. The "uts46" mode uses
+    `uts46.to_ascii` instead of the IDNA2003 codec, ASCII hosts
+    are only lowercased unless they have punycode labels
+
+    >>> encoder = HostEncoder()
+    ... encoder('bücher.example')
+    ... b'xn--bcher-kva.example'
+    ... encoder('a..b') is None
+    ... True
+    """
+
+    def __init__(self, maxsize=50000, mode='idna2003'):
+        if mode not in HOST_ENCODING_MODES:
+            raise ValueError(f'Mode should be one of {HOST_ENCODING_MODES}')
+
+        self.cache = LRUCache(maxsize=maxsize)
+        self.mode = mode
+        self.ascii_hits = 0
+
+    def __repr__(self):
+        return f'<HostEncoder: {self.mode} {self.cache}>'
+
+    def __call__(self, host):
+        if host.isascii():
+            if self.mode == 'uts46':
+                # UTS-46 lowercases ASCII hosts and only has to check
+                # the labels with the ACE prefix, which are punycode
+                host = host.lower()
+                if uts46.ACE_PREFIX not in host:
+                    self.ascii_hits += 1
+                    return host.encode('ascii')
+            elif len(host) < 64 and '..' not in host and not host.startswith('.'):
+                # The IDNA2003 codec only checks the
+                # length of the labels of ASCII hosts
+                self.ascii_hits += 1
+                return host.encode('ascii')
+
+        result = self.cache.get(host, MISSING)
+        if result is MISSING:
+            try:
+                result = self.encode(host)
+            except UnicodeError:
+                # IDNA encoding can fail for too long labels (>63 characters)
+                # or missing labels (e.g. http://.example.com)
+                result = None
+            self.cache.set(host, result)
+        return result
+
+    def encode(self, host):
+        if self.mode == 'uts46':
+            return uts46.to_ascii(host)
+        return host.encode('idna')
+
+    def set_mode(self, mode):
+        """Switches the encoding of the hosts, for
+        example `IDNA_ENCODER.set_mode('uts46')`"""
+        if mode not in HOST_ENCODING_MODES:
+            raise ValueError(f'Mode should be one of {HOST_ENCODING_MODES}')
+        self.mode = mode
+        self.clear()
+
+    @property
+    def hit_rate(self):
+        total = self.ascii_hits + self.cache.hits + self.cache.misses
+        if total == 0:
+            return 0.0
+        return (self.ascii_hits + self.cache.hits) / total
+
+    @property
+    def stats(self):
+        return {'ascii_hits': self.ascii_hits, **self.cache.stats}
+
+    def clear(self):
+        self.cache.clear()
+        self.ascii_hits = 0
+
+
+# Shared by the url functions, statistics are
+# available with `hosts.IDNA_ENCODER.stats`
+
+IDNA_ENCODER = HostEncoder()
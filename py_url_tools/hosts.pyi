@@ -0,0 +1,39 @@
+from typing import Optional
+
+from py_url_tools.cache import LRUCache
+
+HOST_ENCODING_MODES: tuple[str, ...] = ...
+
+SECOND_LEVEL_LABELS: frozenset[str] = ...
+
+
+def netloc_to_host(netloc: str) -> str: ...
+
+
+def is_ip_address(host: str) -> bool: ...
+
+
+def registrable_domain(host: str) -> str: ...
+
+
+
+class HostEncoder:
+    cache: LRUCache = ...
+    mode: str = ...
+    ascii_hits: int = ...
+
+    def __init__(self, maxsize: int = ..., mode: str = ...) -> None: ...
+    def __call__(self, host: str) -> Optional[bytes]: ...
+    def encode(self, host: str) -> bytes: ...
+    def set_mode(self, mode: str) -> None: ...
+
+    @property
+    def hit_rate(self) -> float: ...
+
+    @property
+    def stats(self) -> dict[str, int]: ...
+
+    def clear(self) -> None: ...
+
+
+IDNA_ENCODER: HostEncoder = ...
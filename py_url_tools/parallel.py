@@ -0,0 +1,136 @@
+import itertools
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from py_url_tools import urls
+
+
+def chunked(items, chunk_size):
+    """Splits an iterable in lists of at most `chunk_size`
+    items without consuming more than one chunk at a time
+
+    >>> list(chunked([1, 2, 3], 2))
+    ... [[1, 2], [3]]
+    """
+    iterator = iter(items)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class FailedURL:
+    """Takes the place of an url that could not be
+    canonicalized when the errors are skipped"""
+
+    __slots__ = ('url', 'error')
+
+    def __init__(self, url, error):
+        self.url = url
+        self.error = error
+
+    def __repr__(self):
+        return f'<FailedURL: {self.url!r} {self.error}>'
+
+
+def canonicalize_chunk(function, chunk, options, skip_errors=False):
+    """Canonicalizes a chunk of urls in the current process. This
+    is the unit of work sent to the workers of the pool. With
+    `skip_errors` an invalid url gives a `FailedURL` instead
+    of stopping the whole chunk"""
+    if function is urls.clean_url:
+        # The batch implementation gives the same
+        # results and shares its state over the chunk
+        try:
+            return list(urls.clean_urls(chunk, **options))
+        except ValueError:
+            if not skip_errors:
+                raise
+
+    results = []
+    for url in chunk:
+        try:
+            results.append(function(url, **options))
+        except ValueError as e:
+            if not skip_errors:
+                raise
+            results.append(FailedURL(url, str(e)))
+    return results
+
+
+def canonicalize_many(items, function=urls.clean_url, workers=None, chunk_size=1000,
+                      ordered=True, in_process_threshold=10000, skip_errors=False,
+                      **options):
+    """Canonicalizes a large amount of urls using a pool of
+    processes. The input is read lazily and only a bounded
+    number of chunks are in flight at any time. When the input is
+    smaller than `in_process_threshold` the urls are canonicalized
+    in the current process since starting the pool would cost
+    more than the work itself. The function has to be importable
+    from a module in order to be sent to the workers. With
+    `skip_errors` the invalid urls are yielded as `FailedURL`
+
+    >>> result = canonicalize_many(urls, function=safe_url_string, workers=4)
+    ... list(result)
+    ... ['http://example.com/a%20b', ...]
+    """
+    if chunk_size < 1:
+        raise ValueError('chunk_size should be at least 1')
+
+    workers = workers or os.cpu_count() or 1
+    iterator = iter(items)
+
+    if workers == 1:
+        for chunk in chunked(iterator, chunk_size):
+            yield from canonicalize_chunk(function, chunk, options, skip_errors)
+        return
+
+    head = list(itertools.islice(iterator, in_process_threshold))
+    if len(head) < in_process_threshold:
+        yield from canonicalize_chunk(function, head, options, skip_errors)
+        return
+
+    chunks = chunked(itertools.chain(head, iterator), chunk_size)
+    # Keep every worker busy while still making
+    # sure that the input is not read all at once
+    max_pending = workers * 2
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        if ordered:
+            pending = deque()
+            for chunk in chunks:
+                future = executor.submit(
+                    canonicalize_chunk,
+                    function,
+                    chunk,
+                    options,
+                    skip_errors
+                )
+                pending.append(future)
+                if len(pending) >= max_pending:
+                    yield from pending.popleft().result()
+
+            while pending:
+                yield from pending.popleft().result()
+        else:
+            pending = set()
+            for chunk in chunks:
+                future = executor.submit(
+                    canonicalize_chunk,
+                    function,
+                    chunk,
+                    options,
+                    skip_errors
+                )
+                pending.add(future)
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for item in done:
+                        yield from item.result()
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for item in done:
+                    yield from item.result()
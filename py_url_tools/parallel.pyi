@@ -0,0 +1,34 @@
+from typing import Any, Callable, Iterable, Iterator, TypeVar, Union
+
+_T = TypeVar('_T')
+
+
+def chunked(items: Iterable[_T], chunk_size: int) -> Iterator[list[_T]]: ...
+
+
+class FailedURL:
+    url: str = ...
+    error: str = ...
+
+    def __init__(self, url: str, error: str) -> None: ...
+    def __repr__(self) -> str: ...
+
+
+def canonicalize_chunk(
+    function: Callable[..., str],
+    chunk: list[str],
+    options: dict[str, Any],
+    skip_errors: bool = False
+) -> list[Union[str, FailedURL]]: ...
+
+
+def canonicalize_many(
+    items: Iterable[str],
+    function: Callable[..., str] = ...,
+    workers: int = None,
+    chunk_size: int = 1000,
+    ordered: bool = True,
+    in_process_threshold: int = 10000,
+    skip_errors: bool = False,
+    **options: Any
+) -> Iterator[Union[str, FailedURL]]: ...
@@ -0,0 +1,159 @@
+from urllib.parse import uses_params
+
+from py_url_tools import constants
+
+SCHEME_CHARACTERS = frozenset(
+    'abcdefghijklmnopqrstuvwxyz'
+    'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+    '0123456789'
+    '+-.'
+)
+
+
+SCHEMES_USING_PARAMS = frozenset(uses_params)
+
+
+def strip_url(url):
+    """Removes the leading C0 controls and spaces and the tabs
+    and newlines of the url as `urlsplit` does before splitting
+    it. The url is returned as is when there is nothing to
+    remove, which is the case of nearly every url
+
+    >>> strip_url(' http://example.com/a\\n/b')
+    ... 'http://example.com/a/b'
+    """
+    if not url:
+        return url
+
+    unchanged = (
+        url[0] > ' ' and
+        '\t' not in url and
+        '\n' not in url and
+        '\r' not in url
+    )
+    if unchanged:
+        return url
+
+    url = url.lstrip(constants.C0_CONTROL_OR_SPACE)
+    return url.translate(constants.ASCII_TAB_OR_NEWLINE_TRANSLATION_TABLE)
+
+
+def url_offsets(url):
+    """Tokenizes an url in a single pass and returns the offsets
+    of its components instead of the components themselves. Once
+    the url has gone through `strip_url`, the offsets split it in
+    the same way as `urlparse` does:
+
+        scheme = url[:scheme_end]
+        netloc = url[netloc_start:netloc_end]
+        path = url[netloc_end:params_start]
+        params = url[params_start + 1:path_end]
+        query = url[path_end + 1:query_end]
+        fragment = url[query_end + 1:]
+
+    >>> url_offsets('http://example.com/a?b=1#c')
+    ... (4, 7, 18, 20, 20, 24)
+    """
+    length = len(url)
+
+    scheme_end = 0
+    rest_start = 0
+    colon = url.find(':')
+    if colon > 0 and url[0].isascii() and url[0].isalpha():
+        if SCHEME_CHARACTERS.issuperset(url[:colon]):
+            scheme_end = colon
+            rest_start = colon + 1
+
+    netloc_start = netloc_end = rest_start
+    if url.startswith('//', rest_start):
+        netloc_start = rest_start + 2
+        netloc_end = length
+        for delimiter in '/?#':
+            position = url.find(delimiter, netloc_start, netloc_end)
+            if position >= 0:
+                netloc_end = position
+
+    query_end = url.find('#', netloc_end)
+    if query_end < 0:
+        query_end = length
+
+    path_end = url.find('?', netloc_end, query_end)
+    if path_end < 0:
+        path_end = query_end
+
+    # Like urlparse, the parameters are only taken from
+    # the last segment of the path for the schemes using them
+    params_start = -1
+    if url[:scheme_end].lower() in SCHEMES_USING_PARAMS:
+        params_start = url.find(';', netloc_end, path_end)
+    if params_start >= 0:
+        last_segment = url.rfind('/', netloc_end, path_end)
+        if last_segment >= 0:
+            params_start = url.find(';', last_segment, path_end)
+    if params_start < 0:
+        params_start = path_end
+
+    return scheme_end, netloc_start, netloc_end, params_start, path_end, query_end
+
+
+def split_url(url, offsets=None):
+    """Returns the same six components as `urlparse` from
+    the offsets of the url
+
+    >>> split_url('http://example.com/a?b=1#c')
+    ... ('http', 'example.com', '/a', '', 'b=1', 'c')
+    """
+    if offsets is None:
+        url = strip_url(url)
+        offsets = url_offsets(url)
+    scheme_end, netloc_start, netloc_end, params_start, path_end, query_end = offsets
+    return (
+        url[:scheme_end].lower(),
+        url[netloc_start:netloc_end],
+        url[netloc_end:params_start],
+        url[params_start + 1:path_end],
+        url[path_end + 1:query_end],
+        url[query_end + 1:]
+    )
+
+
+def netloc_offsets(url):
+    """Returns the start and the end of the netloc of the
+    url without looking at the rest of its components. As for
+    `url_offsets`, the url should have gone through `strip_url`
+
+    >>> netloc_offsets('http://example.com/a?b=1#c')
+    ... (7, 18)
+    """
+    start = 0
+    colon = url.find(':')
+    if colon > 0 and url[0].isascii() and url[0].isalpha():
+        if SCHEME_CHARACTERS.issuperset(url[:colon]):
+            start = colon + 1
+
+    if not url.startswith('//', start):
+        return start, start
+
+    start += 2
+    end = len(url)
+    for delimiter in '/?#':
+        position = url.find(delimiter, start, end)
+        if position >= 0:
+            end = position
+    return start, end
+
+
+def get_netloc(url):
+    """Returns the netloc of the url without splitting
+    the rest of its components"""
+    url = strip_url(url)
+    start, end = netloc_offsets(url)
+    return url[start:end]
+
+
+def get_path(url):
+    """Returns the path of the url without splitting
+    the rest of its components"""
+    url = strip_url(url)
+    offsets = url_offsets(url)
+    return url[offsets[2]:offsets[3]]
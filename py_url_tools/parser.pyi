@@ -0,0 +1,25 @@
+SCHEME_CHARACTERS: frozenset[str] = ...
+
+
+SCHEMES_USING_PARAMS: frozenset[str] = ...
+
+
+def strip_url(url: str) -> str: ...
+
+
+def url_offsets(url: str) -> tuple[int, int, int, int, int, int]: ...
+
+
+def split_url(
+    url: str,
+    offsets: tuple[int, int, int, int, int, int] = None
+) -> tuple[str, str, str, str, str, str]: ...
+
+
+def netloc_offsets(url: str) -> tuple[int, int]: ...
+
+
+def get_netloc(url: str) -> str: ...
+
+
+def get_path(url: str) -> str: ...
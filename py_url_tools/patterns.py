@@ -0,0 +1,269 @@
+import re
+
+try:
+    import re._parser as sre_parse
+except ImportError:
+    import sre_parse
+
+from py_url_tools.cache import LRUCache
+
+BACKREFERENCE_REGEX = re.compile(r'\\[1-9]|\(\?P=')
+
+
+LITERAL = sre_parse.LITERAL
+
+
+class PatternRegistry:
+    """Keeps compiled regular expressions so that crawl rules
+    are not compiled again on every test. Unlike the cache of
+    the `re` module, its size can be set to hold every rule
+
+    >>> registry = PatternRegistry(maxsize=2000)
+    ... registry.compile(r'/products/\\d+')
+    ... re.compile('/products/\\\\d+')
+    """
+
+    def __init__(self, maxsize=1024):
+        self.cache = LRUCache(maxsize=maxsize)
+
+    def __repr__(self):
+        return f'<PatternRegistry: {len(self.cache)}/{self.cache.maxsize}>'
+
+    def __len__(self):
+        return len(self.cache)
+
+    def compile(self, regex, flags=0):
+        if isinstance(regex, re.Pattern):
+            return regex
+
+        key = (regex, flags)
+        pattern = self.cache.get(key)
+        if pattern is None:
+            pattern = re.compile(regex, flags)
+            self.cache.set(key, pattern)
+        return pattern
+
+    def resize(self, maxsize):
+        """Changes the amount of patterns kept by the registry
+        and discards the least recently used ones if needed"""
+        self.cache.resize(maxsize)
+
+    def clear(self):
+        self.cache.clear()
+
+
+registry = PatternRegistry()
+
+
+def compile_pattern(regex, flags=0):
+    return registry.compile(regex, flags=flags)
+
+
+def required_literal(pattern):
+    """Returns the longest piece of text that every match of the
+    pattern has to contain or None when none can be found, for
+    example "/products/" for r'/products/\\d+'. The literals are
+    read from the parsed pattern, which takes care of the escapes,
+    and only at its top level: alternations, groups, classes and
+    repeats end the literals and are not looked into"""
+    if not isinstance(pattern, re.Pattern):
+        pattern = compile_pattern(pattern)
+
+    if pattern.flags & re.IGNORECASE or isinstance(pattern.pattern, bytes):
+        return None
+
+    try:
+        items = sre_parse.parse(pattern.pattern, pattern.flags)
+    except re.error:
+        return None
+
+    literals = []
+    current = []
+    for opcode, value in items:
+        if opcode == LITERAL:
+            current.append(chr(value))
+            continue
+
+        if current:
+            literals.append(''.join(current))
+            current = []
+
+    if current:
+        literals.append(''.join(current))
+    if not literals:
+        return None
+    return max(literals, key=len)
+
+
+class LiteralIndex:
+    """Aho-Corasick automaton that finds which of many literals
+    appear in a text in a single pass over the text, whatever
+    the amount of literals
+
+    >>> index = LiteralIndex()
+    ... index.add('/blog/', 'blog')
+    ... index.build()
+    ... list(index.search('http://example.com/blog/1'))
+    ... ['blog']
+    """
+
+    def __init__(self):
+        self.transitions = [{}]
+        self.failures = [0]
+        self.outputs = [[]]
+
+    def __len__(self):
+        return len(self.transitions) - 1
+
+    def add(self, literal, value):
+        state = 0
+        for character in literal:
+            following = self.transitions[state].get(character)
+            if following is None:
+                following = len(self.transitions)
+                self.transitions[state][character] = following
+                self.transitions.append({})
+                self.failures.append(0)
+                self.outputs.append([])
+            state = following
+        self.outputs[state].append(value)
+
+    def build(self):
+        """Computes the failure links once every
+        literal has been added"""
+        transitions = self.transitions
+        failures = self.failures
+        outputs = self.outputs
+
+        queue = list(transitions[0].values())
+        for state in queue:
+            for character, following in transitions[state].items():
+                queue.append(following)
+
+                failure = failures[state]
+                while failure and character not in transitions[failure]:
+                    failure = failures[failure]
+                failure = transitions[failure].get(character, 0)
+                failures[following] = failure
+                outputs[following] = outputs[following] + outputs[failure]
+
+    def search(self, text):
+        transitions = self.transitions
+        failures = self.failures
+        outputs = self.outputs
+
+        state = 0
+        for character in text:
+            while state and character not in transitions[state]:
+                state = failures[state]
+            state = transitions[state].get(character, 0)
+            if outputs[state]:
+                yield from outputs[state]
+
+
+class PatternSet:
+    """Tests a value against many patterns at once. The literal
+    text that each pattern requires is searched in the value in
+    a single pass and only the patterns whose literal was found are
+    tested. The patterns without such a literal are combined in a
+    single alternation that rejects most values in one pass
+
+    >>> instance = PatternSet({'products': r'/products/', 'blog': r'/blog/'})
+    ... instance.search('http://example.com/blog/1')
+    ... "blog"
+    ... instance.matching('http://example.com/blog/products/')
+    ... ["products", "blog"]
+    """
+
+    def __init__(self, patterns, flags=0):
+        if isinstance(patterns, dict):
+            items = list(patterns.items())
+        else:
+            items = [(regex, regex) for regex in patterns]
+
+        self.names = [name for name, _ in items]
+        self.patterns = [compile_pattern(regex, flags) for _, regex in items]
+
+        self.literals = LiteralIndex()
+        self.unindexed = []
+        for index, pattern in enumerate(self.patterns):
+            literal = required_literal(pattern)
+            if literal is None:
+                self.unindexed.append(index)
+            else:
+                self.literals.add(literal, index)
+        self.literals.build()
+
+        self.combined = self.combine(
+            [self.patterns[index] for index in self.unindexed],
+            flags
+        )
+
+    def __repr__(self):
+        return f'<PatternSet: {len(self.patterns)}>'
+
+    def __len__(self):
+        return len(self.patterns)
+
+    @staticmethod
+    def combine(patterns, flags=0):
+        """Builds the alternation of the patterns. Groups are not
+        added around the alternatives since they would prevent the
+        `re` module from merging their common prefixes. Patterns using
+        backreferences would be numbered differently once combined
+        and some others, like patterns compiled with different
+        flags, cannot be combined at all"""
+        if len(patterns) < 2:
+            return None
+
+        default_flags = re.compile('', flags).flags
+        alternatives = []
+        for pattern in patterns:
+            if pattern.flags != default_flags:
+                return None
+
+            if BACKREFERENCE_REGEX.search(pattern.pattern):
+                return None
+            alternatives.append(f'(?:{pattern.pattern})')
+
+        try:
+            return re.compile('|'.join(alternatives), flags)
+        except re.error:
+            return None
+
+    def candidates(self, value):
+        """Returns the indices of the patterns that can match the
+        value, in the order in which the patterns were given"""
+        indices = set(self.literals.search(value))
+        if self.unindexed:
+            if self.combined is None or self.combined.search(value) is not None:
+                indices.update(self.unindexed)
+        return sorted(indices)
+
+    def test(self, value):
+        """Checks if any of the patterns matches the value"""
+        patterns = self.patterns
+        return any(
+            patterns[index].search(value) is not None
+            for index in self.candidates(value)
+        )
+
+    def search(self, value):
+        """Returns the name of the pattern matching the earliest
+        in the value or None when none of them matches"""
+        earliest = None
+        for index in self.candidates(value):
+            result = self.patterns[index].search(value)
+            if result is not None:
+                if earliest is None or result.start() < earliest[0]:
+                    earliest = (result.start(), index)
+        return None if earliest is None else self.names[earliest[1]]
+
+    def matching(self, value):
+        """Returns the names of all the patterns that match
+        the value"""
+        patterns = self.patterns
+        return [
+            self.names[index] for index in self.candidates(value)
+            if patterns[index].search(value) is not None
+        ]
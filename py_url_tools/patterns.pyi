@@ -0,0 +1,61 @@
+import re
+from typing import Any, Iterable, Iterator, Optional, Union
+
+from py_url_tools.cache import LRUCache
+
+
+BACKREFERENCE_REGEX: re.Pattern = ...
+
+
+class PatternRegistry:
+    cache: LRUCache = ...
+
+    def __init__(self, maxsize: int = 1024) -> None: ...
+    def __repr__(self) -> str: ...
+    def __len__(self) -> int: ...
+    def compile(self, regex: Union[str, re.Pattern], flags: int = 0) -> re.Pattern: ...
+    def resize(self, maxsize: int) -> None: ...
+    def clear(self) -> None: ...
+
+
+registry: PatternRegistry = ...
+
+
+def compile_pattern(regex: Union[str, re.Pattern], flags: int = 0) -> re.Pattern: ...
+
+
+def required_literal(pattern: Union[str, re.Pattern]) -> Optional[str]: ...
+
+
+class LiteralIndex:
+    transitions: list[dict[str, int]] = ...
+    failures: list[int] = ...
+    outputs: list[list[Any]] = ...
+
+    def __init__(self) -> None: ...
+    def __len__(self) -> int: ...
+    def add(self, literal: str, value: Any) -> None: ...
+    def build(self) -> None: ...
+    def search(self, text: str) -> Iterator[Any]: ...
+
+
+class PatternSet:
+    names: list[str] = ...
+    patterns: list[re.Pattern] = ...
+    literals: LiteralIndex = ...
+    unindexed: list[int] = ...
+    combined: Optional[re.Pattern] = ...
+
+    def __init__(
+        self,
+        patterns: Union[Iterable[Union[str, re.Pattern]], dict[str, Union[str, re.Pattern]]],
+        flags: int = 0
+    ) -> None: ...
+    def __repr__(self) -> str: ...
+    def __len__(self) -> int: ...
+    @staticmethod
+    def combine(patterns: list[re.Pattern], flags: int = 0) -> Optional[re.Pattern]: ...
+    def candidates(self, value: str) -> list[int]: ...
+    def test(self, value: str) -> bool: ...
+    def search(self, value: str) -> Optional[str]: ...
+    def matching(self, value: str) -> list[str]: ...
@@ -0,0 +1,234 @@
+import fnmatch
+import itertools
+import re
+from collections import OrderedDict
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+
+class QueryBuilder:
+    """Parses a query string once and lets its parameters be
+    added, replaced, removed and moved before serializing it once.
+    The parameters are held in an ordered multimap: each parameter
+    gets a position in an `OrderedDict` and each name knows the
+    positions of its values, which makes every edit O(1) per value
+
+    >>> builder = QueryBuilder.from_url('http://example.com/?a=1&b=2')
+    ... builder.replace('a', '3').remove('b').add('c', '4')
+    ... builder.to_url()
+    ... 'http://example.com/?a=3&c=4'
+    """
+
+    def __init__(self, query='', keep_blank_values=True):
+        self.url_object = None
+        self.parameters = OrderedDict()
+        self.positions = {}
+        self._counter = itertools.count()
+        for name, value in parse_qsl(query, keep_blank_values=keep_blank_values):
+            self.add(name, value)
+
+    def __repr__(self):
+        return f'<QueryBuilder: {self.to_string()}>'
+
+    def __str__(self):
+        return self.to_string()
+
+    def __len__(self):
+        return len(self.parameters)
+
+    def __contains__(self, name):
+        return name in self.positions
+
+    def __iter__(self):
+        return iter(self.parameters.values())
+
+    @classmethod
+    def from_url(cls, url, keep_blank_values=True):
+        url_object = urlsplit(str(url))
+        instance = cls(url_object.query, keep_blank_values=keep_blank_values)
+        instance.url_object = url_object
+        return instance
+
+    def names(self):
+        return list(self.positions)
+
+    def get(self, name, default=None):
+        positions = self.positions.get(name)
+        if not positions:
+            return default
+        return self.parameters[positions[0]][1]
+
+    def get_all(self, name):
+        positions = self.positions.get(name, [])
+        return [self.parameters[position][1] for position in positions]
+
+    def add(self, name, value):
+        """Adds a value at the end of the query
+        even if the name is already present"""
+        position = next(self._counter)
+        self.parameters[position] = (name, value)
+        self.positions.setdefault(name, []).append(position)
+        return self
+
+    def replace(self, name, value):
+        """Replaces the value of the first occurrence of
+        the name and removes the others. The parameter is
+        added at the end when it is not present"""
+        positions = self.positions.get(name)
+        if not positions:
+            return self.add(name, value)
+
+        first = positions[0]
+        for position in positions[1:]:
+            del self.parameters[position]
+        self.parameters[first] = (name, value)
+        self.positions[name] = [first]
+        return self
+
+    def remove(self, name):
+        for position in self.positions.pop(name, []):
+            del self.parameters[position]
+        return self
+
+    def move_to_end(self, name, last=True):
+        """Moves every value of the name to the end
+        or to the start of the query"""
+        positions = self.positions.get(name, [])
+        items = positions if last else reversed(positions)
+        for position in items:
+            self.parameters.move_to_end(position, last=last)
+        return self
+
+    def unique(self):
+        """Only keeps the first value of each name"""
+        for name, positions in self.positions.items():
+            for position in positions[1:]:
+                del self.parameters[position]
+            del positions[1:]
+        return self
+
+    def sort(self, key=None):
+        items = sorted(self.parameters.values(), key=key)
+        self.parameters.clear()
+        self.positions.clear()
+        for name, value in items:
+            self.add(name, value)
+        return self
+
+    def to_string(self):
+        return urlencode(list(self.parameters.values()))
+
+    def to_url(self, url=None):
+        """Returns the url with the new query. The url given
+        to `from_url` is used when none is provided"""
+        url_object = self.url_object if url is None else urlsplit(str(url))
+        if url_object is None:
+            raise ValueError('An url is required to build the new url')
+        return urlunsplit(url_object._replace(query=self.to_string()))
+
+
+class ParameterFilter:
+    """Decides which parameters of a query are kept. The names
+    are matched exactly against a frozenset, the prefixes with a
+    single `str.startswith` call and the regular expressions with
+    one combined pattern. The lookup state is built once so that
+    the filter can be applied to millions of urls. With `allow`
+    only the matching parameters are kept, otherwise they are removed
+
+    >>> tracking = ParameterFilter.from_globs(['utm_*', 'gclid'])
+    ... tracking('http://example.com/?utm_source=x&id=1&gclid=2')
+    ... 'http://example.com/?id=1'
+    """
+
+    def __init__(self, names=(), prefixes=(), patterns=(), allow=False):
+        self.names = frozenset(names)
+        self.prefixes = tuple(prefixes)
+        self.patterns = tuple(patterns)
+        self.allow = allow
+
+        self.regex = None
+        if self.patterns:
+            self.regex = re.compile(
+                '|'.join(f'(?:{pattern})' for pattern in self.patterns)
+            )
+        # Parameter names repeat a lot from
+        # one url to another, remember them
+        self.decisions = {}
+
+    def __repr__(self):
+        kind = 'allow' if self.allow else 'deny'
+        return f'<ParameterFilter: {kind} names={len(self.names)} prefixes={len(self.prefixes)}>'
+
+    def __call__(self, url, separator='&', key_value_separator='=', unique=False):
+        # A question mark in the fragment
+        # does not start a query
+        rest, hash_mark, fragment = str(url).partition('#')
+        base, question_mark, query = rest.partition('?')
+        if not question_mark:
+            return str(url)
+
+        query = self.filter_query(
+            query,
+            separator=separator,
+            key_value_separator=key_value_separator,
+            unique=unique
+        )
+        if query:
+            base = f'{base}?{query}'
+        if hash_mark:
+            base = f'{base}#{fragment}'
+        return base
+
+    @classmethod
+    def from_globs(cls, globs, allow=False):
+        """Builds the filter from names where "utm_*" stands
+        for a prefix and other wildcards for a pattern"""
+        names = []
+        prefixes = []
+        patterns = []
+        for item in globs:
+            if not any(character in item for character in '*?['):
+                names.append(item)
+            elif item.endswith('*') and not any(character in item[:-1] for character in '*?['):
+                prefixes.append(item[:-1])
+            else:
+                patterns.append(fnmatch.translate(item))
+        return cls(names=names, prefixes=prefixes, patterns=patterns, allow=allow)
+
+    def matches(self, name):
+        if name in self.names:
+            return True
+        if self.prefixes and name.startswith(self.prefixes):
+            return True
+        return self.regex is not None and self.regex.match(name) is not None
+
+    def keeps(self, name):
+        try:
+            return self.decisions[name]
+        except KeyError:
+            pass
+
+        result = self.matches(name) == self.allow
+        if len(self.decisions) >= 10000:
+            self.decisions.clear()
+        self.decisions[name] = result
+        return result
+
+    def filter_query(self, query, separator='&', key_value_separator='=', unique=False):
+        """Returns the query without the parameters that are
+        filtered out. The kept pairs are returned as they are"""
+        seen_keys = set()
+        params = []
+        for token in query.split(separator):
+            if not token:
+                continue
+
+            key = token.partition(key_value_separator)[0]
+            if not self.keeps(key):
+                continue
+
+            if unique:
+                if key in seen_keys:
+                    continue
+                seen_keys.add(key)
+            params.append(token)
+        return separator.join(params)
@@ -0,0 +1,71 @@
+import itertools
+import re
+from collections import OrderedDict
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple
+from urllib.parse import SplitResult
+
+
+class QueryBuilder:
+    url_object: Optional[SplitResult] = ...
+    parameters: OrderedDict[int, Tuple[str, Any]] = ...
+    positions: dict[str, list[int]] = ...
+    _counter: itertools.count = ...
+
+    def __init__(self, query: str = ..., keep_blank_values: bool = ...) -> None: ...
+    def __len__(self) -> int: ...
+    def __contains__(self, name: str) -> bool: ...
+    def __iter__(self) -> Iterator[Tuple[str, Any]]: ...
+
+    @classmethod
+    def from_url(cls, url: str, keep_blank_values: bool = ...) -> QueryBuilder: ...
+
+    def names(self) -> list[str]: ...
+    def get(self, name: str, default: Any = ...) -> Any: ...
+    def get_all(self, name: str) -> list[Any]: ...
+    def add(self, name: str, value: Any) -> QueryBuilder: ...
+    def replace(self, name: str, value: Any) -> QueryBuilder: ...
+    def remove(self, name: str) -> QueryBuilder: ...
+    def move_to_end(self, name: str, last: bool = ...) -> QueryBuilder: ...
+    def unique(self) -> QueryBuilder: ...
+    def sort(self, key: Callable[[Tuple[str, Any]], Any] = ...) -> QueryBuilder: ...
+    def to_string(self) -> str: ...
+    def to_url(self, url: str = ...) -> str: ...
+
+
+class ParameterFilter:
+    names: frozenset[str] = ...
+    prefixes: Tuple[str, ...] = ...
+    patterns: Tuple[str, ...] = ...
+    allow: bool = ...
+    regex: Optional[re.Pattern] = ...
+    decisions: dict[str, bool] = ...
+
+    def __init__(
+        self,
+        names: Iterable[str] = ...,
+        prefixes: Iterable[str] = ...,
+        patterns: Iterable[str] = ...,
+        allow: bool = ...
+    ) -> None: ...
+
+    def __call__(
+        self,
+        url: str,
+        separator: str = ...,
+        key_value_separator: str = ...,
+        unique: bool = ...
+    ) -> str: ...
+
+    @classmethod
+    def from_globs(cls, globs: Iterable[str], allow: bool = ...) -> ParameterFilter: ...
+
+    def matches(self, name: str) -> bool: ...
+    def keeps(self, name: str) -> bool: ...
+
+    def filter_query(
+        self,
+        query: str,
+        separator: str = ...,
+        key_value_separator: str = ...,
+        unique: bool = ...
+    ) -> str: ...
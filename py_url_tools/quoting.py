@@ -0,0 +1,112 @@
+from py_url_tools import constants
+
+ALWAYS_SAFE_CHARACTERS = constants.RFC3986_UNRESERVED
+
+
+def build_quoting_table(safe_characters):
+    """Returns what each of the 256 bytes becomes once
+    quoted: itself when it is safe, its escape otherwise"""
+    return [
+        chr(byte) if byte in safe_characters else f'%{byte:02X}'
+        for byte in range(256)
+    ]
+
+
+class Quoter:
+    """Percent encodes the components of an url for a given set of
+    safe characters. Whether a component only contains safe characters
+    is checked with a single `bytes.translate` call, those components,
+    which are the vast majority of a real corpus, are returned as is.
+    The others are encoded with a table of the 256 bytes built once,
+    giving the same result as `quote`. Counts how often each happens
+
+    >>> quoter = Quoter(constants.PATH_SAFEST_CHARACTERS)
+    ... quoter(b'/a b')
+    ... '/a%20b'
+    ... quoter.stats
+    ... {'hits': 0, 'misses': 1}
+    """
+
+    def __init__(self, safe, name=None):
+        self.safe = bytes(safe)
+        self.name = name
+        self.safe_characters = bytes(
+            set(self.safe).union(ALWAYS_SAFE_CHARACTERS)
+        )
+        self.table = build_quoting_table(self.safe_characters)
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        return f'<Quoter: {self.name or self.safe!r} hit_rate={self.hit_rate:.2f}>'
+
+    def __call__(self, value, encoding='utf-8'):
+        if isinstance(value, str):
+            value = value.encode(encoding)
+
+        if self.is_safe(value):
+            self.hits += 1
+            return value.decode('ascii')
+
+        self.misses += 1
+        return self.encode(value)
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        if total == 0:
+            return 0.0
+        return self.hits / total
+
+    @property
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses}
+
+    def is_safe(self, value):
+        """Tells if the bytes would be returned
+        unchanged by `quote` for this safe set"""
+        return not value.translate(None, self.safe_characters)
+
+    def encode(self, value):
+        """Percent encodes the bytes, `str.translate` looks up
+        each character of their latin-1 decoding in the table"""
+        return value.decode('latin-1').translate(self.table)
+
+    def clear(self):
+        self.hits = 0
+        self.misses = 0
+
+
+USERINFO_QUOTER = Quoter(constants.USERINFO_SAFEST_CHARACTERS, name='userinfo')
+
+
+PATH_QUOTER = Quoter(constants.PATH_SAFEST_CHARACTERS, name='path')
+
+
+QUERY_QUOTER = Quoter(constants.SPECIAL_QUERY_SAFEST_CHARACTERS, name='query')
+
+
+FRAGMENT_QUOTER = Quoter(constants.FRAGMENT_SAFEST_CHARS, name='fragment')
+
+
+COMPONENT_QUOTER = Quoter(constants.PATH_SAFE_CHARACTERS, name='component')
+
+
+QUOTERS = (
+    USERINFO_QUOTER,
+    PATH_QUOTER,
+    QUERY_QUOTER,
+    FRAGMENT_QUOTER,
+    COMPONENT_QUOTER
+)
+
+
+def quoting_stats():
+    """Returns the hits and the misses of the fast
+    path of each quoter used by the url functions"""
+    return {quoter.name: quoter.stats for quoter in QUOTERS}
+
+
+def clear_quoting_stats():
+    for quoter in QUOTERS:
+        quoter.clear()
@@ -0,0 +1,52 @@
+from typing import Union
+
+ALWAYS_SAFE_CHARACTERS: bytes = ...
+
+
+def build_quoting_table(safe_characters: bytes) -> list[str]: ...
+
+
+class Quoter:
+    safe: bytes = ...
+    name: str = ...
+    safe_characters: bytes = ...
+    table: list[str] = ...
+    hits: int = ...
+    misses: int = ...
+
+    def __init__(self, safe: bytes, name: str = ...) -> None: ...
+    def __call__(self, value: Union[str, bytes], encoding: str = ...) -> str: ...
+
+    @property
+    def hit_rate(self) -> float: ...
+
+    @property
+    def stats(self) -> dict[str, int]: ...
+
+    def is_safe(self, value: bytes) -> bool: ...
+    def encode(self, value: bytes) -> str: ...
+    def clear(self) -> None: ...
+
+
+USERINFO_QUOTER: Quoter = ...
+
+
+PATH_QUOTER: Quoter = ...
+
+
+QUERY_QUOTER: Quoter = ...
+
+
+FRAGMENT_QUOTER: Quoter = ...
+
+
+COMPONENT_QUOTER: Quoter = ...
+
+
+QUOTERS: tuple[Quoter, ...] = ...
+
+
+def quoting_stats() -> dict[str, dict[str, int]]: ...
+
+
+def clear_quoting_stats() -> None: ...
@@ -0,0 +1,109 @@
+import mmap
+import os
+
+NEWLINE = ord('\n')
+
+
+CARRIAGE_RETURN = ord('\r')
+
+
+class MappedURLFile:
+    """Memory maps a newline delimited file of urls and yields each
+    url as a slice of the mapping. No line is copied until it is
+    decoded which makes reading files of several gigabytes as cheap
+    as the operating system allows. The slices can be given as is
+    to `safe_url_string` or `convert_to_unicode`
+
+    The slices are memoryviews unless `as_bytes` is set, the
+    mapping is released once the last of them is released
+
+    >>> with MappedURLFile('urls.txt') as urls:
+    ...     for url in urls:
+    ...         safe_url_string(url)
+    """
+
+    def __init__(self, path, as_bytes=False, skip_empty=True):
+        self.path = os.fspath(path)
+        self.as_bytes = as_bytes
+        self.skip_empty = skip_empty
+        self._file = None
+        self._mapping = None
+
+    def __repr__(self):
+        return f'<MappedURLFile: {self.path}>'
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __iter__(self):
+        if self._file is None:
+            self.open()
+        if self._mapping is None:
+            return
+
+        mapping = self._mapping
+        # Slicing a memoryview does not copy the underlying
+        # data while slicing the mmap returns new bytes
+        buffer = mapping if self.as_bytes else memoryview(mapping)
+        size = len(mapping)
+        start = 0
+        while start < size:
+            end = mapping.find(b'\n', start)
+            if end < 0:
+                end = size
+
+            stop = end
+            if stop > start and mapping[stop - 1] == CARRIAGE_RETURN:
+                stop -= 1
+
+            if stop > start or not self.skip_empty:
+                yield buffer[start:stop]
+            start = end + 1
+
+    def open(self):
+        self._file = open(self.path, mode='rb')
+        if os.fstat(self._file.fileno()).st_size == 0:
+            # Empty files cannot be mapped
+            return
+
+        self._mapping = mmap.mmap(
+            self._file.fileno(),
+            0,
+            access=mmap.ACCESS_READ
+        )
+        if hasattr(mmap, 'MADV_SEQUENTIAL'):
+            self._mapping.madvise(mmap.MADV_SEQUENTIAL)
+
+    def close(self):
+        if self._mapping is not None:
+            try:
+                self._mapping.close()
+            except BufferError:
+                # Slices are still used somewhere, the mapping
+                # is released with the last one of them
+                pass
+            self._mapping = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def decoded(self, encoding='utf-8', errors='percentcode'):
+        """Yields the urls as strings, each line
+        being only copied once by the decoding"""
+        for line in self:
+            yield str(line, encoding, errors)
+
+
+def read_urls(path, as_bytes=False, skip_empty=True):
+    """Yields the urls of a newline delimited file as
+    slices of a memory mapping of the file
+
+    >>> list(read_urls('urls.txt', as_bytes=True))
+    ... [b'http://example.com', ...]
+    """
+    with MappedURLFile(path, as_bytes=as_bytes, skip_empty=skip_empty) as urls:
+        yield from urls
@@ -0,0 +1,43 @@
+import mmap
+import os
+from io import BufferedReader
+from typing import Iterator, Optional, Union
+
+NEWLINE: int = ...
+
+
+CARRIAGE_RETURN: int = ...
+
+
+class MappedURLFile:
+    path: str = ...
+    as_bytes: bool = ...
+    skip_empty: bool = ...
+    _file: Optional[BufferedReader] = ...
+    _mapping: Optional[mmap.mmap] = ...
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        as_bytes: bool = ...,
+        skip_empty: bool = ...
+    ) -> None: ...
+
+    def __enter__(self) -> MappedURLFile: ...
+    def __exit__(self, *args) -> None: ...
+    def __iter__(self) -> Iterator[Union[memoryview, bytes]]: ...
+    def open(self) -> None: ...
+    def close(self) -> None: ...
+
+    def decoded(
+        self,
+        encoding: str = ...,
+        errors: str = ...
+    ) -> Iterator[str]: ...
+
+
+def read_urls(
+    path: Union[str, os.PathLike],
+    as_bytes: bool = ...,
+    skip_empty: bool = ...
+) -> Iterator[Union[memoryview, bytes]]: ...
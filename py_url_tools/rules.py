@@ -0,0 +1,182 @@
+import dataclasses
+import re
+
+from py_url_tools import hosts, parser
+from py_url_tools.patterns import PatternSet, compile_pattern
+
+LITERAL_PREFIX_REGEX = re.compile(
+    r'\^((?:[^.^$*+?{}\[\]\\|()]|\\[^A-Za-z0-9])+)(?:\.\*)?\Z'
+)
+
+
+UNESCAPE_REGEX = re.compile(r'\\(.)')
+
+
+@dataclasses.dataclass
+class Rule:
+    """Represents an allow or
+    deny crawl rule"""
+
+    pattern: str
+    allow: bool = True
+    host: str = None
+    name: str = None
+    flags: int = 0
+
+    def __post_init__(self):
+        if self.name is None:
+            self.name = self.pattern
+
+        if self.host is not None:
+            self.host = self.host.lower()
+
+    @property
+    def literal_prefix(self):
+        """Returns the literal text of the rule when the pattern
+        only checks the start of the url e.g. ^https://example\\.com/
+        and None otherwise"""
+        if self.flags:
+            return None
+
+        result = LITERAL_PREFIX_REGEX.match(self.pattern)
+        if result is None:
+            return None
+        return UNESCAPE_REGEX.sub(r'\1', result.group(1))
+
+
+class RuleIndex:
+    """Indexes a group of rules. Rules that only check a literal
+    prefix are stored in a character trie which is walked once per
+    url whatever the amount of prefixes and the other rules are
+    combined in a `PatternSet` for each set of flags"""
+
+    def __init__(self, rules):
+        self.trie = {}
+        self.pattern_sets = []
+
+        rules_by_flags = {}
+        for rule in rules:
+            prefix = rule.literal_prefix
+            if prefix is None:
+                rules_by_flags.setdefault(rule.flags, []).append(rule)
+            else:
+                self.add_prefix(prefix, rule)
+
+        for flags, items in rules_by_flags.items():
+            pattern_set = PatternSet(
+                {
+                    str(i): compile_pattern(rule.pattern, flags)
+                    for i, rule in enumerate(items)
+                },
+                flags=flags
+            )
+            self.pattern_sets.append((pattern_set, items))
+
+    def add_prefix(self, prefix, rule):
+        node = self.trie
+        for character in prefix:
+            node = node.setdefault(character, {})
+        # The None key holds the rules
+        # ending on this node
+        node.setdefault(None, []).append(rule)
+
+    def match(self, url):
+        matched = []
+
+        node = self.trie
+        for character in url:
+            node = node.get(character)
+            if node is None:
+                break
+
+            rules = node.get(None)
+            if rules is not None:
+                matched.extend(rules)
+
+        for pattern_set, items in self.pattern_sets:
+            for name in pattern_set.matching(url):
+                matched.append(items[int(name)])
+        return matched
+
+
+class RuleEngine:
+    """Evaluates a large amount of allow and deny rules against
+    urls. Rules restricted to a host are only tested against
+    the urls of that host. An url is allowed when no deny rule
+    matches it and, if there are allow rules for it, at least
+    one of them matches
+
+    >>> engine = RuleEngine.from_lists(allow=[r'^https://example\\.com/'], deny=[r'/login'])
+    ... engine.is_allowed('https://example.com/products')
+    ... True
+    ... engine.is_allowed('https://example.com/login')
+    ... False
+    """
+
+    def __init__(self, rules=()):
+        self.rules = list(rules)
+
+        global_rules = []
+        rules_by_host = {}
+        for rule in self.rules:
+            if rule.host is None:
+                global_rules.append(rule)
+            else:
+                rules_by_host.setdefault(rule.host, []).append(rule)
+
+        self.index = RuleIndex(global_rules)
+        self.host_indexes = {
+            host: RuleIndex(items)
+            for host, items in rules_by_host.items()
+        }
+
+        self.has_allow_rules = any(rule.allow for rule in global_rules)
+        self.hosts_with_allow_rules = {
+            host for host, items in rules_by_host.items()
+            if any(rule.allow for rule in items)
+        }
+
+    def __repr__(self):
+        return f'<RuleEngine: {len(self.rules)}>'
+
+    def __len__(self):
+        return len(self.rules)
+
+    @classmethod
+    def from_lists(cls, allow=[], deny=[], flags=0):
+        rules = [Rule(pattern, allow=True, flags=flags) for pattern in allow]
+        rules.extend(
+            Rule(pattern, allow=False, flags=flags)
+            for pattern in deny
+        )
+        return cls(rules)
+
+    def get_host(self, url):
+        return hosts.netloc_to_host(parser.get_netloc(url))
+
+    def evaluate(self, url, host=None):
+        """Returns the rules matching the url"""
+        matched = self.index.match(url)
+
+        if self.host_indexes:
+            if host is None:
+                host = self.get_host(url)
+
+            index = self.host_indexes.get(host)
+            if index is not None:
+                matched.extend(index.match(url))
+        return matched
+
+    def is_allowed(self, url):
+        host = self.get_host(url) if self.host_indexes else None
+        matched = self.evaluate(url, host=host)
+
+        allowed = False
+        for rule in matched:
+            if not rule.allow:
+                return False
+            allowed = True
+
+        if allowed:
+            return True
+        return not (self.has_allow_rules or host in self.hosts_with_allow_rules)
@@ -0,0 +1,54 @@
+import dataclasses
+import re
+from typing import Iterable, Optional
+
+from py_url_tools.patterns import PatternSet
+
+
+LITERAL_PREFIX_REGEX: re.Pattern = ...
+
+
+UNESCAPE_REGEX: re.Pattern = ...
+
+
+@dataclasses.dataclass
+class Rule:
+    pattern: str
+    allow: bool = True
+    host: str = None
+    name: str = None
+    flags: int = 0
+
+    @property
+    def literal_prefix(self) -> Optional[str]: ...
+
+
+class RuleIndex:
+    trie: dict = ...
+    pattern_sets: list[tuple[PatternSet, list[Rule]]] = ...
+
+    def __init__(self, rules: Iterable[Rule]) -> None: ...
+    def add_prefix(self, prefix: str, rule: Rule) -> None: ...
+    def match(self, url: str) -> list[Rule]: ...
+
+
+class RuleEngine:
+    rules: list[Rule] = ...
+    index: RuleIndex = ...
+    host_indexes: dict[str, RuleIndex] = ...
+    has_allow_rules: bool = ...
+    hosts_with_allow_rules: set[str] = ...
+
+    def __init__(self, rules: Iterable[Rule] = ...) -> None: ...
+    def __repr__(self) -> str: ...
+    def __len__(self) -> int: ...
+    @classmethod
+    def from_lists(
+        cls,
+        allow: Iterable[str] = ...,
+        deny: Iterable[str] = ...,
+        flags: int = 0
+    ) -> RuleEngine: ...
+    def get_host(self, url: str) -> str: ...
+    def evaluate(self, url: str, host: str = None) -> list[Rule]: ...
+    def is_allowed(self, url: str) -> bool: ...
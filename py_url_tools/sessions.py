@@ -0,0 +1,180 @@
+import contextlib
+import contextvars
+import threading
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+CURRENT_SESSION_MANAGER = contextvars.ContextVar(
+    'current_session_manager',
+    default=None
+)
+
+
+class SessionManager:
+    """Holds a single `requests.Session` whose connections are kept
+    alive and pooled per host so that the TLS handshakes are only
+    paid once. Failed requests are retried with an exponential backoff
+
+    >>> with SessionManager(pool_maxsize=20, max_retries=2) as manager:
+    ...     response = manager.get('http://example.com')
+    ... manager.reuse_rate
+    ... 0.0
+    """
+
+    def __init__(self, pool_connections=10, pool_maxsize=10, max_retries=3,
+                 backoff_factor=0.3, retry_statuses=RETRY_STATUSES,
+                 timeout=10, headers=None):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.retry_statuses = frozenset(retry_statuses)
+        self.timeout = timeout
+        self.headers = dict(headers or {})
+        self._session = None
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f'<SessionManager: reuse_rate={self.reuse_rate:.2f}>'
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def session(self):
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self.build_session()
+        return self._session
+
+    def build_retry(self):
+        from urllib3.util.retry import Retry
+
+        return Retry(
+            total=self.max_retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=self.retry_statuses,
+            allowed_methods=frozenset({'HEAD', 'GET', 'OPTIONS'}),
+            raise_on_status=False
+        )
+
+    def build_session(self):
+        # requests is only imported once the first
+        # request is sent and not when urls is imported
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=self.build_retry()
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault('timeout', self.timeout)
+        return self.session.request(method, url, **kwargs)
+
+    def head(self, url, **kwargs):
+        kwargs.setdefault('allow_redirects', True)
+        return self.request('HEAD', url, **kwargs)
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def connection_pools(self):
+        """Returns the connection pools that are currently
+        opened by the session, one per scheme, host and port"""
+        if self._session is None:
+            return []
+
+        pools = []
+        adapters = {id(adapter): adapter for adapter in self._session.adapters.values()}
+        for adapter in adapters.values():
+            pool_manager = getattr(adapter, 'poolmanager', None)
+            if pool_manager is None:
+                continue
+            for key in pool_manager.pools.keys():
+                pool = pool_manager.pools.get(key)
+                if pool is not None:
+                    pools.append(pool)
+        return pools
+
+    @property
+    def stats(self):
+        connections = 0
+        requests_sent = 0
+        for pool in self.connection_pools():
+            connections += pool.num_connections
+            requests_sent += pool.num_requests
+        return {
+            'pools': len(self.connection_pools()),
+            'connections': connections,
+            'requests': requests_sent,
+            'reused': max(requests_sent - connections, 0)
+        }
+
+    @property
+    def reuse_rate(self):
+        """The part of the requests that were sent over
+        a connection that was already opened"""
+        stats = self.stats
+        if stats['requests'] == 0:
+            return 0.0
+        return stats['reused'] / stats['requests']
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+
+_default_manager = None
+_default_lock = threading.Lock()
+
+
+def get_session_manager():
+    """Returns the manager set by `use_session` in the
+    current context or the process wide default one"""
+    global _default_manager
+
+    manager = CURRENT_SESSION_MANAGER.get()
+    if manager is not None:
+        return manager
+
+    if _default_manager is None:
+        with _default_lock:
+            if _default_manager is None:
+                _default_manager = SessionManager()
+    return _default_manager
+
+
+@contextlib.contextmanager
+def use_session(manager=None, **kwargs):
+    """Makes the urls pick up the given manager inside the
+    block. A new manager is created from the keyword arguments
+    when none is given and closed when the block exits
+
+    >>> with use_session(pool_maxsize=50) as manager:
+    ...     URL('http://example.com').get_status()
+    """
+    owned = manager is None
+    if owned:
+        manager = SessionManager(**kwargs)
+
+    token = CURRENT_SESSION_MANAGER.set(manager)
+    try:
+        yield manager
+    finally:
+        CURRENT_SESSION_MANAGER.reset(token)
+        if owned:
+            manager.close()
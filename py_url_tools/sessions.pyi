@@ -0,0 +1,65 @@
+import contextvars
+import threading
+from typing import Any, ContextManager, Iterable, Optional
+
+import requests
+from urllib3.connectionpool import HTTPConnectionPool
+from urllib3.util.retry import Retry
+
+RETRY_STATUSES: frozenset[int] = ...
+
+
+CURRENT_SESSION_MANAGER: contextvars.ContextVar[Optional[SessionManager]] = ...
+
+
+class SessionManager:
+    pool_connections: int = ...
+    pool_maxsize: int = ...
+    max_retries: int = ...
+    backoff_factor: float = ...
+    retry_statuses: frozenset[int] = ...
+    timeout: float = ...
+    headers: dict[str, str] = ...
+    _session: Optional[requests.Session] = ...
+    _lock: threading.Lock = ...
+
+    def __init__(
+        self,
+        pool_connections: int = ...,
+        pool_maxsize: int = ...,
+        max_retries: int = ...,
+        backoff_factor: float = ...,
+        retry_statuses: Iterable[int] = ...,
+        timeout: float = ...,
+        headers: dict[str, str] = ...
+    ) -> None: ...
+
+    def __enter__(self) -> SessionManager: ...
+    def __exit__(self, *args) -> None: ...
+
+    @property
+    def session(self) -> requests.Session: ...
+
+    def build_retry(self) -> Retry: ...
+    def build_session(self) -> requests.Session: ...
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response: ...
+    def head(self, url: str, **kwargs: Any) -> requests.Response: ...
+    def get(self, url: str, **kwargs: Any) -> requests.Response: ...
+    def connection_pools(self) -> list[HTTPConnectionPool]: ...
+
+    @property
+    def stats(self) -> dict[str, int]: ...
+
+    @property
+    def reuse_rate(self) -> float: ...
+
+    def close(self) -> None: ...
+
+
+def get_session_manager() -> SessionManager: ...
+
+
+def use_session(
+    manager: SessionManager = ...,
+    **kwargs: Any
+) -> ContextManager[SessionManager]: ...
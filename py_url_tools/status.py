@@ -0,0 +1,251 @@
+import asyncio
+import ssl
+from urllib.parse import quote, urljoin, urlsplit
+
+from py_url_tools import constants
+from py_url_tools.agents import UserAgentPool
+
+REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+
+
+class ConnectionPool:
+    """Keeps the idle connections opened to each host
+    so that they can be reused by the next requests"""
+
+    def __init__(self, max_idle_per_host=6, ssl_context=None):
+        self.max_idle_per_host = max_idle_per_host
+        self.ssl_context = ssl_context
+        self.idle_connections = {}
+        self.opened = 0
+        self.reused = 0
+
+    def __repr__(self):
+        return f'<ConnectionPool: opened={self.opened} reused={self.reused}>'
+
+    async def acquire(self, key):
+        """Returns an idle connection to the host or opens a new
+        one. The last item tells if the connection was reused"""
+        connections = self.idle_connections.get(key)
+        while connections:
+            reader, writer = connections.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                self.reused += 1
+                return reader, writer, True
+
+        scheme, host, port = key
+        context = None
+        if scheme == 'https':
+            if self.ssl_context is None:
+                self.ssl_context = ssl.create_default_context()
+            context = self.ssl_context
+
+        reader, writer = await asyncio.open_connection(host, port, ssl=context)
+        self.opened += 1
+        return reader, writer, False
+
+    def release(self, key, reader, writer):
+        connections = self.idle_connections.setdefault(key, [])
+        if len(connections) >= self.max_idle_per_host or writer.is_closing():
+            writer.close()
+            return
+        connections.append((reader, writer))
+
+    async def close(self):
+        for connections in self.idle_connections.values():
+            for _, writer in connections:
+                writer.close()
+        self.idle_connections.clear()
+
+
+class StatusChecker:
+    """Checks the status of a large amount of urls concurrently.
+    Connections are kept alive and reused per host, a HEAD request
+    is sent first and a GET request is only sent when the server
+    does not support HEAD
+
+    >>> async with StatusChecker(concurrency=200, per_host=4) as checker:
+    ...     results = await checker.check_many(urls)
+    ... results['http://example.com']
+    ... (True, 200)
+    """
+
+    def __init__(self, concurrency=100, per_host=6, timeout=10, max_redirects=5,
+                 user_agent=None, head_first=True, get_fallback_statuses=(405, 501),
+                 ssl_context=None):
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.timeout = timeout
+        self.max_redirects = max_redirects
+        self.user_agent = user_agent
+        self.head_first = head_first
+        self.get_fallback_statuses = frozenset(get_fallback_statuses)
+        self.pool = ConnectionPool(
+            max_idle_per_host=per_host,
+            ssl_context=ssl_context
+        )
+        self.host_semaphores = {}
+
+    def __repr__(self):
+        return f'<StatusChecker: {self.pool}>'
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def close(self):
+        await self.pool.close()
+
+    def get_user_agent(self, host):
+        if isinstance(self.user_agent, UserAgentPool):
+            return self.user_agent.pick(host)
+        if callable(self.user_agent):
+            return self.user_agent()
+        return self.user_agent
+
+    def build_request(self, method, url_object, host, keep_alive):
+        target = url_object.path or '/'
+        if url_object.query:
+            target = f'{target}?{url_object.query}'
+        target = quote(target, constants.PATH_SAFE_CHARACTERS)
+
+        host_header = host
+        if url_object.port is not None:
+            host_header = f'{host}:{url_object.port}'
+
+        lines = [
+            f'{method} {target} HTTP/1.1',
+            f'Host: {host_header}',
+            'Accept: */*',
+            f"Connection: {'keep-alive' if keep_alive else 'close'}"
+        ]
+
+        user_agent = self.get_user_agent(host)
+        if user_agent:
+            lines.append(f'User-Agent: {user_agent}')
+        return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+
+    async def read_response(self, reader):
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError('The connection was closed by the server')
+
+        version, status_code = status_line.decode('latin-1').split(None, 2)[:2]
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        keep_alive = headers.get('connection', '').lower() != 'close'
+        if version == 'HTTP/1.0':
+            keep_alive = headers.get('connection', '').lower() == 'keep-alive'
+        return int(status_code), headers, keep_alive
+
+    async def request(self, method, url):
+        """Sends a single request and returns the status
+        code and the headers of the response"""
+        url_object = urlsplit(url)
+        if url_object.scheme not in ('http', 'https') or not url_object.hostname:
+            raise ValueError(f'Cannot check the status of {url}')
+
+        host = url_object.hostname.encode('idna').decode('ascii')
+        port = url_object.port or constants.DEFAULT_PORTS[url_object.scheme]
+        key = (url_object.scheme, host, port)
+        # Only HEAD responses have no body which
+        # makes the connection reusable right away
+        keep_alive = method == 'HEAD'
+        request = self.build_request(method, url_object, host, keep_alive)
+
+        for _ in range(2):
+            reader, writer, reused = await self.pool.acquire(key)
+            try:
+                writer.write(request)
+                await writer.drain()
+                status_code, headers, server_keep_alive = await self.read_response(reader)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                writer.close()
+                if reused:
+                    # The server closed the idle connection,
+                    # try again with a new connection
+                    continue
+                raise
+            except BaseException:
+                writer.close()
+                raise
+
+            if keep_alive and server_keep_alive:
+                self.pool.release(key, reader, writer)
+            else:
+                writer.close()
+            return status_code, headers
+        raise ConnectionResetError('The connection was closed by the server')
+
+    async def fetch_status(self, url):
+        """Follows the redirects of the url and returns if the
+        final response is ok and its status code. Running out of
+        redirects, e.g. on a redirect loop, is a broken link and
+        returns False with the status code of the last redirect"""
+        for _ in range(self.max_redirects + 1):
+            host = urlsplit(url).hostname
+            semaphore = self.host_semaphores.get(host)
+            if semaphore is None:
+                semaphore = asyncio.Semaphore(self.per_host)
+                self.host_semaphores[host] = semaphore
+
+            async with semaphore:
+                method = 'HEAD' if self.head_first else 'GET'
+                status_code, headers = await self.request(method, url)
+                if method == 'HEAD' and status_code in self.get_fallback_statuses:
+                    status_code, headers = await self.request('GET', url)
+
+            location = headers.get('location')
+            if status_code not in REDIRECT_STATUSES or not location:
+                return status_code < 400, status_code
+            url = urljoin(url, location)
+        return False, status_code
+
+    async def check(self, url):
+        """Returns the same tuple as `URL.get_status`:
+        if the response is ok and its status code. Urls that
+        could not be reached return (False, None)"""
+        try:
+            return await asyncio.wait_for(
+                self.fetch_status(url),
+                timeout=self.timeout
+            )
+        except (OSError, ValueError, UnicodeError, asyncio.TimeoutError):
+            return False, None
+
+    async def check_many(self, urls):
+        """Checks the urls with a fixed amount of workers
+        so that the urls are read lazily"""
+        iterator = iter(urls)
+        results = {}
+
+        async def worker():
+            for url in iterator:
+                results[url] = await self.check(url)
+
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(self.concurrency)
+        ]
+        await asyncio.gather(*workers)
+        return results
+
+
+def check_statuses(urls, **kwargs):
+    """Checks the status of the urls from synchronous
+    code. The keyword arguments are passed to `StatusChecker`
+
+    >>> check_statuses(['http://example.com'], per_host=2)
+    ... {'http://example.com': (True, 200)}
+    """
+    async def run():
+        async with StatusChecker(**kwargs) as checker:
+            return await checker.check_many(urls)
+    return asyncio.run(run())
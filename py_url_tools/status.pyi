@@ -0,0 +1,95 @@
+import asyncio
+import ssl
+from typing import Callable, Iterable, Optional, Tuple, Union
+
+from py_url_tools.agents import UserAgentPool
+
+REDIRECT_STATUSES: frozenset[int] = ...
+
+_PoolKey = Tuple[str, str, int]
+_Connection = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+
+class ConnectionPool:
+    max_idle_per_host: int = ...
+    ssl_context: Optional[ssl.SSLContext] = ...
+    idle_connections: dict[_PoolKey, list[_Connection]] = ...
+    opened: int = ...
+    reused: int = ...
+
+    def __init__(
+        self,
+        max_idle_per_host: int = ...,
+        ssl_context: Optional[ssl.SSLContext] = ...
+    ) -> None: ...
+
+    async def acquire(
+        self,
+        key: _PoolKey
+    ) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter, bool]: ...
+
+    def release(
+        self,
+        key: _PoolKey,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter
+    ) -> None: ...
+
+    async def close(self) -> None: ...
+
+
+class StatusChecker:
+    concurrency: int = ...
+    per_host: int = ...
+    timeout: float = ...
+    max_redirects: int = ...
+    user_agent: Union[str, UserAgentPool, Callable[[], str], None] = ...
+    head_first: bool = ...
+    get_fallback_statuses: frozenset[int] = ...
+    pool: ConnectionPool = ...
+    host_semaphores: dict[str, asyncio.Semaphore] = ...
+
+    def __init__(
+        self,
+        concurrency: int = ...,
+        per_host: int = ...,
+        timeout: float = ...,
+        max_redirects: int = ...,
+        user_agent: Union[str, UserAgentPool, Callable[[], str], None] = ...,
+        head_first: bool = ...,
+        get_fallback_statuses: Iterable[int] = ...,
+        ssl_context: Optional[ssl.SSLContext] = ...
+    ) -> None: ...
+
+    async def __aenter__(self) -> StatusChecker: ...
+    async def __aexit__(self, *args) -> None: ...
+    async def close(self) -> None: ...
+    def get_user_agent(self, host: str) -> Optional[str]: ...
+
+    def build_request(
+        self,
+        method: str,
+        url_object,
+        host: str,
+        keep_alive: bool
+    ) -> bytes: ...
+
+    async def read_response(
+        self,
+        reader: asyncio.StreamReader
+    ) -> Tuple[int, dict[str, str], bool]: ...
+
+    async def request(self, method: str, url: str) -> Tuple[int, dict[str, str]]: ...
+    async def fetch_status(self, url: str) -> tuple[bool, int]: ...
+    async def check(self, url: str) -> Tuple[bool, Optional[int]]: ...
+
+    async def check_many(
+        self,
+        urls: Iterable[str]
+    ) -> dict[str, Tuple[bool, Optional[int]]]: ...
+
+
+def check_statuses(
+    urls: Iterable[str],
+    **kwargs
+) -> dict[str, Tuple[bool, Optional[int]]]: ...
@@ -0,0 +1,135 @@
+from py_url_tools import hosts, parser
+from py_url_tools.query import ParameterFilter
+
+# Parameters added by analytics, advertising and mailing
+# tools which do not change the page that is returned.
+# "utm_*" stands for every parameter starting with "utm_".
+# Only names and prefixes specific to a vendor are listed,
+# short generic names (e.g. "si", "spm") are also used by sites
+# for their own parameters and belong to `HOST_RULES`
+
+RULE_SETS = {
+    'analytics': (
+        'utm_*', '_ga', '_gl', 'pk_campaign', 'pk_kwd', 'pk_keyword',
+        'pk_source', 'pk_medium', 'pk_content', 'pk_cid', 'pk_vid',
+        'piwik_*', 'mtm_*', 'matomo_*', '_openstat', 'ga_source',
+        'ga_medium', 'ga_term', 'ga_content', 'ga_campaign', 'ga_place',
+        'stm_source', 'stm_medium', 'stm_campaign', 'stm_term',
+        'stm_content', 'at_medium', 'at_campaign', 'at_custom*',
+        'oly_anon_id', 'oly_enc_id', 'vero_id', 'vero_conv', 'wt_mc',
+        'wt_zmc', 'ss_source', 'ss_campaign_*', 'sr_share', 'rb_clickid'
+    ),
+    'ads': (
+        'gclid', 'gclsrc', 'gbraid', 'wbraid', 'dclid', 'gad_source',
+        'fbclid', 'msclkid', 'yclid', 'ysclid', 'twclid', 'ttclid',
+        'li_fat_id', 'epik', 'irclickid', 'irgwc', 'srsltid', 'wickedid',
+        'hsa_*', 'zanpid', 'obclid', 'dicbo', 'ef_id', 's_kwcid', 'tduid'
+    ),
+    'email': (
+        'mc_cid', 'mc_eid', '_hsenc', '_hsmi', '__hssc', '__hstc',
+        '__hsfp', 'hsctatracking', 'mkt_tok', 'trk_contact', 'trk_msg',
+        'trk_module', 'trk_sid', 'sfmc_*', 'elqTrackId', 'elqTrack',
+        'elqaid', 'elqat', 'elqCampaignId', '_ke', '_kx', 'ml_subscriber',
+        'ml_subscriber_hash', 'oft_*'
+    ),
+    'social': (
+        'igshid', 'igsh', 'fb_action_ids', 'fb_action_types', 'fb_ref',
+        'fb_source', 'action_object_map', 'action_type_map', 'action_ref_map'
+    )
+}
+
+
+# Parameters only used for tracking on some sites, the
+# rules of a domain also apply to its subdomains
+
+HOST_RULES = {
+    'amazon.com': ('pd_rd_*', 'pf_rd_*', '_encoding', 'content-id', 'ref_', 'psc'),
+    'amazon.co.uk': ('pd_rd_*', 'pf_rd_*', '_encoding', 'content-id', 'ref_', 'psc'),
+    'amazon.de': ('pd_rd_*', 'pf_rd_*', '_encoding', 'content-id', 'ref_', 'psc'),
+    'amazon.fr': ('pd_rd_*', 'pf_rd_*', '_encoding', 'content-id', 'ref_', 'psc'),
+    'youtube.com': ('feature', 'pp', 'ab_channel', 'si'),
+    'twitter.com': ('s', 't', 'ref_src', 'ref_url'),
+    'x.com': ('s', 't', 'ref_src', 'ref_url'),
+    'linkedin.com': ('trk', 'trkInfo', 'trackingId', 'refId', 'lipi', 'midToken'),
+    'reddit.com': ('share_id', 'ref', 'ref_source', 'rdt'),
+    'spotify.com': ('si', 'context', 'nd'),
+    'aliexpress.com': ('aff_*', 'sk', 'spm', 'scm', 'scm_*', 'pvid', 'algo_*', 'btsid'),
+    'alibaba.com': ('spm', 'scm'),
+    'taobao.com': ('spm', 'scm'),
+    'tmall.com': ('spm', 'scm'),
+    'adobe.com': ('s_cid', 'sc_cid'),
+    'yahoo.com': ('ncid',),
+    'nbcnews.com': ('ncid',),
+    'ebay.com': ('_trkparms', '_trksid', 'hash', 'amdata', 'mkcid', 'mkevt')
+}
+
+
+class TrackingStripper:
+    """Removes the tracking parameters from the query of urls
+    before they get deduplicated. One `ParameterFilter` is built
+    for the global rules and one for each host having its own rules,
+    so an url costs a dictionary lookup on its host and a lookup per
+    parameter in the index of the filter whatever the number of rules
+
+    >>> stripper = TrackingStripper()
+    ... stripper('https://www.amazon.com/dp/1?pd_rd_w=a&utm_source=x&k=v')
+    ... 'https://www.amazon.com/dp/1?k=v'
+    """
+
+    def __init__(self, rule_sets=None, names=(), host_rules=None):
+        if rule_sets is None:
+            rule_sets = RULE_SETS.keys()
+        if host_rules is None:
+            host_rules = HOST_RULES
+
+        self.rules = []
+        for rule_set in rule_sets:
+            try:
+                self.rules.extend(RULE_SETS[rule_set])
+            except KeyError:
+                raise ValueError(f'Unknown rule set: {rule_set}')
+        self.rules.extend(names)
+
+        self.parameter_filter = ParameterFilter.from_globs(self.rules)
+        self.host_filters = {
+            host.lower(): ParameterFilter.from_globs(self.rules + list(items))
+            for host, items in host_rules.items()
+        }
+
+    def __repr__(self):
+        return f'<TrackingStripper: {len(self.rules)} rules, {len(self.host_filters)} hosts>'
+
+    def __call__(self, url):
+        if '?' not in url:
+            return url
+        return self.get_filter(url)(url)
+
+    def get_filter(self, url):
+        """Returns the filter that applies to the host of
+        the url, its own or the one of its domain"""
+        if not self.host_filters:
+            return self.parameter_filter
+
+        host = hosts.netloc_to_host(parser.get_netloc(url))
+        host_filter = self.host_filters.get(host)
+        if host_filter is None:
+            domain = hosts.registrable_domain(host)
+            host_filter = self.host_filters.get(domain, self.parameter_filter)
+        return host_filter
+
+    def strip_many(self, urls):
+        for url in urls:
+            yield self(url)
+
+
+_default_stripper = None
+
+
+def strip_tracking_parameters(url):
+    """Removes the parameters of the bundled rules
+    from the url using a shared `TrackingStripper`"""
+    global _default_stripper
+
+    if _default_stripper is None:
+        _default_stripper = TrackingStripper()
+    return _default_stripper(url)
@@ -0,0 +1,31 @@
+from typing import Iterable, Iterator, Mapping, Optional
+
+from py_url_tools.query import ParameterFilter
+
+RULE_SETS: dict[str, tuple[str, ...]] = ...
+
+
+HOST_RULES: dict[str, tuple[str, ...]] = ...
+
+
+class TrackingStripper:
+    rules: list[str] = ...
+    parameter_filter: ParameterFilter = ...
+    host_filters: dict[str, ParameterFilter] = ...
+
+    def __init__(
+        self,
+        rule_sets: Iterable[str] = ...,
+        names: Iterable[str] = ...,
+        host_rules: Mapping[str, Iterable[str]] = ...
+    ) -> None: ...
+
+    def __call__(self, url: str) -> str: ...
+    def get_filter(self, url: str) -> ParameterFilter: ...
+    def strip_many(self, urls: Iterable[str]) -> Iterator[str]: ...
+
+
+_default_stripper: Optional[TrackingStripper] = ...
+
+
+def strip_tracking_parameters(url: str) -> str: ...
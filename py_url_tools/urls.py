@@ -3,18 +3,89 @@ import os
 import pathlib
 import posixpath
 import re
-from urllib.parse import (parse_qs, parse_qsl, quote, unquote, urldefrag,
-                          urlencode, urlparse, urlsplit, urlunparse,
-                          urlunsplit, urljoin)
-from urllib.request import pathname2url, url2pathname
+import sys
+from functools import cached_property
+from urllib.parse import (parse_qs, parse_qsl, quote, quote_plus, unquote,
+                          unquote_plus, urldefrag, urlencode, urljoin,
+                          urlparse, urlsplit, urlunparse, urlunsplit)
 
-import requests
 from py_url_tools.utilities import RANDOM_USER_AGENT
 
-from py_url_tools import PROJECT_PATH, constants, utilities
+from py_url_tools import (PROJECT_PATH, constants, hosts, parser, patterns,
+                          quoting, sessions, utilities)
+from py_url_tools.cache import CachedFunction
+from py_url_tools.query import ParameterFilter
+
+
+def safe_ascii_url(url, quote_path=True):
+    """Bytes native version of `safe_url_string` for ASCII urls.
+    The components are sliced and quoted from the bytes of the url
+    instead of being decoded and encoded again one by one. Returns
+    None for the urls that need the full algorithm: userinfo,
+    IPv6 hosts and ports that are not plain numbers
+
+    >>> safe_ascii_url(b'HTTP://Example.com/a b')
+    ... 'http://example.com/a%20b'
+    """
+    url = url.strip(constants.C0_CONTROL_OR_SPACE_BYTES)
+    url = url.translate(None, constants.ASCII_TAB_OR_NEWLINE_BYTES)
+    text = url.decode('ascii')
+
+    offsets = parser.url_offsets(text)
+    scheme_end, netloc_start, netloc_end, _, path_end, query_end = offsets
+
+    netloc = text[netloc_start:netloc_end]
+    if '@' in netloc or '[' in netloc or ']' in netloc:
+        return None
+
+    # ASCII hosts are returned as is by the IDNA codec, only
+    # urlsplit lowercases them up to an eventual zone index
+    host, _, port = netloc.partition(':')
+    host, percent, zone = host.partition('%')
+    netloc = host.lower() + percent + zone
+    if port:
+        if not port.isdigit() or int(port) > 65535:
+            return None
+        netloc = f'{netloc}:{int(port)}'
+
+    if quote_path:
+        path = quoting.PATH_QUOTER(url[netloc_end:path_end])
+    else:
+        path = text[netloc_end:path_end]
+
+    return urlunsplit(
+        (
+            text[:scheme_end].lower(),
+            netloc,
+            path,
+            quoting.QUERY_QUOTER(url[path_end + 1:query_end]),
+            quoting.FRAGMENT_QUOTER(url[query_end + 1:])
+        )
+    )
 
 
 def safe_url_string(url, encoding='utf-8', path_encoding='utf-8', quote_path=True):
+    data = None
+    if isinstance(url, str):
+        if url.isascii():
+            data = url.encode('ascii')
+    elif isinstance(url, (bytes, bytearray, memoryview)):
+        data = url if isinstance(url, bytes) else bytes(url)
+        if not data.isascii():
+            data = None
+
+    # Most urls are pure ASCII, for them the encodings
+    # do not matter as long as ASCII is encoded as itself
+    if data is not None:
+        ascii_encodings = (
+            utilities.is_ascii_compatible(encoding) and
+            utilities.is_ascii_compatible(path_encoding)
+        )
+        if ascii_encodings:
+            result = safe_ascii_url(data, quote_path=quote_path)
+            if result is not None:
+                return result
+
     decoded_url = utilities.convert_to_unicode(
         url,
         encoding=encoding,
@@ -24,27 +95,19 @@ def safe_url_string(url, encoding='utf-8', path_encoding='utf-8', quote_path=Tru
 
     netloc_bytes = b''
     if url_parts.username is not None:
-        safe_username = quote(
-            unquote(url_parts.username),
-            constants.USERINFO_SAFEST_CHARACTERS
-        )
+        safe_username = quoting.USERINFO_QUOTER(unquote(url_parts.username))
         netloc_bytes = netloc_bytes + safe_username.encode(encoding)
 
     if url_parts.username is not None:
-        safe_password = quote(
-            unquote(url_parts.password),
-            constants.USERINFO_SAFEST_CHARACTERS
-        )
+        safe_password = quoting.USERINFO_QUOTER(unquote(url_parts.password))
         netloc_bytes = netloc_bytes + safe_password.encode(encoding)
         netloc_bytes = netloc_bytes + b"@"
 
     if url_parts.hostname is not None:
-        try:
-            netloc_bytes += url_parts.hostname.encode('idna')
-        except UnicodeError:
-            # IDNA encoding can fail for too long labels (>63 characters) or
-            # missing labels (e.g. http://.example.com)
-            netloc_bytes += url_parts.hostname.encode(encoding)
+        encoded_host = hosts.IDNA_ENCODER(url_parts.hostname)
+        if encoded_host is None:
+            encoded_host = url_parts.hostname.encode(encoding)
+        netloc_bytes += encoded_host
 
     if url_parts.port is not None:
         netloc_bytes += b":"
@@ -53,23 +116,14 @@ def safe_url_string(url, encoding='utf-8', path_encoding='utf-8', quote_path=Tru
     netloc = netloc_bytes.decode()
 
     if quote_path:
-        path = quote(
-            url_parts.path.encode(path_encoding),
-            constants.PATH_SAFEST_CHARACTERS
-        )
+        path = quoting.PATH_QUOTER(url_parts.path.encode(path_encoding))
     else:
         path = url_parts.path
 
     if url_parts.scheme in constants.SPECIAL_SCHEMES:
-        query = quote(
-            url_parts.query.encode(encoding),
-            constants.SPECIAL_QUERY_SAFEST_CHARACTERS
-        )
+        query = quoting.QUERY_QUOTER(url_parts.query.encode(encoding))
     else:
-        query = quote(
-            url_parts.query.encode(encoding),
-            constants.SPECIAL_QUERY_SAFEST_CHARACTERS
-        )
+        query = quoting.QUERY_QUOTER(url_parts.query.encode(encoding))
 
     return urlunsplit(
         (
@@ -77,14 +131,30 @@ def safe_url_string(url, encoding='utf-8', path_encoding='utf-8', quote_path=Tru
             netloc,
             path,
             query,
-            quote(
-                url_parts.fragment.encode(encoding),
-                constants.FRAGMENT_SAFEST_CHARS
-            )
+            quoting.FRAGMENT_QUOTER(url_parts.fragment.encode(encoding))
         )
     )
 
 
+def safe_url_bytes(url, encoding='utf-8', path_encoding='utf-8', quote_path=True):
+    """Same as `safe_url_string` but returns bytes, meant
+    for urls that are read from and written to the network.
+    This is a convenience wrapper: the url goes through the
+    `str` pipeline of `safe_url_string` and the result is encoded
+    once at the end, it is not faster than doing it by hand
+
+    >>> safe_url_bytes(b'http://example.com/a b')
+    ... b'http://example.com/a%20b'
+    """
+    result = safe_url_string(
+        url,
+        encoding=encoding,
+        path_encoding=path_encoding,
+        quote_path=quote_path
+    )
+    return result.encode('utf-8')
+
+
 def safe_download_url(url, encoding='utf-8', path_encoding='utf-8'):
     safe_url = safe_url_string(
         url,
@@ -131,6 +201,8 @@ class URLParameter:
     """Represents an 
     url parameter"""
 
+    __slots__ = ('key', 'value')
+
     key: str
     value: str
 
@@ -151,39 +223,48 @@ class URLParameter:
 
 
 def clean_url_query_parameters(url, names=[], separator='&', key_value_separator='=', unique=True, keep_fragments=False):
-    if not isinstance(names, (tuple, list)):
-        raise
+    """Only keeps the parameters of the query whose name is in
+    `names`. A `ParameterFilter` can be given instead of the names
+    so that its lookup state is built once for many urls
+
+    >>> keep = ParameterFilter(names=['id'], allow=True)
+    ... clean_url_query_parameters('http://example.com/?id=1&a=2', names=keep)
+    ... 'http://example.com/?id=1'
+    """
+    if isinstance(names, ParameterFilter):
+        parameter_filter = names
+    elif isinstance(names, (tuple, list, set, frozenset)):
+        parameter_filter = None
+        if names:
+            parameter_filter = ParameterFilter(names=names, allow=True)
+    else:
+        raise TypeError('names should be a list of names or a ParameterFilter')
 
     url, fragment = urldefrag(url)
     url = str(url)
     fragment = str(fragment)
 
-    parameter_objects = []
-
     base, _, query = url.partition('?')
-    tokens = query.split(separator)
-    for token in tokens:
+
+    # The pairs are kept as plain strings, no
+    # object is allocated for each of the tokens
+    seen_keys = set()
+    params = []
+    for token in query.split(separator):
         if not token:
             continue
 
-        key, value = token.split(key_value_separator)
-        parameter_objects.append(URLParameter(key, value))
-
-    seen_keys = set()
-    result_list = []
-    for item in parameter_objects:
-        if unique:
-            if item.key in seen_keys:
-                continue
+        # Values can contain the separator, e.g. base64 padding
+        key, has_separator, value = token.partition(key_value_separator)
+        if unique and key in seen_keys:
+            continue
 
-        if names:
-            if item.key not in names:
-                continue
+        if parameter_filter is not None and not parameter_filter.keeps(key):
+            continue
 
-        result_list.append(item)
-        seen_keys.add(item.key)
+        params.append(f'{key}={value}' if has_separator else key)
+        seen_keys.add(key)
 
-    params = [item.join() for item in result_list]
     joined_params = f'{separator}'.join(params)
     url = f'?{joined_params}'
 
@@ -194,41 +275,57 @@ def clean_url_query_parameters(url, names=[], separator='&', key_value_separator
 
 
 def add_or_replace_parameter(url, params={}):
-    url_object = urlsplit(url)
-    current_params = parse_qsl(
-        url_object.query,
-        keep_blank_values=True
-    )
-    new_params = []
+    """Only keeps the first value of each parameter of the
+    url, replaces the ones from `params` and adds the others.
+    The query is rebuilt in a single pass and the pairs that
+    `parse_qsl` and `urlencode` would give back unchanged are
+    kept as they are. `QueryBuilder` is meant for chaining
+    several edits"""
+    url_object = urlsplit(str(url))
+    is_unchanged = constants.UNCHANGED_QUERY_PAIR_REGEX.fullmatch
+
     seen_keys = set()
+    new_params = []
+    for token in url_object.query.split('&'):
+        if not token:
+            continue
 
-    for param in current_params:
-        name, value = param
+        unchanged = is_unchanged(token) is not None
+        name, _, value = token.partition('=')
+        if not unchanged:
+            name = unquote_plus(name, errors='replace')
+            value = unquote_plus(value, errors='replace')
 
         if name in seen_keys:
             continue
-
-        if name in params:
-            new_params.append(URLParameter(name, params[name]))
-        elif name not in params:
-            new_params.append(URLParameter(name, value))
         seen_keys.add(name)
 
-    for key in params.keys():
-        if key not in seen_keys:
-            new_params.append(URLParameter(key, params[key]))
+        if name in params:
+            new_params.append(urlencode(((name, params[name]),)))
+        elif unchanged:
+            new_params.append(f'{name}={value}')
+        else:
+            new_params.append(urlencode(((name, value),)))
 
-    items = map(lambda x: x.deconstruct(), new_params)
-    query = urlencode(list(items))
+    for name, value in params.items():
+        if name not in seen_keys:
+            new_params.append(urlencode(((name, value),)))
+    query = '&'.join(new_params)
     return urlunsplit(url_object._replace(query=query))
 
 
 def path_to_file_uri(path):
+    # urllib.request pulls in http.client, email
+    # and ssl which are only needed for file urls
+    from urllib.request import pathname2url
+
     result = pathname2url(os.path.abspath(path))
     return f"file:///{result.lstrip('/')}"
 
 
 def file_uri_to_path(url):
+    from urllib.request import url2pathname
+
     url_path = urlparse(url).path
     return url2pathname(url_path)
 
@@ -255,16 +352,13 @@ def clean_url(url, keep_blank_values=True, keep_fragments=False, encoding='utf-8
     scheme, netloc, path, params, query, fragment = parser.get_url_parts
 
     key_values = parse_qsl(query, keep_blank_values=keep_blank_values)
-    print(utilities.parse_qsl_to_bytes(
-        query, keep_blank_values=keep_blank_values))
     key_values.sort()
     query = urlencode(key_values)
 
     unquoted_path = utilities.unquote_path(path)
-    path = quote(unquoted_path, constants.PATH_SAFE_CHARACTERS) or '/'
+    path = quoting.COMPONENT_QUOTER(unquoted_path) or '/'
 
     fragment = '' if not keep_fragments else fragment
-    # print(unquoted_path)
 
     return urlunparse(
         (
@@ -278,34 +372,112 @@ def clean_url(url, keep_blank_values=True, keep_fragments=False, encoding='utf-8
     )
 
 
-class URL:
-    """Represents an url
+def clean_urls(urls, keep_blank_values=True, keep_fragments=False, encoding='utf-8'):
+    """Cleans every url of the iterable in the same way as
+    `clean_url` and yields the results one by one so that
+    very large inputs never have to be held in memory. The
+    hosts, the paths and the query pairs of a crawl repeat a
+    lot, each distinct one is only cleaned once per batch
 
-    >>> instance URL('http://example.com')
+    >>> result = clean_urls(['http://example.com/?b=1&a=2'])
+    ... list(result)
+    ... ['http://example.com/?a=2&b=1']
     """
+    url_strip = utilities.url_strip
+    quoter = quoting.COMPONENT_QUOTER
+
+    netlocs = {}
+    paths = {}
+    pairs = {}
+
+    def clean_netloc(value):
+        encoded_netloc = hosts.IDNA_ENCODER(value)
+        if encoded_netloc is not None:
+            value = encoded_netloc.decode()
+        return value.lower().rstrip(':')
+
+    def clean_path(value):
+        value = quoter(value.encode('utf8'))
+        return quoter(utilities.unquote_path(value)) or '/'
+
+    def clean_pair(value):
+        # Quoting keeps "&" so each pair of the query can be parsed
+        # and encoded on its own, sorting is done on the names and
+        # values exactly as on the result of parse_qsl
+        key_values = parse_qsl(quoter(value), keep_blank_values=keep_blank_values)
+        return [
+            (key_value, urlencode((key_value,)))
+            for key_value in key_values
+        ]
+
+    for url in urls:
+        if isinstance(url, str):
+            url = url_strip(url)
+
+        scheme, netloc, path, params, query, fragment = urlparse(url)
+
+        # The same encoding fallback as clean_url
+        try:
+            query_bytes = query.encode(encoding)
+            fragment_bytes = fragment.encode(encoding)
+        except UnicodeError:
+            query_bytes = query.encode('utf-8')
+            fragment_bytes = fragment.encode('utf-8')
+
+        clean_netloc_value = netlocs.get(netloc)
+        if clean_netloc_value is None:
+            clean_netloc_value = netlocs[netloc] = clean_netloc(netloc)
+
+        clean_path_value = paths.get(path)
+        if clean_path_value is None:
+            clean_path_value = paths[path] = clean_path(path)
+
+        key_values = []
+        for item in query_bytes.split(b'&'):
+            item_key_values = pairs.get(item)
+            if item_key_values is None:
+                item_key_values = pairs[item] = clean_pair(item)
+            key_values.extend(item_key_values)
+        key_values.sort()
+
+        yield urlunparse(
+            (
+                scheme,
+                clean_netloc_value,
+                clean_path_value,
+                quoter(params.encode('utf8')),
+                '&'.join(encoded for _, encoded in key_values),
+                quoter(fragment_bytes) if keep_fragments else ''
+            )
+        )
+
+
+# Opt-in memoized versions of the functions above for link
+# graphs where the same urls get normalized over and over.
+# Statistics are available with `cached_clean_url.cache.stats`
+
+cached_safe_url_string = CachedFunction(safe_url_string, maxsize=50000)
 
-    def __init__(self, url_string):
-        self.raw_url = url_string
-        self.url_object = urlparse(self.raw_url)
+
+cached_clean_url = CachedFunction(clean_url, maxsize=50000)
+
+
+class BaseURL:
+    """Behaviour shared by the different representations
+    of an url. Subclasses provide `raw_url`, `netloc`
+    and `path`"""
+
+    __slots__ = ()
 
     def __repr__(self):
-        return f'<URL: {self.raw_url}>'
+        return f'<{self.__class__.__name__}: {self.raw_url}>'
 
     def __str__(self):
         return self.raw_url
 
-    def __eq__(self, obj):
-        return self.raw_url == obj
-
-    def __add__(self, obj):
-        return URL(urljoin(self.raw_url, obj))
-
     def __contains__(self, obj):
         return obj in self.raw_url
 
-    def __hash__(self):
-        return hash((self.raw_url, self.url_object.path))
-
     def __len__(self):
         return len(self.raw_url)
 
@@ -320,56 +492,18 @@ class URL:
             self.raw_url.startswith('https://')
         ])
 
-    @property
-    def has_fragment(self):
-        return any([
-            self.url_object.fragment != '',
-            self.raw_url.endswith('#')
-        ])
-
-    # @property
-    # def is_file(self):
-    #     path = PROJECT_PATH / 'data/file_extensions.txt'
-    #     file_extensions = read_document(path, as_list=True)
-    #     extension = self.as_path.suffix
-
-    #     if extension == '':
-    #         return False
-
-    #     if self.as_path.suffix in file_extensions:
-    #         return True
-    #     return False
-
-    @property
-    def as_path(self):
-        return pathlib.Path(self.raw_url)
-
-    @property
-    def get_extension(self):
-        if self.is_file:
-            return self.as_path.suffix
-        return None
-
     @property
     def url_stem(self):
         return self.as_path.stem
 
-    @property
-    def is_secured(self):
-        return self.url_object.scheme == 'https'
-
     @classmethod
     def create(cls, url):
         return cls(url)
-    
-    def is_same_domain(self, url):
-        incoming_url_object = urlparse(url)
-        return incoming_url_object.netloc == self.url_object.netloc
 
-    def get_status(self):
-        headers = {'User-Agent': RANDOM_USER_AGENT()}
-        response = requests.get(self.raw_url, headers=headers)
-        return response.ok, response.status_code
+    def is_same_domain(self, url):
+        if isinstance(url, BaseURL):
+            return url.netloc == self.netloc
+        return parser.get_netloc(url) == self.netloc
 
     def compare(self, url_to_compare):
         """Checks that the given url has the same path
@@ -378,13 +512,16 @@ class URL:
         >>> instance = URL('http://example.com/a')
         ... instance.compare('http://example.com/a')
         """
-        if isinstance(url_to_compare, str):
-            url_to_compare = self.create(url_to_compare)
+        if isinstance(url_to_compare, BaseURL):
+            path_to_compare = url_to_compare.path
+        else:
+            path_to_compare = parser.get_path(url_to_compare)
 
+        path = self.path
         logic = [
-            self.url_object.path == url_to_compare.url_object.path,
-            url_to_compare.url_object.path == '/' and self.url_object.path == '',
-            self.url_object.path == '/' and url_to_compare.url_object.path == ''
+            path == path_to_compare,
+            path_to_compare == '/' and path == '',
+            path == '/' and path_to_compare == ''
         ]
         return any(logic)
 
@@ -396,7 +533,7 @@ class URL:
         ... result.group(1)
         ... "/a'
         """
-        result = re.search(regex, self.raw_url)
+        result = patterns.compile_pattern(regex).search(self.raw_url)
         if result:
             return result
         return False
@@ -409,7 +546,7 @@ class URL:
         ... instance.test_url('a')
         ... True
         """
-        whole_url_search = re.search(regex, self.raw_url)
+        whole_url_search = patterns.compile_pattern(regex).search(self.raw_url)
         if whole_url_search:
             return True
         return False
@@ -422,7 +559,7 @@ class URL:
         ... instance.test_path(r'\/a')
         ... True
         """
-        path_search = re.search(regex, self.url_object.path)
+        path_search = patterns.compile_pattern(regex).search(self.path)
         if path_search:
             return True
         return False
@@ -434,7 +571,7 @@ class URL:
         ... instance.decompose_path(exclude=[])
         ... ["a", "b"]
         """
-        result = self.url_object.path.split('/')
+        result = self.path.split('/')
 
         def clean_values(value):
             if value == '':
@@ -443,3 +580,192 @@ class URL:
                 return True
             return False
         return list(filter(clean_values, result))
+
+
+class URL(BaseURL):
+    """Represents an url
+
+    >>> instance URL('http://example.com')
+    """
+
+    def __init__(self, url_string):
+        self.raw_url = url_string
+        # The url is only tokenized once and its
+        # components are sliced from it on demand
+        self.stripped_url = parser.strip_url(url_string)
+        self.offsets = parser.url_offsets(self.stripped_url)
+
+    def __eq__(self, obj):
+        return self.raw_url == obj
+
+    def __add__(self, obj):
+        return URL(urljoin(self.raw_url, obj))
+
+    def __hash__(self):
+        # Same hash as FrozenURL and as the raw
+        # url since they compare equal to it
+        return hash(self.raw_url)
+
+    @cached_property
+    def url_object(self):
+        return urlparse(self.raw_url)
+
+    @property
+    def scheme(self):
+        return self.stripped_url[:self.offsets[0]].lower()
+
+    @property
+    def netloc(self):
+        return self.stripped_url[self.offsets[1]:self.offsets[2]]
+
+    @property
+    def path(self):
+        return self.stripped_url[self.offsets[2]:self.offsets[3]]
+
+    @property
+    def params(self):
+        return self.stripped_url[self.offsets[3] + 1:self.offsets[4]]
+
+    @property
+    def query(self):
+        return self.stripped_url[self.offsets[4] + 1:self.offsets[5]]
+
+    @property
+    def fragment(self):
+        return self.stripped_url[self.offsets[5] + 1:]
+
+    @property
+    def has_fragment(self):
+        return self.offsets[5] < len(self.stripped_url)
+
+    # @property
+    # def is_file(self):
+    #     path = PROJECT_PATH / 'data/file_extensions.txt'
+    #     file_extensions = read_document(path, as_list=True)
+    #     extension = self.as_path.suffix
+
+    #     if extension == '':
+    #         return False
+
+    #     if self.as_path.suffix in file_extensions:
+    #         return True
+    #     return False
+
+    @cached_property
+    def as_path(self):
+        return pathlib.Path(self.raw_url)
+
+    @property
+    def get_extension(self):
+        if self.is_file:
+            return self.as_path.suffix
+        return None
+
+    @property
+    def is_secured(self):
+        return self.scheme == 'https'
+
+    def get_status(self, session=None):
+        """Returns if the response is ok and its status code. The
+        request goes through the given `SessionManager` or the one
+        picked up from `sessions.use_session` so that connections
+        are reused between calls"""
+        manager = session or sessions.get_session_manager()
+        headers = {'User-Agent': RANDOM_USER_AGENT(self.netloc)}
+        response = manager.get(self.raw_url, headers=headers)
+        return response.ok, response.status_code
+
+
+class FrozenURL(BaseURL):
+    """Memory compact and immutable representation of an url
+    meant to be held by the million. Only the raw url and the
+    positions of its components are stored, the scheme and the
+    netloc are interned so that urls from the same site share
+    them and the hash is the one of the raw url, which is
+    computed once and cached by the string itself. As with
+    `urlsplit`, the leading C0 controls and spaces and the
+    tabs and newlines are removed from the url, trailing
+    spaces are kept
+
+    >>> instance = FrozenURL('http://example.com/a')
+    ... instance.netloc
+    ... "example.com"
+    """
+
+    __slots__ = (
+        'raw_url', 'scheme', 'netloc', '_netloc_end',
+        '_params_start', '_path_end', '_query_end'
+    )
+
+    def __init__(self, url_string):
+        url_string = parser.strip_url(url_string)
+        offsets = parser.url_offsets(url_string)
+        scheme_end, netloc_start, netloc_end, params_start, path_end, query_end = offsets
+
+        set_attribute = object.__setattr__
+        set_attribute(self, 'raw_url', url_string)
+        set_attribute(
+            self,
+            'scheme',
+            sys.intern(url_string[:scheme_end].lower())
+        )
+        set_attribute(
+            self,
+            'netloc',
+            sys.intern(url_string[netloc_start:netloc_end])
+        )
+        set_attribute(self, '_netloc_end', netloc_end)
+        set_attribute(self, '_params_start', params_start)
+        set_attribute(self, '_path_end', path_end)
+        set_attribute(self, '_query_end', query_end)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f'{self.__class__.__name__} is immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError(f'{self.__class__.__name__} is immutable')
+
+    def __reduce__(self):
+        return (self.__class__, (self.raw_url,))
+
+    def __eq__(self, obj):
+        if isinstance(obj, BaseURL):
+            return self.raw_url == obj.raw_url
+        return self.raw_url == obj
+
+    def __hash__(self):
+        return hash(self.raw_url)
+
+    def __add__(self, obj):
+        return self.__class__(urljoin(self.raw_url, str(obj)))
+
+    @property
+    def path(self):
+        return self.raw_url[self._netloc_end:self._params_start]
+
+    @property
+    def params(self):
+        return self.raw_url[self._params_start + 1:self._path_end]
+
+    @property
+    def query(self):
+        return self.raw_url[self._path_end + 1:self._query_end]
+
+    @property
+    def fragment(self):
+        return self.raw_url[self._query_end + 1:]
+
+    @property
+    def has_fragment(self):
+        return self._query_end < len(self.raw_url)
+
+    @property
+    def is_secured(self):
+        return self.scheme == 'https'
+
+    @property
+    def as_path(self):
+        return pathlib.Path(self.raw_url)
+
+    def to_url(self):
+        return URL(self.raw_url)
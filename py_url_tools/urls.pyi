@@ -1,18 +1,33 @@
 import dataclasses
 import pathlib
 from re import Match
-from typing import Any, Literal, Type, Union
+from typing import Any, Iterable, Iterator, Literal, Optional, Type, Union
 from urllib.parse import ParseResult, ParseResultBytes
 
+from py_url_tools.cache import CachedFunction
+from py_url_tools.query import ParameterFilter
+from py_url_tools.sessions import SessionManager
+
+
+def safe_ascii_url(url: bytes, quote_path: bool = ...) -> Optional[str]: ...
+
 
 def safe_url_string(
-    url: str,
+    url: Union[str, bytes, memoryview],
     encoding: str = Literal['utf-8'],
     path_encoding: str = Literal['utf-8'],
     quote_path: bool = ...
 ) -> str: ...
 
 
+def safe_url_bytes(
+    url: Union[str, bytes, memoryview],
+    encoding: str = Literal['utf-8'],
+    path_encoding: str = Literal['utf-8'],
+    quote_path: bool = ...
+) -> bytes: ...
+
+
 def safe_download_url(
     url: str, encoding: str = Literal['utf-8'], path_encoding: str = Literal['utf-8']) -> str: ...
 
@@ -40,7 +55,7 @@ class URLParameter:
 
 def clean_url_query_parameters(
     url: str,
-    names: list = ...,
+    names: Union[list, tuple, set, frozenset, ParameterFilter] = ...,
     separator: str = Literal['&'],
     key_value_separator: str = Literal['='],
     unique: bool = True,
@@ -68,23 +83,68 @@ def clean_url(
 ) -> str: ...
 
 
-class URL:
+def clean_urls(
+    urls: Iterable[str],
+    keep_blank_values: bool = True,
+    keep_fragments: bool = False,
+    encoding: str = Literal['utf-8']
+) -> Iterator[str]: ...
+
+
+cached_safe_url_string: CachedFunction = ...
+
+
+cached_clean_url: CachedFunction = ...
+
+
+class BaseURL:
     raw_url: str = ...
-    url_object: ParseResult = ...
+    netloc: str = ...
+    path: str = ...
 
-    def __init__(self, url_string: str): ...
     def __repr__(self) -> str: ...
     def __str__(self) -> str: ...
-    def __eq__(self, obj) -> bool: ...
-    def __add__(self, obj: Union[str, URL]) -> str: ...
-    def __contains__(self, obj: Union[str, URL]) -> bool: ...
-    def __hash__(self) -> int: ...
+    def __contains__(self, obj: Union[str, BaseURL]) -> bool: ...
     def __len__(self) -> int: ...
     @property
     def is_path(self) -> bool: ...
     @property
     def is_valid(self) -> bool: ...
     @property
+    def url_stem(self) -> str: ...
+    @classmethod
+    def create(cls, url: str) -> BaseURL: ...
+    def is_same_domain(self, url: Union[str, BaseURL]) -> bool: ...
+    def compare(self, url_to_compare: Union[str, BaseURL]) -> bool: ...
+    def capture(self, regex: str) -> Union[Match, bool]: ...
+    def test_url(self, regex: str) -> bool: ...
+    def test_path(self, regex: str) -> bool: ...
+    def decompose_path(self, exclude: list = ...) -> list[str]: ...
+
+
+class URL(BaseURL):
+    stripped_url: str = ...
+    offsets: tuple[int, int, int, int, int, int] = ...
+
+    def __init__(self, url_string: str): ...
+    def __eq__(self, obj) -> bool: ...
+    def __add__(self, obj: Union[str, URL]) -> URL: ...
+    def __hash__(self) -> int: ...
+    @property
+    def url_object(self) -> ParseResult: ...
+    @property
+    def scheme(self) -> str: ...
+    @property
+    def netloc(self) -> str: ...
+    @property
+    def path(self) -> str: ...
+    @property
+    def params(self) -> str: ...
+    @property
+    def query(self) -> str: ...
+    @property
+    def fragment(self) -> str: ...
+    @property
     def has_fragment(self) -> bool: ...
     @property
     def is_file(self) -> bool: ...
@@ -93,12 +153,30 @@ class URL:
     @property
     def get_extension(self) -> Union[str, None]: ...
     @property
-    def url_stem(self) -> str: ...
-    @classmethod
-    def create(cls, url: str) -> Type[URL]: ...
-    def is_same_domain(self, url: str) -> bool: ...
-    def get_status(self) -> Union[bool, int]: ...
-    def compare(self, url_to_compare: str) -> bool: ...
-    def capture(self, regex: str) -> Union[Match, bool]: ...
-    def test_path(self, regex: str) -> bool: ...
-    def decompose_path(self, exclude: list = ...) -> list[str]: ...
+    def is_secured(self) -> bool: ...
+    def get_status(self, session: SessionManager = ...) -> Union[bool, int]: ...
+
+
+class FrozenURL(BaseURL):
+    scheme: str = ...
+    netloc: str = ...
+
+    def __init__(self, url_string: str): ...
+    def __eq__(self, obj) -> bool: ...
+    def __hash__(self) -> int: ...
+    def __add__(self, obj: Union[str, BaseURL]) -> FrozenURL: ...
+    @property
+    def path(self) -> str: ...
+    @property
+    def params(self) -> str: ...
+    @property
+    def query(self) -> str: ...
+    @property
+    def fragment(self) -> str: ...
+    @property
+    def has_fragment(self) -> bool: ...
+    @property
+    def is_secured(self) -> bool: ...
+    @property
+    def as_path(self) -> pathlib.Path: ...
+    def to_url(self) -> URL: ...
@@ -1,11 +1,21 @@
-import random
+import codecs
 from functools import lru_cache, wraps
-from urllib.parse import (ParseResult, _coerce_args, quote, unquote_to_bytes,
-                          urlparse)
+from urllib.parse import ParseResult, unquote_to_bytes, urlparse
 
-from kryptone.conf import settings
-from kryptone.utils.file_readers import read_document
-from py_url_tools import PROJECT_PATH, constants
+from py_url_tools import PROJECT_PATH, agents, constants, hosts, quoting
+
+
+def percent_code(error):
+    """Error handler that percent encodes the bytes
+    that cannot be decoded instead of losing them"""
+    if not isinstance(error, UnicodeDecodeError):
+        raise error
+
+    invalid = error.object[error.start:error.end]
+    return ''.join(f'%{byte:02X}' for byte in invalid), error.end
+
+
+codecs.register_error('percentcode', percent_code)
 
 
 def string_to_unicode(text, encoding='utf-8', errors='strict'):
@@ -21,12 +31,14 @@ def unicode_to_string(text, encoding='utf-8', errors='strict'):
 
 
 def convert_to_unicode(text, encoding='utf-8', errors='strict'):
-    if not isinstance(text, (bytes, str)):
-        raise
-
     if isinstance(text, str):
         return text
-    return text.decode(encoding=encoding, errors=errors)
+
+    # Memoryviews and bytearrays, e.g. the lines of
+    # a memory mapped file, are decoded without a copy
+    if not isinstance(text, (bytes, bytearray, memoryview)):
+        raise TypeError(f'Expected str or bytes, got {type(text).__name__}')
+    return str(text, encoding, errors)
 
 
 def convert_to_bytes(text, encoding='utf-8', errors='strict'):
@@ -35,6 +47,17 @@ def convert_to_bytes(text, encoding='utf-8', errors='strict'):
     return text.encode(encoding=encoding, errors=errors)
 
 
+@lru_cache(maxsize=32)
+def is_ascii_compatible(encoding):
+    """Tells if the encoding encodes the ASCII
+    characters as themselves, like UTF-8 or latin-1"""
+    try:
+        encoded = constants.ASCII_CHARACTERS.encode(encoding)
+    except LookupError:
+        return False
+    return encoded == constants.ASCII_CHARACTERS.encode('ascii')
+
+
 def url_strip(value):
     result = value.strip(constants.C0_CONTROL_OR_SPACE)
     return result.translate(constants.ASCII_TAB_OR_NEWLINE_TRANSLATION_TABLE)
@@ -45,19 +68,17 @@ class SafeParser:
         if not isinstance(value, ParseResult):
             value = urlparse(value)
 
-        try:
-            netloc = value.netloc.encode('idna').decode()
-        except UnicodeError:
-            netloc = value.netloc
+        netloc = hosts.IDNA_ENCODER(value.netloc)
+        netloc = value.netloc if netloc is None else netloc.decode()
 
-        path_safe_characters = constants.PATH_SAFE_CHARACTERS
+        quoter = quoting.COMPONENT_QUOTER
         self.url_parts = (
             value.scheme,
             netloc,
-            quote(value.path.encode(path_encoding), path_safe_characters),
-            quote(value.params.encode(path_encoding), path_safe_characters),
-            quote(value.query.encode(encoding), path_safe_characters),
-            quote(value.fragment.encode(encoding), path_safe_characters)
+            quoter(value.path.encode(path_encoding)),
+            quoter(value.params.encode(path_encoding)),
+            quoter(value.query.encode(encoding)),
+            quoter(value.fragment.encode(encoding))
         )
 
     @property
@@ -74,38 +95,101 @@ def unquote_path(path):
     return unquote_to_bytes(path)
 
 
+def unquote_query_bytes(value):
+    """Unquotes a name or a value of a query, the
+    work is skipped when there is nothing to unquote"""
+    if b'+' in value:
+        value = value.replace(b'+', b' ')
+    if b'%' in value:
+        value = unquote_to_bytes(value)
+    return value
+
+
+def iter_qsl_bytes(qs, keep_blank_values=False):
+    """Yields the name and the value of each pair of the
+    query as bytes. The query is scanned for the next "&" or
+    ";" as the pairs are consumed, nothing is built for the
+    pairs that come after so the first one is available in
+    constant time whatever the length of the query. The pairs
+    are only unquoted when they contain a "+" or a "%"
+
+    >>> list(iter_qsl_bytes(b'a=1&b=%20'))
+    ... [(b'a', b'1'), (b'b', b' ')]
+    """
+    if isinstance(qs, str):
+        qs = qs.encode('utf-8')
+
+    find = qs.find
+    length = len(qs)
+
+    ampersand = find(b'&')
+    if ampersand < 0:
+        ampersand = length
+
+    semicolon = find(b';')
+    if semicolon < 0:
+        semicolon = length
+
+    start = 0
+    while start < length:
+        # Only the position of the separator that was
+        # reached is searched again, further in the query
+        if ampersand < semicolon:
+            end = ampersand
+            ampersand = find(b'&', end + 1)
+            if ampersand < 0:
+                ampersand = length
+        else:
+            end = semicolon
+            if end < length:
+                semicolon = find(b';', end + 1)
+                if semicolon < 0:
+                    semicolon = length
+
+        pair = qs[start:end]
+        start = end + 1
+        if not pair:
+            continue
+
+        name, _, value = pair.partition(b'=')
+        if not value and not keep_blank_values:
+            continue
+
+        if b'+' in pair or b'%' in pair:
+            yield unquote_query_bytes(name), unquote_query_bytes(value)
+        else:
+            yield name, value
+
+
 def parse_qsl_to_bytes(qs, keep_blank_values=False):
-    """Works as `parse_qsl` but return the values as bytes
+    """Works as `parse_qsl` but return the values as bytes. All
+    the pairs are needed so the query is split at once instead
+    of being scanned lazily as in `iter_qsl_bytes`
 
     >>> url = 'http://www.example.org/something/here?google=1&a=2'
     ... result = parse_qsl_to_bytes(url)
     ... [(b'google', b'1'), (b'a', b'2')]
     """
-    qs, coerced_result = _coerce_args(qs)
-    pairs = [s2 for s1 in qs.split('&') for s2 in s1.split(';')]
-    # print(pairs)
+    if isinstance(qs, str):
+        qs = qs.encode('utf-8')
+
+    if b';' in qs:
+        qs = qs.replace(b';', b'&')
 
-    final_result = []
-    for pair in pairs:
+    result = []
+    for pair in qs.split(b'&'):
         if not pair:
             continue
 
-        items = pair.split('=', 1)
-        if len(items) != 2:
-            if keep_blank_values:
-                items.append('')
-            else:
-                continue
+        name, _, value = pair.partition(b'=')
+        if not value and not keep_blank_values:
+            continue
 
-        if len(items[1]) or keep_blank_values:
-            name = items[0].replace('+', ' ')
-            name = unquote_to_bytes(name)
-            name = coerced_result(name)
-            value = items[1].replace('+', ' ')
-            value = unquote_to_bytes(value)
-            value = coerced_result(value)
-            final_result.append((name, value))
-    return final_result
+        if b'+' in pair or b'%' in pair:
+            result.append((unquote_query_bytes(name), unquote_query_bytes(value)))
+        else:
+            result.append((name, value))
+    return result
 
 
 def lazy(func, *items):
@@ -185,20 +269,12 @@ def tokenize(func):
 @tokenize
 def read_document(filename):
     """Reads a document of some sort"""
-    path = PROJECT_PATH / 'data'
+    path = PROJECT_PATH / 'data' / filename
     with open(path, mode='r', encoding='utf-8') as f:
         data = f.read()
     return data
 
 
-def random_user_agent(func):
-    def wrapper():
-        data = func(
-            PROJECT_PATH / 'data/user_agents.txt'
-        )
-        user_agents = data.split('\n')
-        return random.choice(user_agents)
-    return wrapper
-
-
-RANDOM_USER_AGENT = random_user_agent(read_document)
+# Kept for backwards compatibility, the user
+# agents are now held by `agents.UserAgentPool`
+RANDOM_USER_AGENT = agents.random_user_agent
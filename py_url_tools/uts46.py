@@ -0,0 +1,211 @@
+"""Host processing following UTS-46, https://www.unicode.org/reports/tr46/
+
+The mapping of the code points is not read from IdnaMappingTable.txt but
+computed on demand as NFKC_Casefold with `unicodedata`, corrected by the
+small tables below for the code points where both differ. The results
+therefore follow the Unicode version of the interpreter, 14.0 for Python
+3.11 and 15.0 for Python 3.12: code points assigned in later versions
+are rejected as unassigned and the tables are only checked up to
+Unicode 15.1.
+"""
+
+import unicodedata
+
+FULL_STOPS = frozenset({'\u3002', '\uff0e', '\uff61'})
+
+
+DEVIATIONS = {
+    '\u00df': 'ss',
+    '\u03c2': '\u03c3',
+    '\u200c': '',
+    '\u200d': ''
+}
+
+
+# Code points whose mapping is not their NFKC_Casefold,
+# U+1E9E (ẞ) becomes ß which is then a deviation
+MAPPING_EXCEPTIONS = {
+    '\u1e9e': '\u00df'
+}
+
+
+# Ranges of code points that NFKC_Casefold maps to allowed
+# characters but that are disallowed by the mapping table
+DISALLOWED_RANGES = (
+    (0x04C0, 0x04C0),
+    (0x10A0, 0x10C5),
+    (0x115F, 0x1160),
+    (0x17B4, 0x17B5),
+    (0x1806, 0x1806),
+    (0x180E, 0x180E),
+    (0x2024, 0x2026),
+    (0x2132, 0x2132),
+    (0x2183, 0x2183),
+    (0x2488, 0x249B),
+    (0x2FF0, 0x2FFB),
+    (0x3164, 0x3164),
+    (0x33C2, 0x33C2),
+    (0x33C7, 0x33C7),
+    (0x33D8, 0x33D8),
+    (0xFE12, 0xFE12),
+    (0xFE19, 0xFE19),
+    (0xFE30, 0xFE30),
+    (0xFE52, 0xFE52),
+    (0xFFA0, 0xFFA0),
+    (0xFFFC, 0xFFFD),
+    (0x1F100, 0x1F100),
+    (0x2F868, 0x2F868),
+    (0x2F874, 0x2F874),
+    (0x2F91F, 0x2F91F),
+    (0x2F95F, 0x2F95F),
+    (0x2F9BF, 0x2F9BF)
+)
+
+
+# Ranges of code points removed from the labels
+IGNORED_RANGES = (
+    (0x00AD, 0x00AD),
+    (0x034F, 0x034F),
+    (0x180B, 0x180F),
+    (0x200B, 0x200B),
+    (0x2060, 0x2060),
+    (0x2064, 0x2064),
+    (0xFE00, 0xFE0F),
+    (0xFEFF, 0xFEFF),
+    (0x1BCA0, 0x1BCA3),
+    (0xE0100, 0xE01EF)
+)
+
+
+DISALLOWED_CATEGORIES = frozenset({'Cc', 'Cf', 'Cn', 'Co', 'Cs', 'Zl', 'Zp', 'Zs'})
+
+
+ACE_PREFIX = 'xn--'
+
+
+# Mapping of the non ASCII code points seen so far. It is
+# filled on demand from unicodedata instead of being loaded
+# from the 9000 lines of IdnaMappingTable.txt at import.
+# None marks the code points that are not allowed in hosts
+CHARACTER_MAPPING = {}
+
+
+def in_ranges(code_point, ranges):
+    for start, end in ranges:
+        if start <= code_point <= end:
+            return True
+    return False
+
+
+def is_ignored(code_point):
+    return in_ranges(code_point, IGNORED_RANGES)
+
+
+def is_disallowed(code_point):
+    return in_ranges(code_point, DISALLOWED_RANGES)
+
+
+def build_mapping(character):
+    """Returns what the UTS-46 mapping turns a non ASCII character
+    into, NFKC_Casefold, or None when it is disallowed"""
+    if character in FULL_STOPS:
+        return '.'
+
+    code_point = ord(character)
+    if is_disallowed(code_point):
+        return None
+
+    if is_ignored(code_point):
+        return ''
+
+    mapped = unicodedata.normalize('NFKC', character).casefold()
+    mapped = unicodedata.normalize('NFKC', mapped)
+    for item in mapped:
+        if item.isascii():
+            continue
+        if item in DEVIATIONS:
+            continue
+        if unicodedata.category(item) in DISALLOWED_CATEGORIES:
+            return None
+    return mapped
+
+
+def map_host(host, transitional=False):
+    """Applies the mapping step of UTS-46 and normalizes
+    the result to NFC. The deviations (ß, ς, ZWJ and ZWNJ)
+    are kept as is unless `transitional` is set"""
+    characters = []
+    for character in host:
+        if character.isascii():
+            characters.append(character.lower())
+            continue
+
+        character = MAPPING_EXCEPTIONS.get(character, character)
+        if transitional and character in DEVIATIONS:
+            characters.append(DEVIATIONS[character])
+            continue
+
+        if character in DEVIATIONS:
+            characters.append(character)
+            continue
+
+        try:
+            mapped = CHARACTER_MAPPING[character]
+        except KeyError:
+            mapped = CHARACTER_MAPPING[character] = build_mapping(character)
+
+        if mapped is None:
+            raise UnicodeError(f'{character!r} is not allowed in a host')
+        characters.append(mapped)
+    return unicodedata.normalize('NFC', ''.join(characters))
+
+
+def check_label(label, check_hyphens=False):
+    if check_hyphens:
+        if label[2:4] == '--':
+            raise UnicodeError(f'{label!r} has hyphens in third and fourth positions')
+        if label.startswith('-') or label.endswith('-'):
+            raise UnicodeError(f'{label!r} starts or ends with an hyphen')
+
+    if unicodedata.category(label[0]).startswith('M'):
+        raise UnicodeError(f'{label!r} starts with a combining mark')
+
+
+def to_ascii(host, transitional=False, check_hyphens=False, verify_dns_length=False):
+    """Converts a host to its ASCII form following UTS-46, the
+    processing used by browsers and IDNA2008 registries. Unlike
+    the IDNA2003 codec of the standard library, labels longer than
+    63 characters are accepted unless `verify_dns_length` is set.
+    The defaults are the ones of the WHATWG url standard, the
+    Bidi and ContextJ rules are not checked
+
+    >>> to_ascii('Faß.de')
+    ... b'xn--fa-hia.de'
+    """
+    labels = map_host(host, transitional=transitional).split('.')
+
+    result = []
+    for label in labels:
+        if label.isascii():
+            if label.startswith(ACE_PREFIX):
+                # Make sure the label can be decoded
+                label[4:].encode('ascii').decode('punycode')
+            elif label:
+                check_label(label, check_hyphens=check_hyphens)
+            result.append(label)
+            continue
+
+        check_label(label, check_hyphens=check_hyphens)
+        result.append(ACE_PREFIX + label.encode('punycode').decode('ascii'))
+
+    if verify_dns_length:
+        checked = result
+        if len(result) > 1 and result[-1] == '':
+            # The root label is allowed to be empty
+            checked = result[:-1]
+        for label in checked:
+            if not 0 < len(label) < 64:
+                raise UnicodeError(f'{label!r} is empty or too long')
+        if len('.'.join(checked)) > 253:
+            raise UnicodeError('The host is too long')
+    return '.'.join(result).encode('ascii')
@@ -0,0 +1,50 @@
+from typing import Optional
+
+FULL_STOPS: frozenset[str] = ...
+
+
+DEVIATIONS: dict[str, str] = ...
+
+
+MAPPING_EXCEPTIONS: dict[str, str] = ...
+
+
+DISALLOWED_RANGES: tuple[tuple[int, int], ...] = ...
+
+
+IGNORED_RANGES: tuple[tuple[int, int], ...] = ...
+
+
+DISALLOWED_CATEGORIES: frozenset[str] = ...
+
+
+ACE_PREFIX: str = ...
+
+
+CHARACTER_MAPPING: dict[str, Optional[str]] = ...
+
+
+def in_ranges(code_point: int, ranges: tuple[tuple[int, int], ...]) -> bool: ...
+
+
+def is_ignored(code_point: int) -> bool: ...
+
+
+def is_disallowed(code_point: int) -> bool: ...
+
+
+def build_mapping(character: str) -> Optional[str]: ...
+
+
+def map_host(host: str, transitional: bool = ...) -> str: ...
+
+
+def check_label(label: str, check_hyphens: bool = ...) -> None: ...
+
+
+def to_ascii(
+    host: str,
+    transitional: bool = ...,
+    check_hyphens: bool = ...,
+    verify_dns_length: bool = ...
+) -> bytes: ...
@@ -0,0 +1,68 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def send(self, status_code, headers=None):
+        body = b'' if self.command == 'HEAD' else b'body'
+        self.send_response(status_code)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def handle_request(self):
+        server = self.server
+        with server.lock:
+            server.requests.append((self.command, self.path, self.headers.get('User-Agent')))
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+
+        try:
+            if self.path == '/ok':
+                self.send(200)
+            elif self.path == '/no-head':
+                self.send(405 if self.command == 'HEAD' else 200)
+            elif self.path == '/redirect':
+                self.send(301, {'Location': '/ok'})
+            elif self.path == '/loop':
+                self.send(302, {'Location': '/loop'})
+            elif self.path == '/slow':
+                time.sleep(1)
+                self.send(200)
+            elif self.path.startswith('/busy'):
+                time.sleep(0.05)
+                self.send(200)
+            else:
+                self.send(404)
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    do_HEAD = handle_request
+    do_GET = handle_request
+
+
+@pytest.fixture
+def server():
+    instance = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    instance.daemon_threads = True
+    instance.lock = threading.Lock()
+    instance.requests = []
+    instance.active = 0
+    instance.max_active = 0
+
+    thread = threading.Thread(target=instance.serve_forever, daemon=True)
+    thread.start()
+    yield instance
+    instance.shutdown()
+    instance.server_close()
@@ -0,0 +1,125 @@
+"""Url generators and reference implementations shared by the
+tests. The benchmarks keep their own copies so that the tests
+do not depend on the benchmark scripts"""
+
+import fnmatch
+import random
+from urllib.parse import _coerce_args, unquote_to_bytes
+
+HOSTS = (
+    'example.com', 'www.shop.example.com', 'blog.example.org', 'news.example.co.uk',
+    'bücher.example', 'münchen.example.de', 'api.example.io', 'cdn.example.net'
+)
+
+
+PATH_SEGMENTS = (
+    'products', 'category', 'blog', 'article', 'search', 'user', 'images',
+    'café', 'résumé', 'a b', 'index.html', '2024', 'page'
+)
+
+
+PARAMETERS = (
+    'id', 'page', 'sort', 'q', 'lang', 'ref', 'session', 'color', 'size',
+    'utm_source', 'utm_medium', 'utm_campaign', 'gclid', 'fbclid', 'mc_cid'
+)
+
+
+VALUES = ('1', '42', 'price', 'café', 'a b', 'x%20y', '', 'newsletter', 'abc123')
+
+
+def generate_urls(count, seed=0):
+    """Returns urls looking like the ones of a crawl: many
+    hosts, tracking parameters, some non ASCII paths and hosts
+    and some fragments"""
+    generator = random.Random(seed)
+    result = []
+    for _ in range(count):
+        host = generator.choice(HOSTS)
+        if generator.random() < 0.5:
+            host = f'site{generator.randint(0, 2000)}.{host}'
+
+        path = '/'.join(
+            generator.choice(PATH_SEGMENTS)
+            for _ in range(generator.randint(0, 4))
+        )
+        query = '&'.join(
+            f'{generator.choice(PARAMETERS)}={generator.choice(VALUES)}'
+            for _ in range(generator.randint(0, 6))
+        )
+
+        scheme = 'https' if generator.random() < 0.8 else 'http'
+        url = f'{scheme}://{host}/{path}'
+        if query:
+            url = f'{url}?{query}'
+        if generator.random() < 0.1:
+            url = f'{url}#section-{generator.randint(0, 9)}'
+        result.append(url)
+    return result
+
+
+def random_urls(count, alphabet, seed=0, size=12, schemes=()):
+    """Yields strings made of up to `size` tokens of the alphabet,
+    most of them start with one of the schemes when given"""
+    generator = random.Random(seed)
+    for _ in range(count):
+        length = generator.randint(0, size)
+        url = ''.join(generator.choice(alphabet) for _ in range(length))
+        if schemes and generator.random() < 0.7:
+            url = generator.choice(schemes) + url
+        yield url
+
+
+def outcome(function, *args, **kwargs):
+    """Returns the result of the call or the type of
+    the exception it raised so that both can be compared"""
+    try:
+        return function(*args, **kwargs)
+    except Exception as e:
+        return type(e)
+
+
+def reference_parse_qsl_to_bytes(qs, keep_blank_values=False):
+    """The implementation of `parse_qsl_to_bytes` before the
+    query was parsed as bytes"""
+    qs, coerced_result = _coerce_args(qs)
+    pairs = [s2 for s1 in qs.split('&') for s2 in s1.split(';')]
+
+    final_result = []
+    for pair in pairs:
+        if not pair:
+            continue
+
+        items = pair.split('=', 1)
+        if len(items) != 2:
+            if keep_blank_values:
+                items.append('')
+            else:
+                continue
+
+        if len(items[1]) or keep_blank_values:
+            name = coerced_result(unquote_to_bytes(items[0].replace('+', ' ')))
+            value = coerced_result(unquote_to_bytes(items[1].replace('+', ' ')))
+            final_result.append((name, value))
+    return final_result
+
+
+def reference_strip(url, rules):
+    """Removes the parameters of the query whose name
+    matches one of the rules by testing each of them"""
+    base, question_mark, rest = url.partition('?')
+    if not question_mark:
+        return url
+
+    query, hash_mark, fragment = rest.partition('#')
+    kept = [
+        token for token in query.split('&')
+        if token and not any(
+            fnmatch.fnmatchcase(token.partition('=')[0], rule)
+            for rule in rules
+        )
+    ]
+    if kept:
+        base = f"{base}?{'&'.join(kept)}"
+    if hash_mark:
+        base = f'{base}#{fragment}'
+    return base
@@ -0,0 +1,41 @@
+import collections
+
+import pytest
+
+from py_url_tools.agents import UserAgentPool, get_user_agent_pool, random_user_agent
+
+
+def test_weighted_random():
+    pool = UserAgentPool(['a', 'b', 'c'], weights=[6, 3, 1], seed=1)
+    counts = collections.Counter(pool.pick() for _ in range(20000))
+    assert counts['a'] / 20000 == pytest.approx(0.6, abs=0.02)
+    assert counts['c'] / 20000 == pytest.approx(0.1, abs=0.02)
+
+
+def test_round_robin():
+    pool = UserAgentPool(['a', 'b', 'c'], strategy='round_robin')
+    assert [pool.pick() for _ in range(6)] == ['a', 'b', 'c', 'a', 'b', 'c']
+
+    weighted = UserAgentPool(['a', 'b'], weights=[3, 1], strategy='round_robin')
+    counts = collections.Counter(weighted.pick() for _ in range(1000))
+    assert counts['a'] == pytest.approx(750, abs=10)
+
+
+def test_sticky():
+    pool = UserAgentPool(['a', 'b', 'c', 'd'], strategy='sticky')
+    assert len({pool.pick('example.com') for _ in range(10)}) == 1
+    assert len({pool.pick(f'host{i}.com') for i in range(50)}) > 1
+
+
+def test_invalid_pools():
+    with pytest.raises(ValueError):
+        UserAgentPool([])
+    with pytest.raises(ValueError):
+        UserAgentPool(['a'], weights=[1, 2])
+    with pytest.raises(ValueError):
+        UserAgentPool(['a'], strategy='unknown')
+
+
+def test_bundled_pool():
+    assert len(get_user_agent_pool()) > 0
+    assert random_user_agent() in get_user_agent_pool().user_agents
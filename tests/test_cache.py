@@ -0,0 +1,147 @@
+import threading
+
+import pytest
+
+from py_url_tools import urls
+from py_url_tools.cache import CachedFunction, LRUCache
+from py_url_tools.hosts import HostEncoder
+
+
+def run_threads(target, count=8):
+    errors = []
+
+    def wrapper(number):
+        try:
+            target(number)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [
+        threading.Thread(target=wrapper, args=(number,))
+        for number in range(count)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return errors
+
+
+def test_lru_cache_eviction():
+    cache = LRUCache(maxsize=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1
+    cache.set('c', 3)
+    assert 'b' not in cache
+    assert cache.stats == {
+        'hits': 1,
+        'misses': 0,
+        'evictions': 1,
+        'size': 2,
+        'maxsize': 2
+    }
+
+    cache.resize(1)
+    assert list(cache.container) == ['c']
+
+
+def test_lru_cache_threads():
+    cache = LRUCache(maxsize=16)
+
+    def target(number):
+        for i in range(20000):
+            key = (number * 7 + i) % 64
+            if cache.get(key) is None:
+                cache.set(key, i)
+
+    assert run_threads(target) == []
+    assert len(cache) == 16
+    assert cache.hits + cache.misses == 8 * 20000
+
+
+def test_cached_function_threads():
+    function = CachedFunction(str.upper, maxsize=8)
+
+    def target(number):
+        for i in range(5000):
+            value = f'host{(number + i) % 32}'
+            assert function(value) == value.upper()
+
+    assert run_threads(target) == []
+
+
+def test_host_encoder_threads():
+    encoder = HostEncoder(maxsize=8)
+
+    def target(number):
+        for i in range(2000):
+            host = f'bücher{(number + i) % 32}.de'
+            assert encoder(host).startswith(b'xn--')
+
+    assert run_threads(target) == []
+
+
+def test_host_encoder_matches_idna_codec():
+    hosts = [
+        'example.com', 'EXAMPLE.com', 'bücher.example', 'a..b', '.example.com',
+        'a' * 63 + '.com', 'a' * 64 + '.com', 'xn--bcher-kva.example', '',
+        'münchen.de', 'exa mple.com', 'ex_ample.com', '例え.テスト'
+    ]
+    encoder = HostEncoder()
+    for _ in range(2):
+        for host in hosts:
+            try:
+                expected = host.encode('idna')
+            except UnicodeError:
+                expected = None
+            assert encoder(host) == expected, host
+
+    stats = encoder.stats
+    assert stats['ascii_hits'] > 0
+    assert stats['hits'] > 0
+    assert encoder.hit_rate > 0.5
+
+
+def test_cached_safe_url_string():
+    function = CachedFunction(urls.safe_url_string, maxsize=4)
+    for _ in range(3):
+        assert function('http://a.com/a b') == 'http://a.com/a%20b'
+        assert function('http://a.com/a b', quote_path=False) == 'http://a.com/a b'
+    assert function.cache.stats == {
+        'hits': 4,
+        'misses': 2,
+        'evictions': 0,
+        'size': 2,
+        'maxsize': 4
+    }
+    function.cache_clear()
+    assert len(function.cache) == 0
+
+
+def test_cached_function_keyword_arguments():
+    function = CachedFunction(lambda *args, **kwargs: (args, kwargs))
+    assert function('u', quote_path=False) == (('u',), {'quote_path': False})
+    assert function(('u',), (('quote_path', False),)) == (
+        (('u',), (('quote_path', False),)),
+        {}
+    )
+    assert function(b=1, a=2) is function(a=2, b=1)
+    assert len(function.cache) == 3
+
+
+@pytest.mark.parametrize('function, original, kwargs, expected', [
+    (urls.cached_safe_url_string, urls.safe_url_string, {'quote_path': False}, 'http://example.com/b c?y=1&x=2#f'),
+    (urls.cached_clean_url, urls.clean_url, {'keep_fragments': True}, 'http://example.com/b%20c?x=2&y=1#f')
+])
+def test_module_cached_functions(function, original, kwargs, expected):
+    url = 'http://Example.com/b c?y=1&x=2#f'
+    function.cache_clear()
+    try:
+        for _ in range(2):
+            assert function(url) == original(url)
+            assert function(url, **kwargs) == expected
+        assert function.cache.stats['hits'] == 2
+        assert function.cache.stats['size'] == 2
+    finally:
+        function.cache_clear()
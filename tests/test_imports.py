@@ -0,0 +1,24 @@
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = ('requests', 'urllib3', 'ssl', 'urllib.request', 'kryptone')
+
+
+@pytest.mark.parametrize('module', ['py_url_tools', 'py_url_tools.urls', 'py_url_tools.utilities'])
+def test_heavy_modules_are_not_imported(module):
+    # A fresh interpreter is needed since the
+    # tests themselves can import these modules
+    code = (
+        'import sys\n'
+        f'import {module}\n'
+        f'print(",".join(name for name in {HEAVY_MODULES!r} if name in sys.modules))'
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', code],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    assert result.stdout.strip() == ''
@@ -0,0 +1,46 @@
+import gzip
+
+import pytest
+
+from py_url_tools import parallel
+from py_url_tools.__main__ import main
+
+LINES = b'http://a.com/\xff\xfe x\nhttp://[::1/x\n\nhttp://b.com/ok\n'
+
+
+def run(tmp_path, *arguments, name='urls.txt'):
+    source = tmp_path / name
+    if name.endswith('.gz'):
+        source.write_bytes(gzip.compress(LINES))
+    else:
+        source.write_bytes(LINES)
+    output = tmp_path / 'clean.txt'
+    code = main([str(source), '-o', str(output), *arguments])
+    return code, output.read_text(encoding='utf-8').splitlines()
+
+
+@pytest.mark.parametrize('name', ['urls.txt', 'urls.txt.gz'])
+def test_invalid_lines_are_skipped(tmp_path, capsys, name):
+    code, lines = run(tmp_path, name=name)
+    assert code == 0
+    assert lines == ['http://a.com/%FF%FE%20x', 'http://b.com/ok']
+
+    errors = capsys.readouterr().err
+    assert "skipped 'http://[::1/x'" in errors
+    assert '2 urls from 4 lines (1 skipped)' in errors
+
+
+def test_strict_stops_on_invalid_line(tmp_path):
+    with pytest.raises(SystemExit):
+        run(tmp_path, '--strict', '-q')
+
+
+def test_canonicalize_many_skip_errors():
+    items = ['http://[::1/x', 'http://a.com/b c']
+    result = list(parallel.canonicalize_many(items, skip_errors=True))
+    assert isinstance(result[0], parallel.FailedURL)
+    assert result[0].url == 'http://[::1/x'
+    assert result[1] == 'http://a.com/b%20c'
+
+    with pytest.raises(ValueError):
+        list(parallel.canonicalize_many(items))
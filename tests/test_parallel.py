@@ -0,0 +1,33 @@
+import pytest
+
+from py_url_tools import parallel, urls
+from tests.helpers import generate_urls
+
+
+def test_chunked():
+    assert list(parallel.chunked([1, 2, 3], 2)) == [[1, 2], [3]]
+    assert list(parallel.chunked([], 2)) == []
+
+
+@pytest.mark.parametrize('ordered', [True, False])
+@pytest.mark.parametrize('function', [urls.clean_url, urls.safe_url_string])
+def test_canonicalize_many_workers(ordered, function):
+    items = generate_urls(300)
+    expected = [function(url) for url in items]
+    result = list(parallel.canonicalize_many(
+        items,
+        function=function,
+        workers=2,
+        chunk_size=50,
+        ordered=ordered,
+        in_process_threshold=100
+    ))
+    if ordered:
+        assert result == expected
+    else:
+        assert sorted(result) == sorted(expected)
+
+
+def test_invalid_chunk_size():
+    with pytest.raises(ValueError):
+        list(parallel.canonicalize_many(['http://a.com/'], chunk_size=0))
@@ -0,0 +1,95 @@
+from urllib.parse import urlparse
+
+import pytest
+
+from py_url_tools import parser
+from py_url_tools.arrays import URLArray, group_by_host
+from py_url_tools.urls import URL, FrozenURL
+from tests.helpers import random_urls
+
+ALPHABET = list('aZ09+-.:/?#;=&@[]% \t\n\r\x00\x1f') + [
+    'http:', 'https://', 'HTTP://', 'ftp://', 'mailto:', '//',
+    'example.com', 'user@', ':80', ';p=1', '?q=1', '#f', 'é'
+]
+
+
+def parse(url):
+    try:
+        return tuple(urlparse(url))
+    except ValueError as e:
+        return type(e)
+
+
+def test_split_url_matches_urlparse():
+    for url in random_urls(20000, ALPHABET, size=10):
+        expected = parse(url)
+        if isinstance(expected, tuple):
+            assert parser.split_url(url) == expected, url
+
+
+@pytest.mark.parametrize('klass', [URL, FrozenURL])
+def test_url_components_match_urlparse(klass):
+    for url in random_urls(5000, ALPHABET, seed=1, size=10):
+        expected = parse(url)
+        if not isinstance(expected, tuple):
+            continue
+
+        instance = klass(url)
+        components = (
+            instance.scheme,
+            instance.netloc,
+            instance.path,
+            instance.params,
+            instance.query,
+            instance.fragment
+        )
+        assert components == expected, url
+
+
+@pytest.mark.parametrize('url, expected', [
+    ('http://example.com/a', 'http://example.com/a'),
+    (' \x00http://example.com/a\n/b\t ', 'http://example.com/a/b '),
+    ('http://exa\rmple.com/', 'http://example.com/'),
+    ('', '')
+])
+def test_strip_url(url, expected):
+    assert parser.strip_url(url) == expected
+
+
+def test_stripped_urls():
+    url = URL('http://a.com/x\n/y')
+    assert url.raw_url == 'http://a.com/x\n/y'
+    assert url.path == '/x/y'
+    assert url.is_same_domain('http://a.com/z')
+
+    assert parser.get_netloc(' http://a.com/') == 'a.com'
+    assert group_by_host([' http://a.com/', 'http://a.com/\n']) == {'a.com': [0, 1]}
+
+    array = URLArray(['\thttp://a.com/x\n/y'])
+    assert array.path(0) == '/x/y'
+
+
+def test_get_path_matches_urlparse():
+    for url in random_urls(20000, ALPHABET, seed=2, size=10):
+        expected = parse(url)
+        if isinstance(expected, tuple):
+            assert parser.get_path(url) == expected[2], url
+            assert parser.get_netloc(url) == expected[1], url
+
+
+@pytest.mark.parametrize('url', [
+    'http://a.com/x',
+    ' http://a.com/x',
+    'http://a.com/\nx',
+    '\thttp://a.com/x\r'
+])
+def test_compare_stripped_urls(url):
+    assert URL('http://a.com/x').compare(url)
+    assert FrozenURL('http://a.com/x').compare(url)
+    assert not URL('http://a.com/y').compare(url)
+
+
+def test_frozen_url_keeps_trailing_spaces():
+    instance = FrozenURL(' \x00http://a.com/x\n/y ')
+    assert instance.raw_url == 'http://a.com/x/y '
+    assert instance.path == urlparse(' \x00http://a.com/x\n/y ').path == '/x/y '
@@ -0,0 +1,184 @@
+import re
+
+import pytest
+
+from py_url_tools.patterns import PatternRegistry, PatternSet, required_literal
+from py_url_tools import hosts, parser
+from py_url_tools.rules import Rule, RuleEngine, RuleIndex
+
+ESCAPED_PATTERNS = [
+    r'/\x61dmin',
+    r'/\101x',
+    r'/api/',
+    r'/\U00000062log',
+    r'/\N{LATIN SMALL LETTER C}art',
+    r'/\0',
+    r'/products/\d+',
+    r'/x\.y/',
+    r'(?x) /l o g i n',
+    r'/(\d)\1/',
+    r'^https://example\.com/',
+    r'ab*c',
+    r'search|find'
+]
+
+
+URLS = [
+    'http://e.com/admin',
+    'http://e.com/Ax',
+    'http://e.com/api/v1',
+    'http://e.com/blog',
+    'http://e.com/cart',
+    'http://e.com/\x00',
+    'http://e.com/products/12',
+    'http://e.com/x.y/',
+    'http://e.com/xzy/',
+    'http://e.com/login',
+    'http://e.com/11/',
+    'https://example.com/page',
+    'http://e.com/ac',
+    'http://e.com/abbbc',
+    'http://e.com/find',
+    'http://e.com/nothing'
+]
+
+
+@pytest.mark.parametrize('pattern, expected', [
+    (r'/\x61dmin', '/admin'),
+    (r'/\101x', '/Ax'),
+    (r'/\N{LATIN SMALL LETTER A}dmin', '/admin'),
+    (r'/products/\d+', '/products/'),
+    (r'(?x) /a b c /', '/abc/'),
+    (r'a|b', None),
+    (r'(?i)admin', None)
+])
+def test_required_literal(pattern, expected):
+    assert required_literal(pattern) == expected
+
+
+@pytest.mark.parametrize('url', URLS)
+def test_pattern_set_matches_re_search(url):
+    instance = PatternSet(ESCAPED_PATTERNS)
+    expected = [
+        pattern for pattern in ESCAPED_PATTERNS
+        if re.search(pattern, url) is not None
+    ]
+    assert instance.matching(url) == expected
+    assert instance.test(url) == bool(expected)
+
+
+def test_escaped_deny_rule():
+    engine = RuleEngine.from_lists(deny=[r'/\x61dmin'])
+    assert not engine.is_allowed('http://e.com/admin')
+    assert engine.is_allowed('http://e.com/home')
+
+
+RULES = [
+    Rule(r'^https://example\.com/', allow=True),
+    Rule(r'^https://example\.com/private/.*', allow=False),
+    Rule(r'^https://example\.com/private/public/', allow=True),
+    Rule(r'^http://', allow=False),
+    Rule(r'/login', allow=False),
+    Rule(r'/products/\d+', allow=True),
+    Rule(r'\.pdf$', allow=False),
+    Rule(r'/ADMIN', allow=False, flags=re.IGNORECASE),
+    Rule(r'^HTTPS://SHOP\.', allow=True, flags=re.IGNORECASE),
+    Rule(r'/blog/', allow=True, host='Blog.example.org'),
+    Rule(r'^https://blog\.example\.org/drafts/', allow=False, host='blog.example.org'),
+    Rule(r'/tmp', allow=False, host='cdn.example.net'),
+    Rule(r'/cart', allow=True, host='shop.example.com', flags=re.IGNORECASE)
+]
+
+
+RULE_URLS = [
+    f'{scheme}://{host}{path}'
+    for scheme in ('https', 'http', 'HTTPS')
+    for host in (
+        'example.com', 'blog.example.org', 'Blog.Example.org:8080',
+        'cdn.example.net', 'shop.example.com', 'other.io'
+    )
+    for path in (
+        '/', '/private/x', '/private/public/x', '/login', '/products/12',
+        '/products/x', '/file.pdf', '/admin', '/Admin/x', '/blog/1',
+        '/drafts/1', '/tmp/a', '/CART', '/cart?x=/login'
+    )
+]
+
+
+def reference_evaluate(rules, url):
+    host = hosts.netloc_to_host(parser.get_netloc(url))
+    return [
+        rule for rule in rules
+        if rule.host in (None, host) and re.search(rule.pattern, url, rule.flags)
+    ]
+
+
+def reference_is_allowed(rules, url):
+    matched = reference_evaluate(rules, url)
+    if any(not rule.allow for rule in matched):
+        return False
+    if matched:
+        return True
+
+    host = hosts.netloc_to_host(parser.get_netloc(url))
+    return not any(rule.allow and rule.host in (None, host) for rule in rules)
+
+
+@pytest.mark.parametrize('rules', [
+    RULES,
+    [rule for rule in RULES if rule.host is None],
+    [rule for rule in RULES if rule.host is not None],
+    [rule for rule in RULES if not rule.allow]
+])
+def test_rule_engine_matches_re_search(rules):
+    engine = RuleEngine(rules)
+    for url in RULE_URLS:
+        expected = reference_evaluate(rules, url)
+        result = engine.evaluate(url)
+        assert sorted(map(id, result)) == sorted(map(id, expected)), url
+        assert engine.is_allowed(url) == reference_is_allowed(rules, url), url
+
+
+@pytest.mark.parametrize('pattern, flags, expected', [
+    (r'^https://example\.com/', 0, 'https://example.com/'),
+    (r'^https://example\.com/.*', 0, 'https://example.com/'),
+    (r'^/a\-b', 0, '/a-b'),
+    (r'^https://example\.com/', re.IGNORECASE, None),
+    (r'^https://example\.com/\d', 0, None),
+    (r'/login', 0, None),
+    (r'^a|b', 0, None)
+])
+def test_literal_prefix(pattern, flags, expected):
+    assert Rule(pattern, flags=flags).literal_prefix == expected
+
+
+def test_rule_index():
+    rules = [
+        Rule(r'^https://a\.com/'),
+        Rule(r'^https://a\.com/b/'),
+        Rule(r'^https://a\.co'),
+        Rule(r'/b/'),
+        Rule(r'/B/', flags=re.IGNORECASE)
+    ]
+    index = RuleIndex(rules)
+    assert len(index.pattern_sets) == 2
+    assert 'h' in index.trie
+
+    assert index.match('https://a.com/b/c') == [rules[2], rules[0], rules[1], rules[3], rules[4]]
+    assert index.match('https://a.co/') == [rules[2]]
+    assert index.match('http://a.com/b/') == [rules[3], rules[4]]
+
+
+def test_pattern_registry():
+    registry = PatternRegistry(maxsize=2)
+    pattern = registry.compile(r'/a')
+    assert registry.compile(r'/a') is pattern
+    assert registry.compile(pattern) is pattern
+    assert registry.compile(r'/a', re.IGNORECASE) is not pattern
+
+    registry.compile(r'/b')
+    assert len(registry) == 2
+    registry.resize(1)
+    assert len(registry) == 1
+    with pytest.raises(ValueError):
+        registry.resize(0)
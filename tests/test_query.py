@@ -0,0 +1,57 @@
+import pytest
+
+from py_url_tools.query import ParameterFilter, QueryBuilder
+from py_url_tools.tracking import TrackingStripper
+
+
+@pytest.mark.parametrize('url, expected', [
+    ('http://example.com/?utm_source=x&id=1&gclid=2', 'http://example.com/?id=1'),
+    ('http://example.com/?utm_source=x', 'http://example.com/'),
+    ('http://example.com/?id=1#top', 'http://example.com/?id=1#top'),
+    ('http://example.com/?utm_source=x#a?utm_medium=y', 'http://example.com/#a?utm_medium=y'),
+    ('http://example.com/page#/route?utm_source=x&id=1', 'http://example.com/page#/route?utm_source=x&id=1'),
+    ('http://example.com/page', 'http://example.com/page')
+])
+def test_parameter_filter(url, expected):
+    tracking = ParameterFilter.from_globs(['utm_*', 'gclid'])
+    assert tracking(url) == expected
+
+
+def test_tracking_stripper_keeps_fragment():
+    stripper = TrackingStripper()
+    url = 'http://example.com/page#/route?utm_source=x&id=1'
+    assert stripper(url) == url
+    assert stripper('https://www.amazon.com/dp/1?pd_rd_w=a&utm_source=x&k=v#x?fbclid=1') == (
+        'https://www.amazon.com/dp/1?k=v#x?fbclid=1'
+    )
+
+
+def test_query_builder():
+    builder = QueryBuilder.from_url('http://example.com/?a=1&b=2&a=3')
+    builder.replace('a', '4').remove('b').add('c', '5')
+    assert builder.to_url() == 'http://example.com/?a=4&c=5'
+    assert builder.get_all('a') == ['4']
+
+
+def test_query_builder_operations():
+    builder = QueryBuilder('a=1&b=2&a=3&c=')
+    assert len(builder) == 4
+    assert 'c' in builder
+    assert builder.get('a') == '1'
+    assert builder.get('missing', 'default') == 'default'
+
+    builder.move_to_end('a')
+    assert builder.to_string() == 'b=2&c=&a=1&a=3'
+    builder.move_to_end('c', last=False)
+    assert builder.to_string() == 'c=&b=2&a=1&a=3'
+    builder.unique().sort()
+    assert list(builder) == [('a', '1'), ('b', '2'), ('c', '')]
+    assert builder.names() == ['a', 'b', 'c']
+
+    with pytest.raises(ValueError):
+        builder.to_url()
+    assert builder.to_url('http://example.com/?x=1#f') == 'http://example.com/?a=1&b=2&c=#f'
+
+
+def test_query_builder_drops_blank_values():
+    assert QueryBuilder('a=&b=1', keep_blank_values=False).to_string() == 'b=1'
@@ -0,0 +1,28 @@
+import random
+from urllib.parse import quote
+
+import pytest
+
+from py_url_tools import quoting
+
+
+@pytest.mark.parametrize('quoter', quoting.QUOTERS, ids=lambda quoter: quoter.name)
+def test_quoter_matches_quote(quoter):
+    every_byte = bytes(range(256))
+    assert quoter(every_byte) == quote(every_byte, quoter.safe)
+
+    generator = random.Random(0)
+    for _ in range(2000):
+        value = bytes(generator.choice(b'az09/?#&=%+ ~\x00\x7f\x80\xc3\xa9') for _ in range(generator.randint(0, 12)))
+        assert quoter(value) == quote(value, quoter.safe), value
+        assert quoter.is_safe(value) == (quote(value, quoter.safe) == value.decode('latin-1'))
+
+
+def test_quoter_str_and_stats():
+    quoter = quoting.Quoter(b'/', name='test')
+    assert quoter('/a b') == '/a%20b'
+    assert quoter('/café', encoding='latin-1') == '/caf%E9'
+    assert quoter('/ab') == '/ab'
+    assert quoter.stats == {'hits': 1, 'misses': 2}
+    quoter.clear()
+    assert quoter.hit_rate == 0.0
@@ -0,0 +1,35 @@
+from py_url_tools import readers, urls
+
+
+def test_mapped_url_file(tmp_path):
+    path = tmp_path / 'urls.txt'
+    path.write_bytes(b'http://a.com/a b\r\n\nhttp://b.com/\xff\nhttp://c.com/')
+
+    with readers.MappedURLFile(path) as items:
+        lines = [bytes(line) for line in items]
+    assert lines == [b'http://a.com/a b', b'http://b.com/\xff', b'http://c.com/']
+
+    with readers.MappedURLFile(path, skip_empty=False) as items:
+        assert len(list(items)) == 4
+
+    with readers.MappedURLFile(path) as items:
+        assert list(items.decoded()) == ['http://a.com/a b', 'http://b.com/%FF', 'http://c.com/']
+
+    result = [urls.safe_url_string(line) for line in readers.read_urls(path, as_bytes=True)]
+    assert result == ['http://a.com/a%20b', 'http://b.com/%FF', 'http://c.com/']
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / 'empty.txt'
+    path.write_bytes(b'')
+    assert list(readers.read_urls(path)) == []
+
+
+def test_close_with_exported_slices(tmp_path):
+    path = tmp_path / 'urls.txt'
+    path.write_bytes(b'http://a.com/\n')
+
+    mapped = readers.MappedURLFile(path)
+    line = next(iter(mapped))
+    mapped.close()
+    assert bytes(line) == b'http://a.com/'
@@ -0,0 +1,39 @@
+import pytest
+
+from py_url_tools import sessions
+from py_url_tools.urls import URL
+
+
+def test_use_session_context():
+    default = sessions.get_session_manager()
+    assert sessions.get_session_manager() is default
+
+    with sessions.use_session(pool_maxsize=5) as manager:
+        assert sessions.get_session_manager() is manager
+        assert manager.pool_maxsize == 5
+
+        with sessions.use_session(default) as inner:
+            assert sessions.get_session_manager() is inner
+        assert sessions.get_session_manager() is manager
+
+    assert sessions.get_session_manager() is default
+    assert manager.reuse_rate == 0.0
+
+
+def test_get_status_reuses_connections(server):
+    pytest.importorskip('requests')
+
+    url = f'http://127.0.0.1:{server.server_address[1]}'
+    with sessions.use_session(max_retries=0) as manager:
+        assert URL(f'{url}/ok').get_status() == (True, 200)
+        assert URL(f'{url}/missing').get_status() == (False, 404)
+        for _ in range(3):
+            URL(f'{url}/ok').get_status()
+
+        stats = manager.stats
+        assert stats['requests'] == 5
+        assert stats['connections'] == 1
+        assert manager.reuse_rate == pytest.approx(0.8)
+
+    user_agents = {user_agent for _, _, user_agent in server.requests}
+    assert None not in user_agents
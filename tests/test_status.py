@@ -0,0 +1,62 @@
+import asyncio
+
+from py_url_tools.status import StatusChecker, check_statuses
+
+
+def base_url(server):
+    return f'http://127.0.0.1:{server.server_address[1]}'
+
+
+def test_statuses(server):
+    url = base_url(server)
+    results = check_statuses(
+        [f'{url}/ok', f'{url}/missing', f'{url}/no-head', f'{url}/redirect', f'{url}/loop'],
+        max_redirects=2,
+        user_agent='checker'
+    )
+    assert results == {
+        f'{url}/ok': (True, 200),
+        f'{url}/missing': (False, 404),
+        f'{url}/no-head': (True, 200),
+        f'{url}/redirect': (True, 200),
+        f'{url}/loop': (False, 302)
+    }
+
+    methods = [(method, path) for method, path, _ in server.requests]
+    assert ('GET', '/no-head') in methods
+    assert ('GET', '/ok') not in methods
+    assert all(user_agent == 'checker' for _, _, user_agent in server.requests)
+
+
+def test_timeout_and_unreachable(server):
+    url = base_url(server)
+    results = check_statuses(
+        [f'{url}/slow', 'http://127.0.0.1:1/', 'ftp://example.com/'],
+        timeout=0.2
+    )
+    assert set(results.values()) == {(False, None)}
+
+
+def test_per_host_limit_and_reuse(server):
+    url = base_url(server)
+
+    async def run():
+        async with StatusChecker(concurrency=20, per_host=3) as checker:
+            results = await checker.check_many(f'{url}/busy/{i}' for i in range(30))
+            return results, checker.pool
+
+    results, pool = asyncio.run(run())
+    assert set(results.values()) == {(True, 200)}
+    assert server.max_active <= 3
+    assert pool.opened <= 3
+    assert pool.reused >= 27
+
+
+def test_redirects_run_out(server):
+    url = base_url(server)
+    results = check_statuses([f'{url}/redirect', f'{url}/loop'], max_redirects=0)
+    assert results == {
+        f'{url}/redirect': (False, 301),
+        f'{url}/loop': (False, 302)
+    }
+    assert len(server.requests) == 2
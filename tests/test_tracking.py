@@ -0,0 +1,44 @@
+import pytest
+
+from py_url_tools import tracking
+from tests.helpers import generate_urls, reference_strip
+
+
+def test_stripper_matches_fnmatch():
+    stripper = tracking.TrackingStripper(names=['vendor_*', 'x?d'], host_rules={})
+    urls = generate_urls(2000) + [
+        'http://e.com/?vendor_a=1&xid=2&xxid=3&id=4',
+        'http://e.com/?utm_source=x#frag?utm_medium=y',
+        'http://e.com/page'
+    ]
+    for url in urls:
+        assert stripper(url) == reference_strip(url, stripper.rules), url
+
+
+@pytest.mark.parametrize('url, expected', [
+    ('https://www.amazon.com/dp/1?pd_rd_w=a&utm_source=x&k=v', 'https://www.amazon.com/dp/1?k=v'),
+    ('https://smile.amazon.de/dp/1?psc=1&id=2', 'https://smile.amazon.de/dp/1?id=2'),
+    ('https://example.com/dp/1?psc=1&fbclid=2', 'https://example.com/dp/1?psc=1'),
+    ('https://youtube.com/watch?v=1&feature=share&si=x', 'https://youtube.com/watch?v=1')
+])
+def test_host_rules(url, expected):
+    assert tracking.strip_tracking_parameters(url) == expected
+
+
+def test_unknown_rule_set():
+    with pytest.raises(ValueError):
+        tracking.TrackingStripper(rule_sets=['unknown'])
+
+
+@pytest.mark.parametrize('url, expected', [
+    ('https://example.com/item?si=2&spm=a&scm=b&s_cid=c&ncid=d&share_id=e&cmpid=f',
+     'https://example.com/item?si=2&spm=a&scm=b&s_cid=c&ncid=d&share_id=e&cmpid=f'),
+    ('https://example.com/?pk_id=1&ga_id=2&rb_id=3&ref_src=4', 'https://example.com/?pk_id=1&ga_id=2&rb_id=3&ref_src=4'),
+    ('https://example.com/?pk_campaign=1&ga_source=2&id=3', 'https://example.com/?id=3'),
+    ('https://open.spotify.com/track/1?si=2', 'https://open.spotify.com/track/1'),
+    ('https://item.taobao.com/item.htm?id=1&spm=a', 'https://item.taobao.com/item.htm?id=1'),
+    ('https://www.reddit.com/r/a?share_id=1', 'https://www.reddit.com/r/a'),
+    ('https://news.yahoo.com/a?ncid=1', 'https://news.yahoo.com/a')
+])
+def test_generic_names_are_host_rules(url, expected):
+    assert tracking.strip_tracking_parameters(url) == expected
@@ -0,0 +1,100 @@
+import random
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import pytest
+
+from py_url_tools import urls
+from tests.helpers import outcome, random_urls
+
+ALPHABET = list('abcXYZ019-._~!$&\'()*+,;=:@/?#[]% "<>\\^`{|}\t\n') + [
+    '%20', '%2F', '%zz', '%C3%A9', '://', 'http://', 'https://', 'ftp://',
+    'user:pass@', '[::1]', ':8080', 'EXAMPLE.com', 'xn--bcher-kva', '..'
+]
+
+
+def full_safe_url_string(monkeypatch, *args, **kwargs):
+    with monkeypatch.context() as patch:
+        # Without its result the full algorithm runs
+        patch.setattr(urls, 'safe_ascii_url', lambda *args, **kwargs: None)
+        return urls.safe_url_string(*args, **kwargs)
+
+
+@pytest.mark.parametrize('quote_path', [True, False])
+def test_ascii_fast_path_matches_full_algorithm(monkeypatch, quote_path):
+    for url in random_urls(3000, ALPHABET, schemes=('http://', 'https://', 'HTTP://')):
+        expected = outcome(full_safe_url_string, monkeypatch, url, quote_path=quote_path)
+        assert outcome(urls.safe_url_string, url, quote_path=quote_path) == expected, url
+        assert outcome(urls.safe_url_string, url.encode(), quote_path=quote_path) == expected, url
+
+
+@pytest.mark.parametrize('url', [b'http://a.com/a b', bytearray(b'http://a.com/a b'), memoryview(b'http://a.com/a b')])
+def test_safe_url_string_buffers(url):
+    assert urls.safe_url_string(url) == 'http://a.com/a%20b'
+
+
+@pytest.mark.parametrize('url', [3, 3.5, None, [104, 116]])
+def test_safe_url_string_rejects_other_types(url):
+    with pytest.raises(TypeError):
+        urls.safe_url_string(url)
+
+
+def test_url_and_frozen_url_hash():
+    url = urls.URL('http://example.com/a?b=1')
+    frozen = urls.FrozenURL('http://example.com/a?b=1')
+    assert url == frozen
+    assert frozen == url
+    assert hash(url) == hash(frozen)
+    assert len({url, frozen, 'http://example.com/a?b=1'}) == 1
+
+
+def reference_add_or_replace_parameter(url, params):
+    url_object = urlsplit(url)
+    seen_keys = set()
+    new_params = []
+    for name, value in parse_qsl(url_object.query, keep_blank_values=True):
+        if name not in seen_keys:
+            seen_keys.add(name)
+            new_params.append((name, params.get(name, value)))
+    new_params.extend((name, value) for name, value in params.items() if name not in seen_keys)
+    return urlunsplit(url_object._replace(query=urlencode(new_params)))
+
+
+def test_add_or_replace_parameter_matches_parse_qsl():
+    generator = random.Random(2)
+    alphabet = list('ab=&;%+ é#~-._*!/:@') + ['%20', 'c=1', 'a=', '%zz', '%C3%A9', '%2B']
+    for _ in range(20000):
+        url = 'http://example.com/p?' + ''.join(
+            generator.choice(alphabet)
+            for _ in range(generator.randint(0, 15))
+        )
+        params = {
+            generator.choice('abcd'): generator.choice(['1', '', 'x y', 3])
+            for _ in range(generator.randint(0, 3))
+        }
+        expected = reference_add_or_replace_parameter(url, params)
+        assert urls.add_or_replace_parameter(url, params) == expected, (url, params)
+
+
+@pytest.mark.parametrize('url, names, expected', [
+    ('http://e.com/?a=1&b=2&a=3', ['a'], 'http://e.com/?a=1'),
+    ('http://e.com/?a=1&b=2#f', ['a', 'b'], 'http://e.com/?a=1&b=2'),
+    ('http://e.com/?a=x=y&b', ['a', 'b'], 'http://e.com/?a=x=y&b'),
+    ('http://e.com/?a=1&b=2', [], 'http://e.com/?a=1&b=2')
+])
+def test_clean_url_query_parameters(url, names, expected):
+    assert urls.clean_url_query_parameters(url, names=names) == expected
+
+
+@pytest.mark.parametrize('url, options', [
+    ('http://example.com/a b', {}),
+    (b'HTTP://Example.com/a b?q=1#f', {}),
+    (memoryview(b'http://example.com/%zz'), {}),
+    ('http://bücher.example/café?é', {}),
+    ('http://example.com/café?é', {'encoding': 'latin-1'}),
+    ('http://example.com/a b', {'quote_path': False}),
+    ('http://[::1]:80/a', {})
+])
+def test_safe_url_bytes(url, options):
+    result = urls.safe_url_bytes(url, **options)
+    assert isinstance(result, bytes)
+    assert result == urls.safe_url_string(url, **options).encode('utf-8')
@@ -0,0 +1,47 @@
+import pytest
+
+from py_url_tools import utilities
+from tests.helpers import random_urls, reference_parse_qsl_to_bytes
+
+
+ALPHABET = list('ab=&;+%2x') + ['%20', '%C3%A9', 'é', '%zz', '==']
+
+
+@pytest.mark.parametrize('keep_blank_values', [False, True])
+def test_parse_qsl_to_bytes_matches_previous(keep_blank_values):
+    for query in random_urls(20000, ALPHABET, size=20):
+        expected = reference_parse_qsl_to_bytes(query, keep_blank_values)
+        assert utilities.parse_qsl_to_bytes(query, keep_blank_values) == expected, query
+        assert utilities.parse_qsl_to_bytes(query.encode(), keep_blank_values) == expected, query
+        assert list(utilities.iter_qsl_bytes(query, keep_blank_values)) == expected, query
+
+
+def test_iter_qsl_bytes_is_lazy():
+    pairs = utilities.iter_qsl_bytes(b'a=1&b=%C3%A9+x;c&d=')
+    assert next(pairs) == (b'a', b'1')
+    assert list(pairs) == [(b'b', b'\xc3\xa9 x')]
+    assert list(utilities.iter_qsl_bytes('c&d=', keep_blank_values=True)) == [(b'c', b''), (b'd', b'')]
+
+
+def test_iter_qsl_bytes_scans_lazily():
+    class Query(bytes):
+        # Counts how far the query is searched
+        def find(self, *args):
+            result = super().find(*args)
+            searched.append(result)
+            return result
+
+    searched = []
+    pairs = utilities.iter_qsl_bytes(Query(b'a=1&b=2;c=3&' * 1000))
+    assert next(pairs) == (b'a', b'1')
+    assert max(searched) < 12
+
+
+@pytest.mark.parametrize('value, expected', [
+    (b'abc', b'abc'),
+    (b'a+b', b'a b'),
+    (b'a%20b+c', b'a b c'),
+    (b'%zz', b'%zz')
+])
+def test_unquote_query_bytes(value, expected):
+    assert utilities.unquote_query_bytes(value) == expected
@@ -0,0 +1,91 @@
+import unicodedata
+
+import pytest
+
+from py_url_tools import hosts, urls, uts46
+from py_url_tools.hosts import HostEncoder
+
+
+@pytest.mark.parametrize('host, expected', [
+    ('Faß.de', b'xn--fa-hia.de'),
+    ('FAẞ.de', b'xn--fa-hia.de'),
+    ('bücher。example', b'xn--bcher-kva.example'),
+    ('xn--bcher-kva.example', b'xn--bcher-kva.example'),
+    ('ＥＸＡＭＰＬＥ.com', b'example.com')
+])
+def test_to_ascii(host, expected):
+    assert uts46.to_ascii(host) == expected
+
+
+def test_transitional():
+    assert uts46.to_ascii('FAẞ.de', transitional=True) == b'fass.de'
+    assert uts46.to_ascii('Faß.de', transitional=True) == b'fass.de'
+
+
+@pytest.mark.parametrize('host', ['a․b.com', '⒈.com', 'a�b.com', 'a\u2028b.com'])
+def test_disallowed(host):
+    with pytest.raises(UnicodeError):
+        uts46.to_ascii(host)
+
+
+def test_mapping_matches_idna():
+    idna = pytest.importorskip('idna')
+
+    for code_point in range(0x80, 0x30000):
+        character = chr(code_point)
+        if character in uts46.DEVIATIONS:
+            continue
+
+        try:
+            expected = idna.uts46_remap(character, std3_rules=False, transitional=False)
+        except idna.IDNAError:
+            expected = None
+
+        try:
+            result = uts46.map_host(character)
+        except UnicodeError:
+            result = None
+
+        if result is None and expected is not None:
+            # Assigned after the Unicode version of the interpreter
+            assert unicodedata.category(character) == 'Cn'
+            continue
+        assert result == expected, hex(code_point)
+
+
+@pytest.mark.parametrize('host', [
+    'example.com', 'EXAMPLE.com', 'Example.COM.', 'xn--bcher-kva.example',
+    'XN--BCHER-KVA.example', 'xn--zz!.com', 'a..b', '.example.com', '',
+    'a' * 64 + '.com', 'ex_ample.com', 'bücher.example', 'Faß.de'
+])
+def test_host_encoder_matches_to_ascii(host):
+    try:
+        expected = uts46.to_ascii(host)
+    except UnicodeError:
+        expected = None
+
+    encoder = HostEncoder(mode='uts46')
+    for _ in range(2):
+        assert encoder(host) == expected
+
+
+@pytest.fixture
+def uts46_mode():
+    hosts.IDNA_ENCODER.set_mode('uts46')
+    yield hosts.IDNA_ENCODER
+    hosts.IDNA_ENCODER.set_mode('idna2003')
+
+
+def test_url_functions_in_uts46_mode(uts46_mode):
+    assert urls.safe_url_string('http://Faß.de/a b') == 'http://xn--fa-hia.de/a%20b'
+    assert urls.safe_url_string('http://EXAMPLE.com/') == 'http://example.com/'
+    assert urls.clean_url('http://FAẞ.de/?b=1&a=2') == 'http://xn--fa-hia.de/?a=2&b=1'
+    assert urls.clean_url('http://Example.COM:80/') == 'http://example.com:80/'
+    assert list(urls.clean_urls(['http://Faß.de/', 'http://Faß.de/x'])) == [
+        'http://xn--fa-hia.de/',
+        'http://xn--fa-hia.de/x'
+    ]
+    assert uts46_mode.stats['ascii_hits'] > 0
+
+    uts46_mode.set_mode('idna2003')
+    assert urls.clean_url('http://Faß.de/') == 'http://fass.de/'